@@ -8,6 +8,8 @@ import os
 import logging
 from typing import Dict, Any, Optional
 
+from dsign.services import json_codec
+
 # Инициализация экземпляров расширений
 db = SQLAlchemy()
 bcrypt = Bcrypt()
@@ -26,7 +28,8 @@ def _is_file_sqlite_uri(uri: Optional[str]) -> bool:
 def configure_sqlite_engine_options(app) -> None:
     """
     Use NullPool for on-disk SQLite so background threads cannot exhaust QueuePool
-    while holding a checked-out connection during long playback IPC.
+    while holding a checked-out connection during long playback IPC; JSON columns
+    go through services/json_codec.
     Leave :memory: alone (pytest relies on StaticPool / shared connection).
     """
     uri = app.config.get("SQLALCHEMY_DATABASE_URI")
@@ -42,6 +45,9 @@ def configure_sqlite_engine_options(app) -> None:
     # Wait for SQLite locks instead of failing immediately under concurrent writers.
     connect_args.setdefault("timeout", 30)
     opts["connect_args"] = connect_args
+    # db.JSON columns (profile settings, …): orjson when installed, stdlib json otherwise.
+    opts.setdefault("json_serializer", json_codec.dumps)
+    opts.setdefault("json_deserializer", json_codec.loads)
     app.config["SQLALCHEMY_ENGINE_OPTIONS"] = opts
 
 
@@ -105,7 +111,9 @@ def init_extensions(app) -> Dict[str, Any]:
             ping_timeout=app.config.get('SOCKETIO_PING_TIMEOUT', 60),
             # Only enable Socket.IO internal logs when explicitly debugging.
             logger=logger if engineio_debug else False,
-            engineio_logger=logger if engineio_debug else False
+            engineio_logger=logger if engineio_debug else False,
+            # orjson when installed, stdlib json otherwise (see services/json_codec.py).
+            json=json_codec,
         )
         
         # 2. Настройка аутентификации
@@ -6,6 +6,7 @@ import socket
 import traceback
 import time
 from pathlib import Path 
+from sqlalchemy import select
 from flask import jsonify, request, send_from_directory, abort, current_app, send_file
 from flask_login import login_required, current_user, login_user, logout_user
 from flask_wtf.csrf import validate_csrf
@@ -1429,16 +1430,8 @@ def init_api_routes(api_bp, services):
                 _svc_status_cache["payload"] = None
                 _svc_status_cache["ts"] = 0.0
             if service_key == "mpv" and playback_service is not None:
-                def _recover_mpv_playback() -> None:
-                    try:
-                        playback_service.recover_after_mpv_systemd_restart()
-                    except Exception as exc:
-                        current_app.logger.warning(
-                            "MPV service restart: playback recover failed",
-                            exc_info=exc,
-                        )
-
-                Thread(target=_recover_mpv_playback, name="mpv-api-restart-recover", daemon=True).start()
+                # IPC re-bind + playlist resume runs on the playback recovery pool, not here.
+                playback_service.recover_after_mpv_systemd_restart_async()
             return jsonify({"success": True, "service": service_key, "unit": unit})
         except Exception as e:
             current_app.logger.error(f"Error restarting service {service_key}: {str(e)}", exc_info=True)
@@ -1938,15 +1931,23 @@ def init_api_routes(api_bp, services):
     @login_required
     def get_profiles():
         try:
-            profiles = db.session.query(PlaybackProfile).all()
+            # Column rows: the listing needs no ORM instances / identity-map entries.
+            rows = db.session.execute(
+                select(
+                    PlaybackProfile.id,
+                    PlaybackProfile.name,
+                    PlaybackProfile.profile_type,
+                    PlaybackProfile.settings,
+                )
+            )
             return jsonify({
                 'success': True,
                 'profiles': [{
-                    'id': p.id,
-                    'name': p.name,
-                    'type': p.profile_type,
-                    'settings': p.settings
-                } for p in profiles]
+                    'id': r.id,
+                    'name': r.name,
+                    'type': r.profile_type,
+                    'settings': r.settings
+                } for r in rows]
             })
         except Exception as e:
             current_app.logger.error(f"Error getting profiles: {str(e)}")
@@ -2058,9 +2059,9 @@ def init_api_routes(api_bp, services):
 
             db.session.commit()
 
-            # Notify clients of the change
+            # Notify clients of the change (off the request thread: emit walks every client)
             if socketio:
-                socketio.emit('profile_assignment_changed', {
+                socketio.start_background_task(socketio.emit, 'profile_assignment_changed', {
                     'playlist_id': data['playlist_id'],
                     'profile_id': data.get('profile_id')
                 })
@@ -2393,15 +2394,19 @@ def init_api_routes(api_bp, services):
                 if a.playlist_id and a.profile_id
             }
             profiles = {
-                p.id: p
-                for p in db.session.query(PlaybackProfile).filter_by(profile_type="playlist").all()
+                r.id: r.settings
+                for r in db.session.execute(
+                    select(PlaybackProfile.id, PlaybackProfile.settings).where(
+                        PlaybackProfile.profile_type == "playlist"
+                    )
+                )
             }
 
             rows = []
             for pl in playlists:
                 pid = assignments.get(pl.id)
-                prof = profiles.get(pid) if pid else None
-                settings = (prof.settings or {}) if prof else {}
+                prof = pid in profiles if pid else False
+                settings = (profiles[pid] or {}) if prof else {}
                 rows.append(
                     {
                         "playlist_id": pl.id,
@@ -2758,7 +2763,7 @@ def init_api_routes(api_bp, services):
 
             result = playlist_service.create_playlist(data)
             if socketio:
-                socketio.emit('playlist_created', {
+                socketio.start_background_task(socketio.emit, 'playlist_created', {
                     'playlist_id': result['playlist_id'],
                     'name': data['name']
                 })
@@ -2834,7 +2839,9 @@ def init_api_routes(api_bp, services):
             result = playlist_service.delete_playlist(playlist_id)
 
             if socketio:
-                socketio.emit('playlist_deleted', {'playlist_id': playlist_id})
+                socketio.start_background_task(
+                    socketio.emit, 'playlist_deleted', {'playlist_id': playlist_id}
+                )
                 
             return jsonify(result)
         except Exception as e:
@@ -3440,8 +3447,8 @@ def init_api_routes(api_bp, services):
                     raise RuntimeError("Failed to update player")
 
                 # Успешное завершение
-                if backup_path and os.path.exists(backup_path):
-                    os.unlink(backup_path)
+                if backup_path:
+                    Path(backup_path).unlink(missing_ok=True)
 
                 return jsonify({
                     "success": True,
@@ -3452,9 +3459,8 @@ def init_api_routes(api_bp, services):
             except Exception as e:
                 # Восстановление из backup
                 if backup_path and os.path.exists(backup_path):
-                    if os.path.exists(file_path):
-                        os.unlink(file_path)
-                    os.rename(backup_path, file_path)
+                    # os.replace() overwrites a partially saved file atomically; no unlink first.
+                    os.replace(backup_path, file_path)
                     playback_service.restart_idle_logo(upload_folder, filename)
 
                 current_app.logger.error(f"Logo upload failed: {str(e)}")
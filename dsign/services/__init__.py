@@ -8,8 +8,10 @@ import io
 import os
 import sys
 import platform
+import shutil
 import traceback
 import subprocess
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 from .logger import setup_logger
@@ -20,6 +22,16 @@ from .subprocess_limits import DEP_CHECK_TIMEOUT_SEC
 # This file is imported as `dsign.services.*` and any heavyweight/circular imports here
 # can break application startup (seen in production systemd logs).
 
+
+@lru_cache(maxsize=4)
+def _mpv_version_line(mpv_path: str, mtime_ns: int) -> str:
+    """Первая строка ``mpv --version``; кэш по пути+mtime бинарника (после обновления — новый запуск)."""
+    result = subprocess.run(
+        [mpv_path, '--version'], capture_output=True, text=True, timeout=DEP_CHECK_TIMEOUT_SEC
+    )
+    return result.stdout.split('\n')[0] if result.stdout else 'unknown'
+
+
 class ServiceFactory:
     """Фабрика для инициализации сервисов с централизованным логированием"""
     
@@ -121,17 +133,12 @@ class ServiceFactory:
             
             # Проверка доступности MPV
             try:
-                mpv_check = subprocess.run(
-                    ['which', 'mpv'], capture_output=True, text=True, timeout=DEP_CHECK_TIMEOUT_SEC
-                )
-                if mpv_check.returncode != 0:
+                mpv_path = shutil.which('mpv')
+                if not mpv_path:
                     raise RuntimeError("MPV player not found in PATH")
-                
-                mpv_version = subprocess.run(
-                    ['mpv', '--version'], capture_output=True, text=True, timeout=DEP_CHECK_TIMEOUT_SEC
-                )
+
                 logger.info('MPV version check', {
-                    'version': mpv_version.stdout.split('\n')[0] if mpv_version.stdout else 'unknown'
+                    'version': _mpv_version_line(mpv_path, os.stat(mpv_path).st_mtime_ns)
                 })
             except Exception as e:
                 logger.error('MPV check failed', {
@@ -372,11 +379,7 @@ def init_services(
             ).returncode == 0
             
             # Проверка MPV (для воспроизведения)
-            mpv_available = subprocess.run(
-                ["which", "mpv"],
-                capture_output=True,
-                timeout=DEP_CHECK_TIMEOUT_SEC,
-            ).returncode == 0
+            mpv_available = shutil.which("mpv") is not None
             
             logger.info("Проверка зависимостей выполнена", {
                 'Pillow': True,
@@ -18,6 +18,7 @@ from typing import Any, Dict, Optional, Set
 
 from .content_cache_prefetch import prefetch_workers
 from .content_cache_retry import download_max_attempts, download_retry_delay_sec
+from .subprocess_limits import read_spool_tail, stderr_spool
 
 _CACHE_KEY_RE = __import__("re").compile(r"^ext-[A-Za-z0-9_-]+$")
 
@@ -340,7 +341,12 @@ class ContentCache:
         except ValueError:
             timeout = 7200.0
         timeout = max(120.0, min(14400.0, timeout))
-        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        stderr_spool_f = stderr_spool()
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr_spool_f)
+        except BaseException:
+            stderr_spool_f.close()
+            raise
         with self._prefetch_lock:
             self._active_download_procs[media_key] = proc
         deadline = time.monotonic() + timeout
@@ -372,12 +378,12 @@ class ContentCache:
         finally:
             with self._prefetch_lock:
                 self._active_download_procs.pop(media_key, None)
-        stderr_tail = ""
+            if return_code is None:
+                stderr_spool_f.close()
         try:
-            _, stderr_data = proc.communicate(timeout=1.0)
-            stderr_tail = (stderr_data or "")[-400:]
-        except Exception:
-            pass
+            stderr_tail = read_spool_tail(stderr_spool_f, 400)
+        finally:
+            stderr_spool_f.close()
         if return_code != 0:
             part_path.unlink(missing_ok=True)
             for stray in self.cache_dir.glob(f"{media_key}.*"):
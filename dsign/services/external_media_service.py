@@ -7,6 +7,9 @@ from urllib.parse import urlparse
 
 import requests
 
+# Playlist item keys for external media ("ext-<id>"); parsed per item on every play.
+_EXT_KEY_RE = re.compile(r"^ext-(\d+)$")
+
 
 @dataclass(frozen=True)
 class ExternalMediaInfo:
@@ -188,7 +191,7 @@ class ExternalMediaService:
         return raw
 
     def _parse_ext_key(self, key: str) -> Optional[int]:
-        m = re.match(r"^ext-(\d+)$", (key or "").strip())
+        m = _EXT_KEY_RE.match((key or "").strip())
         if not m:
             return None
         try:
@@ -360,9 +363,7 @@ class ExternalMediaService:
 
         # Also remove cached thumbnail (best-effort).
         try:
-            p = self._thumb_path_for(media_id)
-            if p.exists():
-                p.unlink()
+            self._thumb_path_for(media_id).unlink(missing_ok=True)
         except Exception:
             pass
 
@@ -20,7 +20,11 @@ from dsign.services.upload_stream import (
     stream_save_upload,
     upload_size_hint,
 )
-from .logger import ServiceLogger
+from .logger import ServiceLogger, merge_log_extra, module_log_extra
+from .subprocess_limits import read_spool_tail, stderr_spool
+
+_LOG_BASE_EXTRA = module_log_extra('FileService')
+
 
 class FileService:
     ALLOWED_MEDIA_EXTENSIONS = {
@@ -54,24 +58,15 @@ class FileService:
 
     def _log_error(self, message: str, exc_info: bool = True, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для логирования ошибок"""
-        extra_data = {'module': 'FileService'}
-        if extra:
-            extra_data.update(extra)
-        self.logger.error(message, exc_info=exc_info, extra=extra_data)
+        self.logger.error(message, exc_info=exc_info, extra=merge_log_extra(_LOG_BASE_EXTRA, extra))
 
     def _log_info(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для информационных логов"""
-        extra_data = {'module': 'FileService'}
-        if extra:
-            extra_data.update(extra)
-        self.logger.info(message, extra=extra_data)
+        self.logger.info(message, extra=merge_log_extra(_LOG_BASE_EXTRA, extra))
 
     def _log_warning(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для предупреждений"""
-        extra_data = {'module': 'FileService'}
-        if extra:
-            extra_data.update(extra)
-        self.logger.warning(message, extra=extra_data)
+        self.logger.warning(message, extra=merge_log_extra(_LOG_BASE_EXTRA, extra))
 
     def _ensure_directories(self) -> None:
         """Создание необходимых директорий"""
@@ -404,8 +399,7 @@ class FileService:
 
         # Avoid clobbering if multiple jobs happen (shouldn't with max_workers=1, but be safe).
         try:
-            if tmp_out.exists():
-                tmp_out.unlink()
+            tmp_out.unlink(missing_ok=True)
         except Exception:
             pass
 
@@ -471,7 +465,13 @@ class FileService:
                 }
 
             # Stream progress
-            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            # stderr is spooled to a temp file: only stdout (progress) is drained below.
+            stderr_spool_f = stderr_spool()
+            try:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_spool_f, text=True)
+            except BaseException:
+                stderr_spool_f.close()
+                raise
             out_time_ms = 0
             speed = None
             try:
@@ -514,8 +514,11 @@ class FileService:
                             )
                             self._transcode_status[file_path.name] = st
             finally:
-                rc = proc.wait(timeout=60 * 30)
-                stderr = (proc.stderr.read() if proc.stderr else "") if proc.stderr is not None else ""
+                try:
+                    rc = proc.wait(timeout=60 * 30)
+                    stderr = read_spool_tail(stderr_spool_f, 2000)
+                finally:
+                    stderr_spool_f.close()
 
             if rc != 0 or not tmp_out.exists() or tmp_out.stat().st_size < 1024 * 50:
                 self._log_warning(
@@ -535,16 +538,14 @@ class FileService:
                         "updated_at": datetime.utcnow().isoformat() + "Z",
                     }
                 try:
-                    if tmp_out.exists():
-                        tmp_out.unlink()
+                    tmp_out.unlink(missing_ok=True)
                 except Exception:
                     pass
                 return
 
             # Replace original (keep a backup in tmp for debugging)
             try:
-                if bak.exists():
-                    bak.unlink()
+                bak.unlink(missing_ok=True)
             except Exception:
                 pass
 
@@ -560,8 +561,7 @@ class FileService:
             except Exception:
                 # Attempt rollback
                 try:
-                    if file_path.exists():
-                        file_path.unlink()
+                    file_path.unlink(missing_ok=True)
                 except Exception:
                     pass
                 try:
@@ -603,8 +603,7 @@ class FileService:
                     "updated_at": datetime.utcnow().isoformat() + "Z",
                 }
             try:
-                if tmp_out.exists():
-                    tmp_out.unlink()
+                tmp_out.unlink(missing_ok=True)
             except Exception:
                 pass
 
@@ -678,13 +677,12 @@ class FileService:
         for filename in filenames:
             try:
                 file_path = self.upload_folder / secure_filename(filename)
-                if file_path.exists():
-                    file_path.unlink()
-                    deleted.append(filename)
-                    self._log_info(f"Deleted file: {filename}", 
-                                 extra={'filename': filename, 'action': 'delete_file'})
-                else:
-                    failed.append(filename)
+                file_path.unlink()
+                deleted.append(filename)
+                self._log_info(f"Deleted file: {filename}", 
+                             extra={'filename': filename, 'action': 'delete_file'})
+            except FileNotFoundError:
+                failed.append(filename)
             except Exception as e:
                 failed.append(filename)
                 self._log_error(f"Failed to delete file {filename}: {str(e)}", 
@@ -0,0 +1,84 @@
+"""Wait for a file (mpv IPC socket) to appear without sleep-polling.
+
+Linux ``inotify`` through ``ctypes`` (no extra dependency): the caller wakes as soon as
+the name is created in its directory. Where inotify is unavailable (non-Linux libc,
+missing directory, fd limits) it degrades to a plain sleep for the same budget.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import selectors
+import struct
+import time
+from typing import Any, Iterator, Optional
+
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+_libc: Any = None
+_libc_loaded = False
+
+
+def _inotify_libc() -> Optional[Any]:
+    global _libc, _libc_loaded
+    if _libc_loaded:
+        return _libc
+    _libc_loaded = True
+    try:
+        lib = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        lib.inotify_init1.argtypes = [ctypes.c_int]
+        lib.inotify_init1.restype = ctypes.c_int
+        lib.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        lib.inotify_add_watch.restype = ctypes.c_int
+        _libc = lib
+    except (OSError, AttributeError):
+        _libc = None
+    return _libc
+
+
+def _event_names(data: bytes) -> Iterator[bytes]:
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(data):
+        _wd, _mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+        offset += _EVENT_HEADER.size
+        yield data[offset : offset + name_len].rstrip(b"\0")
+        offset += name_len
+
+
+def wait_for_path(path: str, timeout: float) -> bool:
+    """True once ``path`` exists (immediately if it already does); False after ``timeout``."""
+    deadline = time.monotonic() + max(0.0, float(timeout))
+    if os.path.exists(path):
+        return True
+    directory, name = os.path.split(os.path.abspath(path))
+    libc = _inotify_libc()
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC) if libc is not None else -1
+    if fd < 0:
+        time.sleep(max(0.0, deadline - time.monotonic()))
+        return os.path.exists(path)
+    try:
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _IN_CREATE | _IN_MOVED_TO) < 0:
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            return os.path.exists(path)
+        # Created between the first check and add_watch: no event will follow.
+        if os.path.exists(path):
+            return True
+        target = os.fsencode(name)
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not sel.select(remaining):
+                    return os.path.exists(path)
+                try:
+                    data = os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                if any(n == target for n in _event_names(data)):
+                    return True
+    finally:
+        os.close(fd)
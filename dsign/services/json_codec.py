@@ -0,0 +1,57 @@
+"""JSON codec for hot serialization paths (Socket.IO packets, mpv IPC lines).
+
+Uses ``orjson`` when it is installed (optional speedup, not a hard dependency);
+otherwise falls back to the stdlib ``json`` module. The module exposes
+``dumps``/``loads`` with ``json``-compatible signatures so it can be passed as
+``SocketIO(json=...)``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+_ORJSON_OPTS = _orjson.OPT_NON_STR_KEYS if _orjson is not None else 0
+
+
+def dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize to compact JSON text; ``json.dumps`` kwargs are honoured on fallback."""
+    if _orjson is not None and not kwargs.get("default") and not kwargs.get("cls"):
+        try:
+            return _orjson.dumps(obj, option=_ORJSON_OPTS).decode("utf-8")
+        except TypeError:
+            # Types orjson refuses (e.g. ints > 64 bit) — stdlib handles them.
+            pass
+    kwargs.setdefault("separators", (",", ":"))
+    return json.dumps(obj, **kwargs)
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Newline-terminated UTF-8 JSON line (mpv IPC framing) without a str round-trip."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_ORJSON_OPTS | _orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def loads_line(raw: bytes) -> Any:
+    """Parse one received line; invalid UTF-8 (mpv may emit it in paths/tags) is replaced."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8", errors="replace"))
+
+
+def loads(s: Any, **kwargs: Any) -> Any:
+    if _orjson is not None and not kwargs:
+        return _orjson.loads(s)
+    return json.loads(s, **kwargs)
@@ -101,20 +101,34 @@ class ServiceLogger:
                 msg = msg % args
             except (TypeError, ValueError):
                 msg = f"{msg} {', '.join(str(a) for a in args)}"
-        if kwargs.get("exc_info"):
+        # Only walk the stack when an exception is actually being handled; the
+        # default exc_info=True on plain error logs would just yield "NoneType: None".
+        if kwargs.get("exc_info") and sys.exc_info()[0] is not None:
             extra = dict(extra or {})
             extra.setdefault("traceback", traceback.format_exc())
         return msg, extra
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Same as logging.Logger.isEnabledFor — lets callers skip building extra dicts."""
+        return self.logger.isEnabledFor(level)
+
+    # The JSON message is built eagerly (json.dumps of extra), so records below the
+    # configured level (DEBUG/INFO with DSIGN_LOG_LEVEL=WARNING on the Pi) bail out first.
     def debug(self, msg: str, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         msg, extra = self._prepare_log(msg, args, extra, kwargs)
         self.logger.debug(self._format_message(msg, extra))
 
     def info(self, msg: str, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         msg, extra = self._prepare_log(msg, args, extra, kwargs)
         self.logger.info(self._format_message(msg, extra))
 
     def warning(self, msg: str, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         msg, extra = self._prepare_log(msg, args, extra, kwargs)
         self.logger.warning(self._format_message(msg, extra))
 
@@ -142,6 +156,14 @@ class ServiceLogger:
         """Совместимость с logging.Logger.exception (в т.ч. app.logger.exception(...))."""
         return self.logger.exception(msg, *args, **kwargs)
 
+def module_log_extra(module: str) -> Dict[str, Any]:
+    """Базовый extra {'module': ...} для сервиса; создаётся один раз и не изменяется вызывающими."""
+    return {'module': module}
+
+def merge_log_extra(base: Dict[str, Any], extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """base + extra вызова; без extra возвращается сам base (без копирования на каждый лог)."""
+    return {**base, **extra} if extra else base
+
 def setup_logger(name: str, **kwargs) -> ServiceLogger:
     """
     Фабрика для создания логгеров сервисов
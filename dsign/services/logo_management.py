@@ -2,24 +2,33 @@ import os
 import time
 from pathlib import Path
 from typing import Dict, Optional
-from threading import Thread
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from flask import current_app
 
+from ..models import PlaybackStatus
 from .playback_constants import PlaybackConstants
 from .logo_viewer import LogoViewer
 
+# Bundled fallback shown/copied when upload/idle_logo.jpg is missing.
+PLACEHOLDER_LOGO_PATH = Path(__file__).parent.parent / "static" / "images" / "placeholder.jpg"
+
 class LogoManager:
     def __init__(self, logger, socketio, upload_folder, db_session, mpv_manager):
         self.logger = logger
         self.socketio = socketio
         self.upload_folder = Path(upload_folder)
+        # Built once: the logo path is resolved on every status poll / transition.
+        self._logo_path = self.upload_folder / PlaybackConstants.DEFAULT_LOGO
+        self._logo_path_str = str(self._logo_path)
         self.db_session = db_session
         self._mpv_manager = mpv_manager
         self._last_playback_state = {}
         self._logo_viewer = LogoViewer(logger=logger)
         self._wayland_audio_vo_null_active = False
         self._audio_resync_callback = None
+        # Placeholder-logo copy: one reused worker (spawned on first submit) instead of
+        # a fresh non-daemon Thread per idle-logo restart.
+        self._init_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logo-init")
 
     def set_audio_resync_callback(self, callback) -> None:
         """Called after vo=null→gpu restore to re-apply volume/route (mpv ao can go silent)."""
@@ -33,23 +42,26 @@ class LogoManager:
         raw = (os.getenv("DSIGN_AUDIO_WAYLAND_VO_NULL") or "0").strip().lower()
         return raw in ("1", "true", "yes", "on")
 
-    def _initialize_default_logo(self):
-        """Initialize default logo in background"""
-        Thread(target=self._async_initialize_logo).start()
+    def _initialize_default_logo(self) -> Future:
+        """Initialize default logo in background; the future resolves to the logo path or None."""
+        return self._init_pool.submit(self._async_initialize_logo)
 
-    def _async_initialize_logo(self):
+    def _async_initialize_logo(self) -> Optional[Path]:
         """Async logo initialization"""
-        logo_path = self.upload_folder / PlaybackConstants.DEFAULT_LOGO
-        if not logo_path.exists():
-            try:
-                default_logo = Path(__file__).parent.parent / "static" / "images" / "placeholder.jpg"
-                if default_logo.exists():
-                    import shutil
-                    shutil.copy(default_logo, logo_path)
-                    logo_path.chmod(0o664)
-                    self.logger.info(f"Initialized default logo at {logo_path}")
-            except Exception as e:
-                self.logger.error(f"Failed to initialize default logo: {str(e)}")
+        logo_path = self._logo_path
+        if logo_path.exists():
+            return logo_path
+        try:
+            default_logo = PLACEHOLDER_LOGO_PATH
+            if default_logo.exists():
+                import shutil
+                shutil.copy(default_logo, logo_path)
+                logo_path.chmod(0o664)
+                self.logger.info(f"Initialized default logo at {logo_path}")
+                return logo_path
+        except Exception as e:
+            self.logger.error(f"Failed to initialize default logo: {str(e)}")
+        return None
 
     def _transition_mode(self) -> str:
         mode = (os.getenv("DSIGN_PLAYLIST_TRANSITION") or "logo").strip().lower()
@@ -268,19 +280,22 @@ class LogoManager:
 
     def _validate_logo_file(self) -> Path:
         """Validate logo file with improved error handling"""
-        logo_path = self.upload_folder / PlaybackConstants.DEFAULT_LOGO
-        
+        logo_path = self._logo_path
+        # Common case is one access() syscall; exists() only when it fails.
+        if os.access(self._logo_path_str, os.R_OK):
+            return logo_path
+
         if not logo_path.exists():
             self._handle_missing_logo(logo_path)
 
-        if not os.access(logo_path, os.R_OK):
+        if not os.access(self._logo_path_str, os.R_OK):
             self._fix_logo_permissions(logo_path)
 
         return logo_path
 
     def _handle_missing_logo(self, logo_path: Path):
         """Handle missing logo file scenario"""
-        default_logo = Path(__file__).parent.parent / "static" / "images" / "placeholder.jpg"
+        default_logo = PLACEHOLDER_LOGO_PATH
         if not default_logo.exists():
             raise FileNotFoundError("Default logo file not found in static/images")
 
@@ -309,12 +324,12 @@ class LogoManager:
 
     def _update_playback_status(self, playlist_id: Optional[int], status: str):
         """Update playback status in database"""
-        from ..models import PlaybackStatus
-        
-        playback = self.db_session.query(PlaybackStatus).first() or PlaybackStatus()
+        playback = self.db_session.query(PlaybackStatus).first()
+        if playback is None:
+            playback = PlaybackStatus()
+            self.db_session.add(playback)
         playback.playlist_id = playlist_id
         playback.status = status
-        self.db_session.add(playback)
         self.db_session.commit()
 
     def get_current_logo_path(self) -> Path:
@@ -322,17 +337,18 @@ class LogoManager:
         try:
             return self._validate_logo_file()
         except FileNotFoundError:
-            return Path(__file__).parent.parent / "static" / "images" / "placeholder.jpg"
+            return PLACEHOLDER_LOGO_PATH
 
     def get_current_logo_status(self) -> dict:
         """Get complete logo status for API"""
         try:
-            path = self._validate_logo_file()
+            path = str(self._validate_logo_file())
+            st = os.stat(path)
             return {
-                "path": str(path),
-                "is_default": "placeholder.jpg" in str(path),
-                "file_size": os.path.getsize(path),
-                "last_modified": os.path.getmtime(path)
+                "path": path,
+                "is_default": "placeholder.jpg" in path,
+                "file_size": st.st_size,
+                "last_modified": st.st_mtime
             }
         except FileNotFoundError:
             return {
@@ -357,8 +373,8 @@ class LogoManager:
             
     def _verify_logo_displayed(self, timeout: float = 3.0) -> bool:
         """Проверка с таймаутом и повторными попытками"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.perf_counter()
+        while time.perf_counter() - start_time < timeout:
             try:
                 response = self._mpv_manager._send_command({
                     "command": ["get_property", "filename"]
@@ -373,7 +389,12 @@ class LogoManager:
     def restart_idle_logo(self, upload_folder=None, idle_logo=None, rotate: Optional[int] = None):
         """Refresh idle logo. Wayland: restart imv; DRM: loadfile in MPV."""
         if PlaybackConstants.is_wayland_backend():
-            self._initialize_default_logo()
+            init = self._initialize_default_logo()
+            try:
+                # imv is about to reopen the file: let a pending placeholder copy land first.
+                init.result(timeout=2.0)
+            except Exception:
+                pass
             if self._logo_viewer.reload():
                 return True
             self.logger.warning("Wayland logo viewer reload failed; imv may still show old file")
@@ -383,10 +404,10 @@ class LogoManager:
             upload_folder = upload_folder or current_app.config['UPLOAD_FOLDER']
             idle_logo = idle_logo or current_app.config['IDLE_LOGO']
             
-            logo_path = Path(upload_folder) / idle_logo
+            logo_path = os.path.join(str(upload_folder), idle_logo)
 
             resp = self._mpv_manager._send_command(
-                {"command": ["loadfile", str(logo_path), "replace"]},
+                {"command": ["loadfile", logo_path, "replace"]},
                 timeout=5.0
             )
             if not resp or resp.get("error") != "success":
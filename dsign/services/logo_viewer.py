@@ -6,6 +6,7 @@ import subprocess
 from typing import Optional
 
 from .playback_constants import PlaybackConstants
+from .systemd_units import unit_is_active
 
 
 class LogoViewer:
@@ -43,14 +44,17 @@ class LogoViewer:
         if not self.enabled():
             return None
         unit = PlaybackConstants.LOGO_SYSTEMD_UNIT
+        via_dbus = unit_is_active(unit)
+        if via_dbus is not None:
+            return via_dbus
         try:
             r = subprocess.run(
                 ["systemctl", "is-active", unit],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5.0,
                 check=False,
             )
-            return r.stdout.strip() == "active"
+            return r.returncode == 0
         except Exception:
             return None
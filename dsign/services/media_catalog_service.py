@@ -54,9 +54,7 @@ def remove_storage_key_everywhere(
             if row:
                 if external_media_service and hasattr(external_media_service, "_thumb_path_for"):
                     try:
-                        p = external_media_service._thumb_path_for(media_id)
-                        if p.exists():
-                            p.unlink()
+                        external_media_service._thumb_path_for(media_id).unlink(missing_ok=True)
                     except OSError:
                         pass
                 db_session.delete(row)
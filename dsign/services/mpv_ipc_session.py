@@ -9,16 +9,82 @@ blocking the playback controller.
 This avoids opening/closing a new socket for every ``get_property``, which
 reduces mpv accept/teardown churn and IPC overhead under dashboard + playlist
 polling load.
+
+Outbound lines go through a ``queue.SimpleQueue`` drained by a single writer
+thread: callers never contend on the socket for writes, and commands
+submitted concurrently are coalesced into one write.
 """
 
 from __future__ import annotations
 
-import json
+import contextlib
+import functools
+import itertools
 import queue
+import selectors
 import socket
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+from . import json_codec
+
+
+# Upper bound of queued command lines coalesced into one socket write by the writer.
+_WRITER_BATCH_MAX = 32
+# mpv not draining its socket for this long counts as a dead peer (send would block forever).
+_WRITE_STALL_SEC = 5.0
+# Commands whose wire form only varies by request_id (polling get_property, stop,
+# profile/pause set_property, …): their JSON prefix is encoded once and reused;
+# loadfile paths/options vary too much to be worth caching.
+_PREENCODED_COMMANDS = frozenset(
+    {
+        "get_property",
+        "set_property",
+        "seek",
+        "stop",
+        "quit",
+        "playlist-next",
+        "playlist-prev",
+    }
+)
+_PREENCODED_ARG_TYPES = (str, int, float, bool)
+_REQUEST_ID_TAIL = b"0}\n"
+# Process-wide id source: unique across threads (next() on a C iterator is atomic under the GIL),
+# no clock read per command.
+_request_ids = itertools.count(1)
+
+
+def next_request_id() -> int:
+    """Fresh IPC ``request_id`` in 1..2**31-1 (mpv echoes it back as a signed 32-bit int)."""
+    return next(_request_ids) % 0x7FFFFFFF + 1
+
+
+@functools.lru_cache(maxsize=256)
+def _command_prefix(command: tuple, _arg_types: tuple = ()) -> bytes:
+    """``{"command":[...],"request_id":`` — everything but the id and closing brace.
+
+    ``_arg_types`` is part of the cache key only: ``True``, ``1`` and ``1.0`` hash equal
+    but encode differently.
+    """
+    return json_codec.dumps_line({"command": list(command), "request_id": 0})[: -len(_REQUEST_ID_TAIL)]
+
+
+def _encode_command(payload: Dict[str, Any], request_id: int) -> bytes:
+    """One newline-terminated JSON command line carrying ``request_id``."""
+    cmd = payload.get("command")
+    if (
+        len(payload) == 1
+        and type(cmd) is list
+        and cmd
+        and cmd[0] in _PREENCODED_COMMANDS
+        and all(type(arg) in _PREENCODED_ARG_TYPES for arg in cmd)
+    ):
+        return _command_prefix(tuple(cmd), tuple(map(type, cmd))) + b"%d}\n" % request_id
+    body = dict(payload)
+    body["request_id"] = request_id
+    return json_codec.dumps_line(body)
 
 
 class MPVIPCClosedError(ConnectionError):
@@ -33,7 +99,8 @@ class MpvJsonIpcSession:
     """
     Thread-safe JSON IPC client for a single mpv instance.
 
-    - Writer path: ``command()`` registers a pending queue, sends one JSON line.
+    - Writer path: ``command()`` registers a pending queue and hands the JSON line
+      to the writer thread (single owner of socket writes) via a lock-free queue.
     - Reader thread: parses newline-delimited JSON; routes replies with
       ``request_id`` + ``error`` key to the matching queue; skips pure events.
     """
@@ -44,31 +111,65 @@ class MpvJsonIpcSession:
         *,
         logger: Any,
         recv_chunk_size: int = 65536,
+        on_peer_closed: Optional[Callable[[], None]] = None,
     ) -> None:
         self.socket_path = socket_path
         self.logger = logger
         self._recv_chunk_size = recv_chunk_size
+        # Called from the reader when mpv drops the socket (EOF/error), not on our own reset.
+        self._on_peer_closed = on_peer_closed
 
         self._sock: Optional[socket.socket] = None
         self._conn_lock = threading.Lock()
-        self._pending: Dict[int, queue.Queue] = {}
+        # Bumped per successful connect: state mirrored from mpv is only valid for one connection.
+        self.connect_count = 0
+        # request_id → reply slot. SimpleQueue (C, no Conditions) — one allocation per command;
+        # ids come from next_request_id(), so a plain dict lookup never collides.
+        self._pending: Dict[int, queue.SimpleQueue] = {}
         self._pending_lock = threading.Lock()
 
         self._reader_thread: Optional[threading.Thread] = None
+        self._writer_thread: Optional[threading.Thread] = None
         self._reader_stop = threading.Event()
-        self._buf = b""
+        self._send_queue: "queue.SimpleQueue[Optional[tuple[bytes, Future]]]" = queue.SimpleQueue()
+        self._buf = bytearray()
         self._event_queues: Dict[str, queue.Queue] = {}
         self._event_queues_lock = threading.Lock()
 
     def close(self) -> None:
-        """Stop reader and release socket (process shutdown or service restart)."""
+        """Stop reader/writer and release socket (process shutdown or service restart)."""
         self._reader_stop.set()
-        self._close_socket_unlocked(fail_pending=False)
+        self._send_queue.put(None)
+        try:
+            self._close_socket_unlocked(fail_pending=False)
+            for t in (self._reader_thread, self._writer_thread):
+                if t is not None and t.is_alive():
+                    t.join(timeout=3.0)
+        finally:
+            # Whatever happened above, no caller may be left waiting on a dead session.
+            self._reader_thread = None
+            self._writer_thread = None
+            self._fail_unsent(MPVIPCClosedError("mpv IPC session closed"))
+            # Fresh Event instead of clear(): a reader/writer that outlived the join
+            # keeps its own (set) stop flag and exits instead of running next to the new pair.
+            self._reader_stop = threading.Event()
+
+    def is_connected(self) -> bool:
+        """True while the long-lived socket is open and the reader is servicing it."""
+        with self._conn_lock:
+            if self._sock is None:
+                return False
         t = self._reader_thread
-        if t is not None and t.is_alive():
-            t.join(timeout=3.0)
-        self._reader_thread = None
-        self._reader_stop.clear()
+        return t is not None and t.is_alive()
+
+    def connect(self, *, timeout: float = 15.0) -> None:
+        """
+        Open the long-lived connection now (no-op when already connected).
+
+        Lets a readiness probe double as the connection later commands reuse.
+        Raises ConnectionRefusedError / FileNotFoundError / MPVIPCClosedError like ``command()``.
+        """
+        self._ensure_connected_and_reader(connect_timeout=timeout)
 
     def reset(self) -> None:
         """
@@ -92,31 +193,16 @@ class MpvJsonIpcSession:
             MPVIPCClosedError: disconnect during operation or session reset.
             ConnectionRefusedError / FileNotFoundError: socket missing.
         """
-        ipc_request_id = (
-            int(request_id)
-            if request_id is not None
-            else (int(time.time() * 1_000_000) & 0x7FFFFFFF)
-        )
-        body = dict(payload)
-        body["request_id"] = ipc_request_id
-
-        q: queue.Queue = queue.Queue(maxsize=8)
+        ipc_request_id = int(request_id) if request_id is not None else next_request_id()
+        q: queue.SimpleQueue = queue.SimpleQueue()
         with self._pending_lock:
             self._pending[ipc_request_id] = q
 
-        line = json.dumps(body, ensure_ascii=False) + "\n"
-        data = line.encode("utf-8")
+        data = _encode_command(payload, ipc_request_id)
 
         try:
             self._ensure_connected_and_reader()
-            with self._conn_lock:
-                if self._sock is None:
-                    raise MPVIPCClosedError("mpv IPC socket not connected")
-                try:
-                    self._sock.sendall(data)
-                except OSError as se:
-                    self._close_socket_unlocked(fail_pending=False)
-                    raise MPVIPCClosedError(f"mpv IPC reset during send: {se}") from se
+            self._submit(data, timeout=timeout)
         except BaseException:
             with self._pending_lock:
                 self._pending.pop(ipc_request_id, None)
@@ -191,40 +277,18 @@ class MpvJsonIpcSession:
         if not items:
             return []
 
-        qs: List[queue.Queue] = []
-        ids: List[int] = []
-        chunks: List[bytes] = []
-
-        try:
-            for ipc_request_id, payload in items:
-                q: queue.Queue = queue.Queue(maxsize=8)
-                qs.append(q)
-                ids.append(ipc_request_id)
-                with self._pending_lock:
-                    self._pending[ipc_request_id] = q
-                body = dict(payload)
-                body["request_id"] = ipc_request_id
-                chunks.append((json.dumps(body, ensure_ascii=False) + "\n").encode("utf-8"))
-        except BaseException:
-            for ipc_request_id in ids:
-                with self._pending_lock:
-                    self._pending.pop(ipc_request_id, None)
-            raise
+        ids: List[int] = [ipc_request_id for ipc_request_id, _ in items]
+        chunks: List[bytes] = [_encode_command(payload, rid) for rid, payload in items]
+        qs: List[queue.SimpleQueue] = [queue.SimpleQueue() for _ in ids]
+        # One lock hold registers (and below, drops) the whole batch.
+        with self._pending_lock:
+            self._pending.update(zip(ids, qs))
 
         try:
             self._ensure_connected_and_reader()
-            with self._conn_lock:
-                if self._sock is None:
-                    raise MPVIPCClosedError("mpv IPC socket not connected")
-                try:
-                    self._sock.sendall(b"".join(chunks))
-                except OSError as se:
-                    self._close_socket_unlocked(fail_pending=False)
-                    raise MPVIPCClosedError(f"mpv IPC reset during send: {se}") from se
+            self._submit(b"".join(chunks), timeout=timeout)
         except BaseException:
-            for ipc_request_id in ids:
-                with self._pending_lock:
-                    self._pending.pop(ipc_request_id, None)
+            self._drop_pending(ids)
             raise
 
         n = len(qs)
@@ -254,21 +318,42 @@ class MpvJsonIpcSession:
                 results.append(raw)
             return results
         finally:
-            for ipc_request_id in ids:
-                with self._pending_lock:
-                    self._pending.pop(ipc_request_id, None)
+            self._drop_pending(ids)
 
     # --- internals ---
 
+    def _submit(self, data: bytes, *, timeout: float) -> None:
+        """Queue ``data`` for the writer thread and wait until it hit the socket."""
+        fut: Future = Future()
+        self._send_queue.put((data, fut))
+        try:
+            fut.result(timeout=max(0.05, float(timeout)))
+        except FutureTimeoutError:
+            # The caller gives up (and may retry): the writer must not deliver this frame
+            # later. cancel() fails only if the writer is already sending it.
+            fut.cancel()
+            raise MPVIPCTimeoutError("mpv IPC send not flushed before deadline")
+
+    def _fail_unsent(self, exc: BaseException) -> None:
+        while True:
+            try:
+                item = self._send_queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and not item[1].done():
+                item[1].set_exception(exc)
+
+    def _drop_pending(self, ids: List[int]) -> None:
+        with self._pending_lock:
+            for ipc_request_id in ids:
+                self._pending.pop(ipc_request_id, None)
+
     def _fail_all_pending(self, exc: BaseException) -> None:
         with self._pending_lock:
             items = list(self._pending.items())
             self._pending.clear()
         for _, q in items:
-            try:
-                q.put_nowait(exc)
-            except queue.Full:
-                pass
+            q.put_nowait(exc)
 
     def _close_socket_unlocked(self, *, fail_pending: bool) -> None:
         if fail_pending:
@@ -277,99 +362,220 @@ class MpvJsonIpcSession:
         with self._conn_lock:
             sock = self._sock
             self._sock = None
-        self._buf = b""
+        self._buf = bytearray()
         if sock is not None:
             try:
-                sock.shutdown(socket.SHUT_RDWR)
-            except OSError:
-                pass
-            try:
-                sock.close()
-            except OSError:
-                pass
-
-    def _ensure_connected_and_reader(self) -> None:
+                with contextlib.suppress(OSError):
+                    sock.shutdown(socket.SHUT_RDWR)
+            finally:
+                # The fd is released even if shutdown() fails in an unexpected way.
+                with contextlib.suppress(OSError):
+                    sock.close()
+
+    def _ensure_connected_and_reader(self, connect_timeout: float = 15.0) -> None:
         with self._conn_lock:
             if self._sock is not None:
                 self._start_reader_unlocked()
                 return
+            s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             try:
-                s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                s.settimeout(15.0)
+                s.settimeout(connect_timeout)
                 s.connect(self.socket_path)
-                s.settimeout(None)
+                # Non-blocking from here on: the reader waits in its selector, the
+                # writer only parks on EAGAIN (see _send_nonblocking).
+                s.setblocking(False)
             except (ConnectionRefusedError, FileNotFoundError):
+                # Failed probes (socket wait loops) release the fd right away.
+                s.close()
                 raise
             except OSError as e:
+                s.close()
                 raise MPVIPCClosedError(f"mpv IPC connect failed: {e}") from e
             self._sock = s
-            self._buf = b""
+            self.connect_count += 1
+            self._buf = bytearray()
             self._start_reader_unlocked()
 
     def _start_reader_unlocked(self) -> None:
+        stop = self._reader_stop
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            w = threading.Thread(
+                target=self._writer_loop,
+                args=(stop,),
+                name="mpv-json-ipc-writer",
+                daemon=True,
+            )
+            self._writer_thread = w
+            w.start()
         if self._reader_thread is not None and self._reader_thread.is_alive():
             return
-        self._reader_stop.clear()
         t = threading.Thread(
             target=self._reader_loop,
+            args=(stop,),
             name="mpv-json-ipc-reader",
             daemon=True,
         )
         self._reader_thread = t
         t.start()
 
-    def _reader_loop(self) -> None:
-        while not self._reader_stop.is_set():
-            with self._conn_lock:
-                sock = self._sock
-            if sock is None:
-                time.sleep(0.03)
-                continue
+    def _writer_loop(self, stop: threading.Event) -> None:
+        while not stop.is_set():
             try:
-                with self._pending_lock:
-                    pending = bool(self._pending)
-                sock.settimeout(0.15 if pending else 0.6)
-                chunk = sock.recv(self._recv_chunk_size)
-            except socket.timeout:
+                first = self._send_queue.get(timeout=0.5)
+            except queue.Empty:
                 continue
-            except OSError as e:
+            if first is None:
+                continue
+            batch = [first]
+            while len(batch) < _WRITER_BATCH_MAX:
+                try:
+                    item = self._send_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    break
+                batch.append(item)
+            # Frames whose caller already timed out (future cancelled) are dropped, not sent late.
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if batch:
+                self._flush_batch(batch)
+
+    def _flush_batch(self, batch: List[tuple[bytes, Future]]) -> None:
+        with self._conn_lock:
+            sock = self._sock
+        exc: Optional[BaseException] = None
+        if sock is None:
+            exc = MPVIPCClosedError("mpv IPC socket not connected")
+        else:
+            try:
+                self._send_nonblocking(sock, b"".join(data for data, _ in batch))
+            except OSError as se:
                 with self._conn_lock:
-                    if self._sock is not sock:
-                        continue
-                self.logger.debug(
-                    "mpv IPC reader socket error",
-                    extra={"operation": "MpvJsonIpcSession", "error": str(e)},
-                )
-                self._close_socket_unlocked(fail_pending=True)
+                    same = self._sock is sock
+                if same:
+                    self._close_socket_unlocked(fail_pending=False)
+                exc = MPVIPCClosedError(f"mpv IPC reset during send: {se}")
+        for _, fut in batch:
+            if fut.done():
                 continue
+            if exc is None:
+                fut.set_result(None)
+            else:
+                fut.set_exception(exc)
+
+    @staticmethod
+    def _send_nonblocking(sock: socket.socket, data: bytes) -> None:
+        """Write everything, parking on a selector only while the kernel buffer is full."""
+        view = memoryview(data)
+        sel: Optional[selectors.BaseSelector] = None
+        try:
+            while view:
+                try:
+                    view = view[sock.send(view):]
+                    continue
+                except BlockingIOError:
+                    pass
+                if sel is None:
+                    sel = selectors.DefaultSelector()
+                    sel.register(sock, selectors.EVENT_WRITE)
+                if not sel.select(_WRITE_STALL_SEC):
+                    raise socket.timeout("mpv IPC socket not writable")
+        finally:
+            if sel is not None:
+                sel.close()
 
-            if chunk == b"":
+    def _notify_peer_closed(self) -> None:
+        cb = self._on_peer_closed
+        if cb is None:
+            return
+        try:
+            cb()
+        except Exception:
+            pass
+
+    def _reader_loop(self, stop: threading.Event) -> None:
+        # Wait for readability with a selector (epoll on Linux); the socket is
+        # non-blocking, so a spurious wakeup just goes around again.
+        sel: Optional[selectors.BaseSelector] = None
+        watched: Optional[socket.socket] = None
+        try:
+            while not stop.is_set():
                 with self._conn_lock:
-                    if self._sock is not sock:
+                    sock = self._sock
+                if sock is None:
+                    time.sleep(0.03)
+                    continue
+                if sock is not watched:
+                    if sel is not None:
+                        sel.close()
+                    sel = selectors.DefaultSelector()
+                    try:
+                        sel.register(sock, selectors.EVENT_READ)
+                    except (OSError, ValueError):
+                        watched = None
                         continue
-                self.logger.debug(
-                    "mpv IPC EOF on socket",
-                    extra={"operation": "MpvJsonIpcSession"},
-                )
-                self._close_socket_unlocked(fail_pending=True)
-                continue
+                    watched = sock
+                try:
+                    with self._pending_lock:
+                        pending = bool(self._pending)
+                    if not sel.select(0.15 if pending else 0.6):
+                        continue
+                    chunk = sock.recv(self._recv_chunk_size)
+                except BlockingIOError:
+                    continue
+                except (OSError, ValueError) as e:
+                    with self._conn_lock:
+                        if self._sock is not sock:
+                            continue
+                    self.logger.debug(
+                        "mpv IPC reader socket error",
+                        extra={"operation": "MpvJsonIpcSession", "error": str(e)},
+                    )
+                    self._close_socket_unlocked(fail_pending=True)
+                    self._notify_peer_closed()
+                    continue
+
+                if chunk == b"":
+                    with self._conn_lock:
+                        if self._sock is not sock:
+                            continue
+                    self.logger.debug(
+                        "mpv IPC EOF on socket",
+                        extra={"operation": "MpvJsonIpcSession"},
+                    )
+                    self._close_socket_unlocked(fail_pending=True)
+                    self._notify_peer_closed()
+                    continue
 
-            self._feed_lines(chunk)
+                self._feed_lines(chunk)
+        finally:
+            if sel is not None:
+                sel.close()
 
     def _feed_lines(self, chunk: bytes) -> None:
-        self._buf += chunk
+        buf = self._buf
+        buf += chunk
+        if b"\n" not in chunk:
+            # Partial line: nothing to parse until the terminator arrives.
+            return
+        # Split every complete line out of the buffer in one pass and drop the
+        # consumed prefix once, so a reply arriving in many chunks stays linear.
+        lines: List[bytes] = []
+        pos = 0
         while True:
-            idx = self._buf.find(b"\n")
+            idx = buf.find(b"\n", pos)
             if idx < 0:
                 break
-            raw = self._buf[:idx]
-            self._buf = self._buf[idx + 1 :]
+            lines.append(bytes(buf[pos:idx]))
+            pos = idx + 1
+        del buf[:pos]
+        for raw in lines:
             line = raw.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line.decode("utf-8", errors="replace"))
-            except json.JSONDecodeError:
+                obj = json_codec.loads_line(line)
+            except ValueError:
                 continue
             if not isinstance(obj, dict):
                 continue
@@ -395,9 +601,5 @@ class MpvJsonIpcSession:
                 continue
             with self._pending_lock:
                 q = self._pending.get(rid_i)
-            if q is None:
-                continue
-            try:
+            if q is not None:
                 q.put_nowait(obj)
-            except queue.Full:
-                pass
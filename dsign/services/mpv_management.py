@@ -1,15 +1,22 @@
 import os
 import shutil
-import socket
 import time
 import subprocess
-from threading import Lock, Thread
+from threading import Event, Lock, Thread
 from typing import Callable, Dict, Optional, Any, List
 from pathlib import Path
 
 from .playback_constants import PlaybackConstants
 from .logger import ServiceLogger
-from .mpv_ipc_session import MPVIPCClosedError, MPVIPCTimeoutError, MpvJsonIpcSession
+from .inotify_wait import wait_for_path
+from .systemd_units import unit_is_active
+from .mpv_ipc_session import (
+    MPVIPCClosedError,
+    MPVIPCTimeoutError,
+    MpvJsonIpcSession,
+    next_request_id,
+)
+from .retry_backoff import equal_jitter, full_jitter
 
 
 def _is_ipc_transport_error(exc: BaseException) -> bool:
@@ -24,6 +31,33 @@ def _is_ipc_transport_error(exc: BaseException) -> bool:
     return False
 
 
+# mpv replies that are normal for optional/absent properties — logged at debug, not warning.
+_QUIET_MPV_ERRORS = frozenset(
+    {
+        "property unavailable",
+        "property not found",
+        "error accessing property",
+    }
+)
+_PROPERTY_COMMANDS = frozenset({"get_property", "set_property"})
+# Commands that change the property named in their first argument (drop it from _applied_props).
+_PROPERTY_WRITE_COMMANDS = frozenset({"set_property", "set", "add", "multiply", "cycle", "cycle-values"})
+# Writing these reopens the audio output even with an unchanged value (rebind relies on it).
+_ALWAYS_WRITE_PROPS = frozenset({"ao", "audio-device", "vo"})
+# IPC command logs can be extremely chatty (polling loops call _send_command frequently).
+# Per-command start/end logs are OFF by default; opt-in via env. Read once at import
+# instead of parsing the environment on every command.
+_MPV_IPC_DEBUG = os.getenv("DSIGN_MPV_IPC_DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
+try:
+    _MPV_IPC_SLOW_MS = max(0, int(os.getenv("DSIGN_MPV_IPC_SLOW_MS", "250") or 250))
+except ValueError:
+    _MPV_IPC_SLOW_MS = 250
+# Reuse window for a healthy check_health() (boot/recover loops call it back to back).
+_HEALTH_CACHE_TTL_SEC = 0.25
+# Reuse window for `systemctl is-active` (fork+exec per call; ready/socket-wait loops poll it).
+_SYSTEMD_CACHE_TTL_SEC = 0.5
+
+
 def _ipc_error_should_restart_mpv(exc: BaseException) -> bool:
     """Transport drop or hung IPC (no reply) — systemd restart is the practical recovery."""
     return _is_ipc_transport_error(exc) or isinstance(exc, MPVIPCTimeoutError)
@@ -50,6 +84,17 @@ class MPVManager:
         self.upload_folder = upload_folder
         self._ipc_lock = Lock()
         self._ipc_session: Optional[MpvJsonIpcSession] = None
+        # Set when mpv closes the IPC socket (exit/restart); wakes the socket watch.
+        self.ipc_peer_closed = Event()
+        # Property values update_settings confirmed on the current IPC connection.
+        self._applied_props: Dict[str, Any] = {}
+        self._applied_props_conn: Optional[tuple] = None
+        # Bumped by _forget_applied_props (restart, IPC reset, peer close).
+        self._applied_props_epoch = 0
+        # Last healthy check_health() result (monotonic ts, result); see _HEALTH_CACHE_TTL_SEC.
+        self._health_cache: tuple[float, Optional[Dict[str, bool]]] = (0.0, None)
+        # Last `systemctl is-active` answer (monotonic ts, active); see _SYSTEMD_CACHE_TTL_SEC.
+        self._svc_cache: tuple[float, Optional[bool]] = (0.0, None)
         self._mpv_restart_coalesce_lock = Lock()
         self._last_mpv_restart_attempt_ts = 0.0
         self._current_settings = {}
@@ -99,14 +144,9 @@ class MPVManager:
         )
 
     def _cache_mpv_state(self):
-        """Кеширует важные параметры MPV"""
-        props = ["pause", "volume", "mute"]
-        for prop in props:
-            resp = self._send_command({
-                "command": ["get_property", prop]
-            })
-            if resp and "data" in resp:
-                self._last_known_state[prop] = resp["data"]
+        """Кеширует важные параметры MPV (one pipelined round-trip)."""
+        snap = self.get_properties_snapshot(["pause", "volume", "mute"])
+        self._last_known_state.update((k, v) for k, v in snap.items() if v is not None)
     
     def _restore_mpv_state(self):
         """Восстанавливает кешированное состояние"""
@@ -115,14 +155,15 @@ class MPVManager:
                 "command": ["set", prop, value]
             })
     
-    def _log_operation(self, operation: str, status: str, details: Dict[str, Any] = None):
-        """Унифицированное логирование операций"""
+    def _log_operation(self, operation: str, status: str, details: Dict[str, Any] = None, *, debug: bool = False):
+        """Унифицированное логирование операций (debug=True для частых промежуточных шагов)"""
         log_data = {
             "operation": operation,
             "status": status,
             **({"details": details} if details else {})
         }
-        self.logger.info(
+        log = self.logger.debug if debug else self.logger.info
+        log(
             f"{operation} - {status}",
             extra=log_data
         )
@@ -162,7 +203,7 @@ class MPVManager:
                     ["enable_event", "end-file", True],
                     ["enable_event", "file-loaded", True],
                 ):
-                    ipc_request_id = max(1, int(time.time() * 1_000_000) & 0x7FFFFFFF)
+                    ipc_request_id = next_request_id()
                     sess.command(
                         {"command": cmd},
                         timeout=3.0,
@@ -342,7 +383,7 @@ class MPVManager:
             if not self._acquire_ipc_lock(lock_wait=lock_wait):
                 return
             try:
-                ipc_request_id = max(1, int(time.time() * 1_000_000) & 0x7FFFFFFF)
+                ipc_request_id = next_request_id()
                 sess = self._get_ipc_session()
                 raw = sess.command(
                     {"command": ["get_property", "pause"]},
@@ -510,16 +551,23 @@ class MPVManager:
     def _mpv_socket_file_exists(self) -> bool:
         return os.path.exists(self.mpv_socket)
 
+    def _ipc_session_connected(self) -> bool:
+        """Shared session already holds a live connection — no throwaway probe needed."""
+        sess = self._ipc_session
+        return sess is not None and sess.is_connected()
+
     def _mpv_socket_missing(self) -> bool:
         """True when the IPC socket file is gone or mpv is not accepting connections."""
         if not self._mpv_socket_file_exists():
             return True
+        if self._ipc_session_connected():
+            return False
+        # Probe by connecting the shared session: if mpv accepts, the next command
+        # reuses this connection instead of paying a second connect.
         try:
-            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-                s.settimeout(0.3)
-                s.connect(self.mpv_socket)
+            self._get_ipc_session().connect(timeout=0.3)
             return False
-        except (ConnectionRefusedError, FileNotFoundError, OSError):
+        except OSError:
             return True
 
     def _try_recover_socket_without_restart(self) -> bool:
@@ -602,22 +650,38 @@ class MPVManager:
         return PlaybackConstants.MAX_RETRIES
 
     def _check_systemd_service(self) -> bool:
-        """Проверка статуса systemd сервиса"""
+        """Проверка статуса systemd сервиса (answer reused for _SYSTEMD_CACHE_TTL_SEC)."""
+        ts, cached = self._svc_cache
+        if cached is not None and time.monotonic() - ts < _SYSTEMD_CACHE_TTL_SEC:
+            return cached
+        is_active = self._query_systemd_service()
+        self._svc_cache = (time.monotonic(), is_active)
+        return is_active
+
+    def _query_systemd_service(self) -> bool:
+        via_dbus = unit_is_active(PlaybackConstants.mpv_systemd_unit())
+        if via_dbus is not None:
+            return via_dbus
         try:
+            # `is-active` exits 0 only for "active": the exit code is the answer, so no
+            # pipes, reader threads or stdout decode.
             result = subprocess.run(
                 ["systemctl", "is-active", PlaybackConstants.mpv_systemd_unit()],
-                check=True,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5.0
             )
-            is_active = result.stdout.strip() == "active"
-            
-            self._log_operation(
-                "SystemdServiceCheck",
-                "active" if is_active else "inactive",
-                {"output": result.stdout.strip()}
-            )
+            is_active = result.returncode == 0
+            if is_active:
+                self._log_operation("SystemdServiceCheck", "active")
+            else:
+                self.logger.error(
+                    "Systemd check failed",
+                    extra={
+                        "operation": "SystemdServiceCheck",
+                        "returncode": result.returncode,
+                    }
+                )
             return is_active
             
         except subprocess.TimeoutExpired:
@@ -627,17 +691,6 @@ class MPVManager:
             )
             return False
             
-        except subprocess.CalledProcessError as e:
-            self.logger.error(
-                "Systemd check failed",
-                extra={
-                    "operation": "SystemdServiceCheck",
-                    "error": str(e),
-                    "stderr": e.stderr.strip()
-                }
-            )
-            return False
-            
         except Exception as e:
             self.logger.error(
                 "Systemd check unexpected error",
@@ -668,6 +721,8 @@ class MPVManager:
         Prefer ``dsign-mpv-recover`` (reset-failed + stop + kill stale mpv + start) when
         plain ``systemctl restart`` fails on hung players or start-limit-hit.
         """
+        self.invalidate_health()
+        self._forget_applied_props()
         recover_bin = (
             os.getenv("DSIGN_MPV_RECOVER_BIN") or "/usr/local/bin/dsign-mpv-recover"
         ).strip()
@@ -681,7 +736,7 @@ class MPVManager:
         last_error = ""
         for cmd in commands:
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 result = subprocess.run(
                     cmd,
                     check=True,
@@ -690,7 +745,7 @@ class MPVManager:
                     timeout=45.0,
                     env=self._mpv_restart_subprocess_env(),
                 )
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 self._log_operation(
                     "SystemdServiceRestart",
                     "success",
@@ -756,17 +811,25 @@ class MPVManager:
 
     def _check_mpv_socket(self, timeout=5) -> bool:
         """Проверка доступности сокета MPV"""
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            if os.path.exists(self.mpv_socket):
-                try:
-                    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-                        s.settimeout(1.0)
-                        s.connect(self.mpv_socket)
-                        return True
-                except (ConnectionRefusedError, socket.error):
-                    time.sleep(0.1)
-        return False
+        # The reader drops the session on EOF, so a live session means mpv is listening.
+        if self._ipc_session_connected():
+            return True
+        deadline = time.monotonic() + timeout
+        while True:
+            # connect() is the probe: a missing path raises FileNotFoundError, no
+            # separate exists() stat needed (and no busy loop while it is absent).
+            # Probe with the shared session rather than a throwaway socket, so a
+            # successful check is the connection the next command reuses.
+            # Each attempt (and the pause after it) is clamped to what is left of
+            # the budget, so a short probe never overruns into a 1 s connect wait.
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                self._get_ipc_session().connect(timeout=max(0.05, min(1.0, remaining)))
+                return True
+            except OSError:
+                time.sleep(max(0.0, min(0.1, deadline - time.monotonic())))
 
     def _wait_for_socket(self, timeout: float = 10.0) -> bool:
         """Ожидание сокета"""
@@ -785,11 +848,11 @@ class MPVManager:
                 if not self._restart_systemd_service_if_needed():
                     return False
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         last_status_time = start_time
         
-        while time.time() - start_time < timeout:
-            current_time = time.time()
+        while time.perf_counter() - start_time < timeout:
+            current_time = time.perf_counter()
             
             if current_time - last_status_time >= 2.0:
                 self._log_operation(
@@ -803,7 +866,7 @@ class MPVManager:
                 self._log_operation(
                     "SocketTest",
                     "success",
-                    {"elapsed_sec": round(time.time() - start_time, 3)}
+                    {"elapsed_sec": round(time.perf_counter() - start_time, 3)}
                 )
                 return True
             
@@ -814,18 +877,29 @@ class MPVManager:
             extra={
                 "operation": "SocketWait",
                 "timeout": timeout,
-                "elapsed_sec": round(time.time() - start_time, 3)
+                "elapsed_sec": round(time.perf_counter() - start_time, 3)
             }
         )
         return False
 
     def _get_ipc_session(self) -> MpvJsonIpcSession:
         if self._ipc_session is None:
-            self._ipc_session = MpvJsonIpcSession(self.mpv_socket, logger=self.logger)
+            self._ipc_session = MpvJsonIpcSession(
+                self.mpv_socket,
+                logger=self.logger,
+                on_peer_closed=self._on_ipc_peer_closed,
+            )
         return self._ipc_session
 
+    def _on_ipc_peer_closed(self) -> None:
+        self.invalidate_health()
+        self._forget_applied_props()
+        self.ipc_peer_closed.set()
+
     def _reset_ipc_session(self) -> None:
         """Drop IPC socket state after mpv restart or transport failure (next command reconnects)."""
+        self.invalidate_health()
+        self._forget_applied_props()
         if self._ipc_session is not None:
             try:
                 self._ipc_session.reset()
@@ -907,11 +981,17 @@ class MPVManager:
                     d = float(delays_transport[i])
                 except (TypeError, ValueError, IndexError):
                     d = 0.25
-                time.sleep(max(0.0, d))
+                time.sleep(equal_jitter(d))
             elif isinstance(exc, MPVIPCTimeoutError):
                 time.sleep(0.15)
             else:
-                time.sleep(min(1.0, PlaybackConstants.RETRY_DELAY))
+                time.sleep(
+                    full_jitter(
+                        attempt_idx,
+                        base=PlaybackConstants.RETRY_BASE,
+                        cap=min(1.0, PlaybackConstants.RETRY_CAP),
+                    )
+                )
 
         def _maybe_restart_mpv_batch(
             *, reason: str, attempt_num: int, ipc_request_id: int
@@ -949,12 +1029,10 @@ class MPVManager:
 
         first_rid = 0
         for attempt in range(batch_retries):
-            base_rid = int(time.time() * 1_000_000) & 0x7FFFFFFF
             ids: List[int] = []
             items: List[tuple[int, Dict[str, Any]]] = []
-            for idx, pname in enumerate(ordered):
-                ipc_request_id = (base_rid + idx * 7919 + ((idx & 31) << 20)) & 0x7FFFFFFF
-                ipc_request_id = max(1, ipc_request_id)
+            for pname in ordered:
+                ipc_request_id = next_request_id()
                 ids.append(ipc_request_id)
                 items.append((ipc_request_id, {"command": ["get_property", pname]}))
             first_rid = ids[0] if ids else 0
@@ -1076,7 +1154,7 @@ class MPVManager:
             if not self._acquire_ipc_lock(lock_wait=lock_wait):
                 return None
             try:
-                ipc_request_id = max(1, int(time.time() * 1_000_000) & 0x7FFFFFFF)
+                ipc_request_id = next_request_id()
                 sess = self._get_ipc_session()
                 raw = sess.command(
                     {"command": ["get_property", prop]},
@@ -1141,22 +1219,19 @@ class MPVManager:
             command["command"] = command_arr[:4]
             command_arr = command["command"]
             command_name = command_arr[0]
+        self._forget_applied_prop(command_arr)
         # For get_property/set_property, include the property name in logs to make "property unavailable"
         # actionable (and to distinguish normal mpv behavior from real errors).
         prop_name: Optional[str] = None
-        if isinstance(command_arr, list) and len(command_arr) >= 2 and command_name in ("get_property", "set_property"):
+        if isinstance(command_arr, list) and len(command_arr) >= 2 and command_name in _PROPERTY_COMMANDS:
             try:
                 prop_name = str(command_arr[1])
             except Exception:
                 prop_name = None
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        # IPC command logs can be extremely chatty (polling loops call this frequently).
-        # Keep per-command start/end logs OFF by default; allow opt-in via env.
-        log_ipc_debug = (os.getenv("DSIGN_MPV_IPC_DEBUG", "").strip().lower() in ("1", "true", "yes", "on"))
-        slow_ms = int(os.getenv("DSIGN_MPV_IPC_SLOW_MS", "250") or 250)
-        if slow_ms < 0:
-            slow_ms = 0
+        log_ipc_debug = _MPV_IPC_DEBUG
+        slow_ms = _MPV_IPC_SLOW_MS
 
         attempt_limit = (
             max(1, int(max_attempts))
@@ -1184,9 +1259,15 @@ class MPVManager:
                     d = float(delays_transport[i])
                 except (TypeError, ValueError, IndexError):
                     d = 0.25
-                time.sleep(max(0.0, d))
+                time.sleep(equal_jitter(d))
             else:
-                time.sleep(PlaybackConstants.RETRY_DELAY)
+                time.sleep(
+                    full_jitter(
+                        attempt_idx,
+                        base=PlaybackConstants.RETRY_BASE,
+                        cap=PlaybackConstants.RETRY_CAP,
+                    )
+                )
 
         def _maybe_restart_mpv_for_transport(*, reason: str, attempt_num: int) -> None:
             """
@@ -1224,7 +1305,7 @@ class MPVManager:
 
         ipc_request_id = 0
         for attempt in range(attempt_limit):
-            ipc_request_id = int(time.time() * 1_000_000) & 0x7FFFFFFF
+            ipc_request_id = next_request_id()
             if log_ipc_debug:
                 self.logger.debug(
                     "MPVCommand started",
@@ -1255,7 +1336,7 @@ class MPVManager:
                 finally:
                     self._release_ipc_lock()
 
-                duration_sec = round(time.time() - start_time, 3)
+                duration_sec = round(time.perf_counter() - start_time, 3)
                 self._reset_playback_ipc_fail_streak()
                 err = result.get("error")
                 if err == "success":
@@ -1294,24 +1375,14 @@ class MPVManager:
                             "error": "success",
                             "data": None,
                         }
-                    quiet_errs = {
-                        "property unavailable",
-                        "property not found",
-                        "error accessing property",
-                    }
-                    quiet_props = False
-                    try:
-                        if (
-                            command_name == "set_property"
-                            and isinstance(prop_name, str)
-                            and prop_name.startswith("file-local-options/")
-                        ):
-                            quiet_props = True
-                    except Exception:
-                        quiet_props = False
+                    quiet_props = (
+                        command_name == "set_property"
+                        and isinstance(prop_name, str)
+                        and prop_name.startswith("file-local-options/")
+                    )
                     log_fn = (
                         self.logger.debug
-                        if err in quiet_errs or quiet_props
+                        if err in _QUIET_MPV_ERRORS or quiet_props
                         else self.logger.warning
                     )
                     log_fn(
@@ -1378,7 +1449,7 @@ class MPVManager:
                         "request_id": ipc_request_id,
                         "error": str(e),
                         "type": type(e).__name__,
-                        "duration_sec": round(time.time() - start_time, 3),
+                        "duration_sec": round(time.perf_counter() - start_time, 3),
                     },
                 )
                 if self._ipc_error_needs_session_reset(e):
@@ -1405,7 +1476,7 @@ class MPVManager:
                 "command": command_name,
                 "request_id": ipc_request_id,
                 "max_attempts": attempt_limit,
-                "duration_sec": round(time.time() - start_time, 3),
+                "duration_sec": round(time.perf_counter() - start_time, 3),
             },
         )
         return None
@@ -1413,7 +1484,7 @@ class MPVManager:
     def initialize(self) -> bool:
         """Инициализация MPV с повторами"""
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             if not self._check_mpv_socket():
                 if not self._try_recover_socket_without_restart():
@@ -1435,7 +1506,7 @@ class MPVManager:
                     extra={
                         "operation": "mpv_init",
                         "status": "socket_only",
-                        "duration_sec": round(time.time() - start_time, 3),
+                        "duration_sec": round(time.perf_counter() - start_time, 3),
                     },
                 )
             else:
@@ -1446,7 +1517,7 @@ class MPVManager:
                         "status": "success",
                         "backend": PlaybackConstants.mpv_backend_label(),
                         "mpv_version": str(version)[:80],
-                        "duration_sec": round(time.time() - start_time, 3),
+                        "duration_sec": round(time.perf_counter() - start_time, 3),
                     },
                 )
             return True
@@ -1459,7 +1530,7 @@ class MPVManager:
                     "status": "failed",
                     "error": str(e),
                     "type": type(e).__name__,
-                    "duration_sec": round(time.time() - start_time, 3)
+                    "duration_sec": round(time.perf_counter() - start_time, 3)
                 }
             )
             return False
@@ -1468,12 +1539,12 @@ class MPVManager:
         """Корректное завершение работы"""
         self._log_operation("MPVShutdown", "started")
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             self._send_command({"command": ["quit"]})
             self._log_operation(
                 "MPVShutdown",
                 "completed",
-                {"duration_sec": round(time.time() - start_time, 3)}
+                {"duration_sec": round(time.perf_counter() - start_time, 3)}
             )
         except Exception as e:
             self.logger.error(
@@ -1493,6 +1564,77 @@ class MPVManager:
                     pass
                 self._ipc_session = None
 
+    def _send_commands(
+        self,
+        commands: List[Dict[str, Any]],
+        *,
+        timeout: float = 5.0,
+        lock_wait: Optional[float] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Pipeline several IPC commands under one lock hold (one write, replies by request_id).
+
+        Fast path only: returns None when the batch could not complete (lock busy,
+        transport error, timeout) — callers fall back to per-command ``_send_command``,
+        which owns retries and mpv recovery.
+        """
+        if not commands:
+            return []
+        for cmd in commands:
+            self._forget_applied_prop(cmd.get("command"))
+        items: List[tuple[int, Dict[str, Any]]] = [
+            (next_request_id(), dict(cmd)) for cmd in commands
+        ]
+        if not self._acquire_ipc_lock(lock_wait=lock_wait):
+            return None
+        try:
+            results = self._get_ipc_session().commands_batch(items, timeout=float(timeout))
+        except Exception as e:
+            self.logger.debug(
+                "MPV command batch failed; falling back to single commands",
+                extra={
+                    "operation": "MPVCommandBatch",
+                    "count": len(items),
+                    "error": str(e),
+                    "type": type(e).__name__,
+                },
+            )
+            if self._ipc_error_needs_session_reset(e):
+                self._reset_ipc_session()
+            return None
+        finally:
+            self._release_ipc_lock()
+        self._reset_playback_ipc_fail_streak()
+        return results
+
+    def _forget_applied_prop(self, command_arr: Any) -> None:
+        """A write outside update_settings: its property is no longer known to match."""
+        if isinstance(command_arr, list) and len(command_arr) >= 2 and command_arr[0] in _PROPERTY_WRITE_COMMANDS:
+            self._applied_props.pop(str(command_arr[1]).rsplit("/", 1)[-1], None)
+
+    def _forget_applied_props(self) -> None:
+        """mpv restarted or the IPC link dropped: nothing confirmed earlier still holds."""
+        self._applied_props_epoch += 1
+        self._applied_props.clear()
+        self._applied_props_conn = None
+
+    def _applied_props_connection(self) -> Optional[tuple]:
+        """Identity of the live IPC connection; a new one (mpv restart) drops ``_applied_props``."""
+        try:
+            sess = self._get_ipc_session()
+            count = getattr(sess, "connect_count", None)
+        except Exception:
+            count = None
+        conn = (
+            (id(sess), count, self._applied_props_epoch)
+            if isinstance(count, int) and count > 0
+            else None
+        )
+        if conn is None or conn != self._applied_props_conn:
+            self._applied_props.clear()
+            self._applied_props_conn = conn
+        return conn
+
     def update_settings(self, settings: Dict[str, Any]) -> bool:
         """Обновление настроек"""
         self._log_operation(
@@ -1501,10 +1643,12 @@ class MPVManager:
             {"settings": settings}
         )
         
-        start_time = time.time()
-        success = True
+        start_time = time.perf_counter()
         results = {}
-        
+
+        conn = self._applied_props_connection()
+        applied = self._applied_props
+        props: Dict[str, Any] = {}
         for key, value in settings.items():
             if key == "mute":
                 if isinstance(value, bool):
@@ -1515,13 +1659,52 @@ class MPVManager:
                         value = "yes"
                     elif lv in ("0", "false", "no", "off"):
                         value = "no"
+            if (
+                conn is not None
+                and key not in _ALWAYS_WRITE_PROPS
+                and key in applied
+                and applied[key] == value
+            ):
+                # Unchanged since the last confirmed write on this connection.
+                results[key] = True
+                continue
+            props[key] = value
+
+        # vo must keep going through _send_command's playback guard.
+        batched = [
+            k for k in props
+            if not (k == "vo" and self._playback_session_active)
+        ]
+        replies = self._send_commands(
+            [{"command": ["set_property", k, props[k]]} for k in batched]
+        )
+        if replies is not None:
+            for key, response in zip(batched, replies):
+                results[key] = response.get("error") == "success"
+                if not results[key]:
+                    self.logger.warning(
+                        "MPVCommand error response",
+                        extra={
+                            "command": "set_property",
+                            "property": key,
+                            "mpv_error": response.get("error"),
+                        },
+                    )
+
+        for key, value in props.items():
+            if key in results:
+                continue
             response = self._send_command({
                 "command": ["set_property", key, value]
             })
-            result = response.get("error") == "success" if response else False
-            results[key] = result
-            if not result:
-                success = False
+            results[key] = response.get("error") == "success" if response else False
+
+        if conn is not None and conn == self._applied_props_connection():
+            for key, value in props.items():
+                if results.get(key):
+                    applied[key] = value
+
+        success = all(results.values())
         
         self._log_operation(
             "UpdateSettings",
@@ -1529,7 +1712,7 @@ class MPVManager:
             {
                 "success": success,
                 "results": results,
-                "duration_sec": round(time.time() - start_time, 3)
+                "duration_sec": round(time.perf_counter() - start_time, 3)
             }
         )
         return success
@@ -1642,36 +1825,43 @@ class MPVManager:
             {"timeout": timeout, "check_interval": check_interval}
         )
         
-        start_time = time.time()
-        last_check = start_time
+        start_time = time.perf_counter()
+        probe = 0
         
-        while time.time() - start_time < timeout:
-            if time.time() - last_check >= check_interval:
+        while time.perf_counter() - start_time < timeout:
+            # Every probe of the ramp: DEBUG, started/completed stay at INFO.
+            self._log_operation(
+                "WaitForMPVReady",
+                "checking",
+                {"elapsed_sec": round(time.perf_counter() - start_time, 1)},
+                debug=True,
+            )
+            if self.get_property_light("idle-active", timeout=3.0) is not None:
+                self._mpv_ready = True
                 self._log_operation(
                     "WaitForMPVReady",
-                    "checking",
-                    {"elapsed_sec": round(time.time() - start_time, 1)}
+                    "completed",
+                    {
+                        "success": True,
+                        "elapsed_sec": round(time.perf_counter() - start_time, 3)
+                    }
                 )
-                last_check = time.time()
-                
-                if self.get_property_light("idle-active", timeout=3.0) is not None:
-                    self._mpv_ready = True
-                    self._log_operation(
-                        "WaitForMPVReady",
-                        "completed",
-                        {
-                            "success": True,
-                            "elapsed_sec": round(time.time() - start_time, 3)
-                        }
-                    )
-                    return True
-            
-            time.sleep(0.1)
+                return True
+            if not self._mpv_socket_file_exists():
+                # No socket yet: park on inotify until mpv creates it instead of polling.
+                # Capped at check_interval: without inotify wait_for_path is a plain sleep.
+                remaining = timeout - (time.perf_counter() - start_time)
+                wait_for_path(self.mpv_socket, min(remaining, float(check_interval)))
+                continue
+            # Probe at once, then back off geometrically (0.1s → check_interval), jittered.
+            step = min(float(check_interval), 0.1 * 1.6 ** probe)
+            probe += 1
+            time.sleep(max(0.0, min(equal_jitter(step), timeout - (time.perf_counter() - start_time))))
         
         self._log_operation(
             "WaitForMPVReady",
             "timeout",
-            {"elapsed_sec": round(time.time() - start_time, 3)}
+            {"elapsed_sec": round(time.perf_counter() - start_time, 3)}
         )
         return False
 
@@ -1716,21 +1906,43 @@ class MPVManager:
                 )
                 if self._restart_systemd_service():
                     self._wait_for_socket(timeout=20.0)
-            time.sleep(interval)
+            if os.path.exists(self.mpv_socket):
+                # Path is there but mpv is not accepting yet — plain retry interval.
+                time.sleep(interval)
+            else:
+                # Wake as soon as mpv creates the socket instead of sleeping blind.
+                wait_for_path(self.mpv_socket, interval)
         return self._check_mpv_socket(timeout=1.0)
 
+    def invalidate_health(self) -> None:
+        """Forget cached check_health() / systemctl results (restart, IPC reset, peer close)."""
+        self._health_cache = (0.0, None)
+        self._svc_cache = (0.0, None)
+
     def check_health(self) -> Dict[str, bool]:
-        """Комплексная проверка состояния MPV"""
+        """
+        Комплексная проверка состояния MPV.
+
+        A fully healthy result is reused for _HEALTH_CACHE_TTL_SEC so back-to-back callers
+        share one probe (socket connect + IPC; systemctl only when the socket is down);
+        unhealthy results are never cached.
+        """
+        ts, cached = self._health_cache
+        if cached is not None and time.monotonic() - ts < _HEALTH_CACHE_TTL_SEC:
+            return dict(cached)
         socket_ok = self._check_mpv_socket()
-        systemd_ok = self._check_systemd_service()
         # digital-signage.service runs as user `dsign` — `systemctl is-active` often fails (dbus/policy)
-        # while mpv is running and the IPC socket exists. Do not treat that as unhealthy.
-        service_ok = systemd_ok or socket_ok
+        # while mpv is running and the IPC socket exists. Do not treat that as unhealthy, and do not
+        # fork systemctl at all when the socket already answered.
+        service_ok = socket_ok or self._check_systemd_service()
         responsive = False
         if socket_ok:
             responsive = self.get_property_light("mpv-version", timeout=3.0) is not None
-        return {
+        result = {
             "service_active": service_ok,
             "socket_available": socket_ok,
             "responsive": responsive,
         }
+        if all(result.values()):
+            self._health_cache = (time.monotonic(), result)
+        return dict(result)
@@ -22,11 +22,14 @@ class PlaybackConstants:
         "best[height<=1080]"
     )
     MAX_RETRIES = 3  # Увеличено с 3
-    # Used between retries for errors where MPV likely needs systemd recovery (socket missing, etc.).
-    RETRY_DELAY = 5.0  # Увеличено с 1.0
+    # Other IPC failures: capped exponential backoff with full jitter (first retry ≤50 ms).
+    RETRY_BASE = 0.05
+    RETRY_CAP = 2.0
     # Fast backoff when MPV resets/closes the IPC socket mid-command (avoid starving HTTP workers).
     RETRY_DELAY_TRANSPORT_SEC = (0.15, 0.35, 0.75)
     SOCKET_TIMEOUT = 10.0  # Увеличено с 5.0
+    # Local video playlists up to this size are queued via IPC loadfile…append; longer → tmp M3U.
+    LOCAL_PLAYLIST_IPC_MAX_ITEMS = 1000
 
     @classmethod
     def display_backend(cls) -> str:
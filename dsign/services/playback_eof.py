@@ -420,7 +420,6 @@ class PlaybackEofWaiter:
                         continue
 
             got_ipc = tp is not None or idle_raw is not None or dur is not None
-            socket_missing = not os.path.exists(PlaybackConstants.SOCKET_PATH)
             if got_ipc:
                 last_ipc_ok = time.monotonic()
                 consecutive_ipc_stall = 0
@@ -453,7 +452,8 @@ class PlaybackEofWaiter:
                         time_pos=last_time_pos,
                         duration=last_duration,
                     )
-                    if socket_missing:
+                    # Only stat the socket once IPC is already considered dead.
+                    if not os.path.exists(PlaybackConstants.SOCKET_PATH):
                         if midstream_advance:
                             self._pm.logger.warning(
                                 "playlist_eof_stall: MPV socket missing mid-stream;"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import traceback
+from concurrent.futures import Future
 from threading import Thread
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
@@ -19,6 +20,23 @@ class PlaybackPlayRunner:
     def __init__(self, pm: "PlaylistManager") -> None:
         self._pm = pm
 
+    def _submit_settings(self, settings: Dict[str, Any]) -> "Future[bool]":
+        """Profile set_property batch on the service's settings pool (inline without one)."""
+        update = self._pm._mpv_manager.update_settings
+        executor = self._pm._settings_executor
+        if executor is not None:
+            try:
+                return executor.submit(update, settings)
+            except RuntimeError:
+                pass  # pool already shut down (graceful shutdown in progress)
+        fut: "Future[bool]" = Future()
+        try:
+            fut.set_result(update(settings))
+        except Exception as e:
+            # Same contract as the pool: the failure surfaces at the join.
+            fut.set_exception(e)
+        return fut
+
     def run(
         self,
         playlist_id: int,
@@ -29,8 +47,6 @@ class PlaybackPlayRunner:
         source: str = "manual",
         rule_id: Optional[int] = None,
     ) -> bool:
-        from ..models import PlaybackStatus, Playlist, PlaylistProfileAssignment, PlaybackProfile
-
         play_seq: Optional[int] = None
         play_run_id: Optional[int] = None
         try:
@@ -88,68 +104,83 @@ class PlaybackPlayRunner:
                     pass
 
             # Get playlist and validate
-            playlist = self._pm.db_session.query(Playlist).get(playlist_id)
-            if not playlist:
+            # Plain column tuples (one outer-join SELECT): play() never needs ORM entities.
+            play_rows = self._pm._playlist_play_rows(playlist_id)
+            if play_rows is None:
                 raise ValueError(f"Playlist {playlist_id} not found")
+            playlist_name, files = play_rows
 
-            # Get assigned profile if exists
+            # Get assigned profile if exists (one JOIN, cached until a profile write).
             profile_settings = {}
-            assignment = self._pm.db_session.query(PlaylistProfileAssignment).filter_by(
-                playlist_id=playlist_id
-            ).first()
-
-            if assignment and assignment.profile_id:
-                profile = self._pm.db_session.query(PlaybackProfile).get(assignment.profile_id)
-                if profile:
-                    # `settings` is stored as JSON in DB, so it is already a dict.
-                    profile_settings = profile.settings or {}
+            profile = self._pm._assigned_profiles.get(self._pm.db_session, playlist_id)
+            if profile:
+                # `settings` is stored as JSON in DB, so it is already a dict.
+                settings = profile.get("settings")
+                if isinstance(settings, dict):
+                    profile_settings = dict(settings)
 
             profile_muted = bool(profile_settings.get("mute", False))
 
-            # Apply profile settings first
-            if profile_settings:
-                if not self._pm._mpv_manager.update_settings(profile_settings):
-                    self._pm.logger.warning("Failed to apply some profile settings")
-
             # panscan>0 даёт «зум под размер экрана» и на части DRM/сборок ведёт к обрезке даже при 16:9.
             # По умолчанию вписываем кадр без обрезки; при необходимости убрать полосы — задать panscan в профиле MPV.
-            if "panscan" not in profile_settings:
-                self._pm._mpv_manager._send_command(
-                    {"command": ["set_property", "panscan", 0.0]},
-                    timeout=2.0,
-                )
+            # Default panscan rides in the same pipelined IPC batch as the profile settings.
+            mpv_settings = dict(profile_settings)
+            mpv_settings.setdefault("panscan", 0.0)
+            # mpv IPC only (no DB): overlaps item resolution below, joined before any loadfile.
+            settings_applied = self._submit_settings(mpv_settings)
+            settings_error: Optional[Exception] = None
 
             # Manual playback loop is the most reliable way to enforce per-item durations on mpv builds
             # where ffconcat timing is inconsistent for images and mixed media.
             items = []
             missing = []
-            # Enforce stable playback order (PlaylistFiles.order in DB).
-            files = sorted((playlist.files or []), key=lambda x: int(getattr(x, "order", 0) or 0))
-            for pf in files:
-                resolved = self._pm._resolve_playlist_item_path(getattr(pf, "file_name", None))
-                if not resolved or not resolved.get("path"):
-                    missing.append(str(getattr(pf, "file_name", "")))
-                    continue
-
-                is_video = bool(resolved.get("is_video"))
-                is_audio = bool(resolved.get("is_audio"))
-                file_name = str(getattr(pf, "file_name", "") or "")
-                items.append(
-                    {
-                        "key": resolved.get("key") or file_name,
-                        "label": self._pm._media_label_for_file_name(file_name),
-                        "path": resolved["path"],
-                        "duration": int(getattr(pf, "duration", 0) or 0),
-                        "is_video": is_video,
-                        "is_audio": is_audio,
-                        "muted": bool(getattr(pf, "muted", False))
-                        if (is_video or is_audio)
-                        else False,
-                        "http_headers": resolved.get("http_headers") or {},
-                        "page_url": resolved.get("page_url"),
-                        "provider": resolved.get("provider"),
-                    }
-                )
+            try:
+                # One directory listing (mtime-validated cache) instead of a stat() per local item.
+                present = self._pm._upload_folder_names()
+                # Rows come back in PlaylistFiles.order already (see _playlist_play_rows).
+                for file_name, _order, duration, muted in files:
+                    resolved = self._pm._resolve_playlist_item_path(file_name, present=present)
+                    if not resolved or not resolved.get("path"):
+                        missing.append(str(file_name or ""))
+                        continue
+
+                    is_video = bool(resolved.get("is_video"))
+                    is_audio = bool(resolved.get("is_audio"))
+                    file_name = str(file_name or "")
+                    items.append(
+                        {
+                            "key": resolved.get("key") or file_name,
+                            "label": self._pm._media_label_for_file_name(file_name),
+                            "path": resolved["path"],
+                            "duration": int(duration or 0),
+                            "is_video": is_video,
+                            "is_audio": is_audio,
+                            "muted": bool(muted)
+                            if (is_video or is_audio)
+                            else False,
+                            "http_headers": resolved.get("http_headers") or {},
+                            "page_url": resolved.get("page_url"),
+                            "provider": resolved.get("provider"),
+                        }
+                    )
+            finally:
+                # Joined on every exit path: mpv settings must not change after play()
+                # has already moved on to the failure path or the idle logo.
+                try:
+                    settings_ok = settings_applied.result()
+                except Exception as e:
+                    # Logged here, re-raised below only when resolution succeeded:
+                    # an error already propagating from the loop must not be replaced.
+                    settings_ok = False
+                    settings_error = e
+                    self._pm.logger.warning(
+                        "Applying profile settings failed",
+                        extra={"playlist_id": playlist_id, "error": str(e), "type": type(e).__name__},
+                    )
+            if settings_error is not None:
+                raise settings_error
+            if not settings_ok:
+                self._pm.logger.warning("Failed to apply some profile settings")
 
             if not items:
                 raise ValueError(
@@ -162,9 +193,7 @@ class PlaybackPlayRunner:
             if start_index < 0 or start_index >= len(items):
                 start_index = 0
 
-            # Detach ORM before long IPC — keep plain ids/settings for persist/emit later.
-            playlist_name = str(getattr(playlist, "name", "") or "")
-            playlist = None  # noqa: F841 — avoid accidental lazy-loads after session release
+            playlist_name = str(playlist_name or "")
 
             playback_mode = self._pm._playlist_playback_mode(items)
             if not single_pass and playback_mode in ("local_single", "local_playlist"):
@@ -430,8 +459,7 @@ class PlaybackPlayRunner:
             # Notify clients
             try:
                 if self._pm.socketio:
-                    self._pm.socketio.emit(
-                        'playback_update',
+                    self._pm.emit_playback_update(
                         {
                             'status': 'playing',
                             'playlist_id': playlist_id,
@@ -439,7 +467,7 @@ class PlaybackPlayRunner:
                             'rule_id': rule_id if source == "schedule" else None,
                             'current_media': self._pm._get_current_media_label(),
                             'playlist': {'id': playlist_id, 'name': playlist_name},
-                            'settings': profile_settings,
+                            **self._pm._settings_emit_fields(profile_settings),
                         },
                     )
             except Exception:
@@ -11,13 +11,49 @@ import shutil
 import logging
 
 from .mpv_management import MPVManager
+from .inotify_wait import wait_for_path
 from .logo_management import LogoManager
 from .profile_management import ProfileManager
 from .playlist_management import PlaylistManager
 from .playback_constants import PlaybackConstants
 from .recovery_queue import RecoveryJob, RecoveryJobKind, RecoveryQueue
+from .retry_backoff import decorrelated_jitter, equal_jitter, full_jitter
 from .wayland_manager import WaylandManager
-from .logger import ServiceLogger
+from .logger import ServiceLogger, merge_log_extra
+from ..extensions import db
+from ..models import PlaybackStatus
+
+# Perf: this service is IPC/syscall-bound, not compute-bound. Wall time goes to
+# mpv JSON IPC round-trips, then SQLAlchemy round-trips and the odd systemctl /
+# subprocess spawn — there is no data-parallel kernel to vectorize or offload.
+# Priorities, in order: fewer round-trips (batched IPC commands, one persistent
+# mpv socket — MpvJsonIpcSession), cheaper serialization of what remains
+# (services/json_codec), no lock convoys on the IPC submit path, pooled DB/UDS
+# connections. Anything else is second-order here.
+
+# LogRecord attributes that `extra` must not overwrite (logging raises KeyError).
+_RESERVED_LOG_KEYS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
+    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process',
+    'message', 'asctime', 'taskName',
+})
+# Wall-clock budget for _transition_to_idle retries (display_idle_logo can block on mpv).
+_IDLE_TRANSITION_BUDGET_SEC = 20.0
+# mpv properties read by health_check (one pipelined batch).
+_HEALTH_PROPS = ("vo-configured", "pause", "path")
+_LOG_BASE_EXTRA = {'service_module': 'PlaybackService'}
+_LOG_LEVEL_METHODS = {
+    logging.DEBUG: 'debug',
+    logging.INFO: 'info',
+    logging.WARNING: 'warning',
+    logging.ERROR: 'error',
+}
+
+class PlaybackDeadlineError(TimeoutError, RuntimeError):
+    """Retry loop ran out of its wall-clock budget (still a RuntimeError for old callers)."""
+
 
 class PlaybackService:
     def __init__(
@@ -42,7 +78,7 @@ class PlaybackService:
         self._logo_manager = LogoManager(
             logger=self.logger,
             socketio=self.socketio,
-            upload_folder=str(self.upload_folder),
+            upload_folder=self.upload_folder,
             db_session=self.db_session,
             mpv_manager=self._mpv_manager
         )
@@ -69,13 +105,9 @@ class PlaybackService:
         self._schedule_service = None
         self._schedule_engine = None
         
-        self.logo_manager = LogoManager(
-            logger=self.logger,
-            socketio=self.socketio,
-            upload_folder=self.upload_folder,
-            db_session=self.db_session,
-            mpv_manager=self._mpv_manager
-        )
+        # Public alias, not a second instance: LogoManager tracks viewer and vo state
+        # that must be shared with the playlist manager's transitions.
+        self.logo_manager = self._logo_manager
         
         self._recover_lock = Lock()
         self._recovery_queue = RecoveryQueue()
@@ -87,6 +119,16 @@ class PlaybackService:
         self._app = None
         self._app_ready = Event()
         self._mpv_init_ready = Event()
+        # One-shot background work (resource preload, boot resume): pooled threads,
+        # cancelled/released in graceful_shutdown instead of orphaned bare Threads.
+        self._bg_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pb-bg")
+        # Crash / post-restart recovery callbacks: persistent workers instead of a fresh
+        # Thread per event. Two, so an overlapping event still reaches _recover_lock and
+        # is queued on RecoveryQueue rather than parked behind a running recovery.
+        self._recover_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pb-recover")
+        # play() applies profile settings here while it resolves playlist items.
+        self._settings_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pb-settings")
+        self._playlist_manager.set_settings_executor(self._settings_pool)
 
         self._mpv_manager.set_post_restart_callback(self._on_mpv_app_initiated_restart)
         self._playlist_manager.set_slideshow_crash_callback(self._on_slideshow_thread_crash)
@@ -190,6 +232,12 @@ class PlaybackService:
                 extra={**extra, "error": str(exc), "type": type(exc).__name__},
             )
 
+        for pool_attr in ("_bg_pool", "_recover_pool", "_settings_pool"):
+            pool = getattr(self, pool_attr, None)
+            if pool is not None:
+                # Queued preload/resume/recovery is pointless now; do not let it hold up exit.
+                pool.shutdown(wait=False, cancel_futures=True)
+
         try:
             self._mpv_manager.shutdown()
         except Exception as exc:
@@ -199,8 +247,6 @@ class PlaybackService:
             )
 
         try:
-            from dsign.extensions import db
-
             with self._app_context():
                 db.session.remove()
         except Exception as exc:
@@ -256,47 +302,34 @@ class PlaybackService:
         """Remove reserved keys from extra_data to prevent LogRecord conflicts"""
         if not extra_data:
             return None
-            
-        reserved_keys = {
-            'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-            'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
-            'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-            'thread', 'threadName', 'processName', 'process'
-        }
-        
-        return {k: v for k, v in extra_data.items() if k not in reserved_keys}
+        if extra_data.keys().isdisjoint(_RESERVED_LOG_KEYS):
+            return extra_data
+        return {k: v for k, v in extra_data.items() if k not in _RESERVED_LOG_KEYS}
+
+    def _log(self, level: int, message: str, extra: Optional[Dict[str, Any]] = None, **kwargs):
+        """Единая точка логирования: общий extra модуля + caller extra, одна аллокация максимум."""
+        is_enabled = getattr(self.logger, "isEnabledFor", None)
+        if is_enabled is not None and not is_enabled(level):
+            return
+        safe_extra = self._sanitize_extra_data(merge_log_extra(_LOG_BASE_EXTRA, extra))
+        # ServiceLogger has no .log(level, ...): dispatch to the level method.
+        getattr(self.logger, _LOG_LEVEL_METHODS[level])(message, extra=safe_extra, **kwargs)
 
     def _log_error(self, message: str, exc_info: bool = True, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для логирования ошибок"""
-        extra_data = {'service_module': 'PlaybackService'}
-        if extra:
-            extra_data.update(extra)
-        safe_extra = self._sanitize_extra_data(extra_data)
-        self.logger.error(message, exc_info=exc_info, extra=safe_extra)
+        self._log(logging.ERROR, message, extra, exc_info=exc_info)
 
     def _log_info(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для информационных логов"""
-        extra_data = {'service_module': 'PlaybackService'}
-        if extra:
-            extra_data.update(extra)
-        safe_extra = self._sanitize_extra_data(extra_data)
-        self.logger.info(message, extra=safe_extra)
+        self._log(logging.INFO, message, extra)
 
     def _log_warning(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для предупреждений"""
-        extra_data = {'service_module': 'PlaybackService'}
-        if extra:
-            extra_data.update(extra)
-        safe_extra = self._sanitize_extra_data(extra_data)
-        self.logger.warning(message, extra=safe_extra)
+        self._log(logging.WARNING, message, extra)
 
     def _log_debug(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для отладочных логов"""
-        extra_data = {'service_module': 'PlaybackService'}
-        if extra:
-            extra_data.update(extra)
-        safe_extra = self._sanitize_extra_data(extra_data)
-        self.logger.debug(message, extra=safe_extra)
+        self._log(logging.DEBUG, message, extra)
 
     def _init_background_loop(self) -> None:
         """MPV init in background so digital-signage.service / Flask start immediately."""
@@ -317,11 +350,17 @@ class PlaybackService:
                     },
                 )
                 time.sleep(delay)
-                delay = min(30.0, delay * 1.5)
+                delay = decorrelated_jitter(delay, base=2.0, cap=30.0)
 
-    def _init_with_retry(self, max_attempts: int = 3, initial_delay: float = 2.0):
-        """Optimized initialization with parallel checks and backoff"""
+    def _init_with_retry(
+        self,
+        max_attempts: int = 3,
+        initial_delay: float = 2.0,
+        total_timeout: float = 30.0,
+    ):
+        """Optimized initialization with parallel checks and backoff, bounded by ``total_timeout``."""
         last_exception = None
+        deadline = time.monotonic() + float(total_timeout)
         
         for attempt in range(max_attempts):
             try:
@@ -354,7 +393,7 @@ class PlaybackService:
                 self._ensure_app_wired(timeout=90.0)
                 self._ensure_schedule_engine()
                 
-                Thread(target=self._resume_playback_after_boot, daemon=True).start()
+                self._bg_pool.submit(self._resume_playback_after_boot)
                 return
                     
             except Exception as e:
@@ -369,6 +408,20 @@ class PlaybackService:
                     },
                 )
                 if attempt < max_attempts - 1:
+                    if time.monotonic() + delay >= deadline:
+                        self._log_warning(
+                            "Initialization retry budget exhausted",
+                            extra={
+                                "action": "init",
+                                "status": "failed",
+                                "attempts": attempt + 1,
+                                "total_timeout": total_timeout,
+                                "last_error": str(last_exception),
+                            },
+                        )
+                        raise PlaybackDeadlineError(
+                            f"Initialization did not succeed within {total_timeout:.0f}s: {last_exception}"
+                        )
                     time.sleep(delay)
 
         self._log_warning(
@@ -384,14 +437,15 @@ class PlaybackService:
     def _preload_resources(self):
         """Non-critical resource loading in background"""
         try:
-            self._logo_manager._initialize_default_logo()
-            logo_path = self._logo_manager.get_current_logo_path()
-            if not logo_path.exists():
+            # Already on the background pool: wait for the init worker's verdict instead of
+            # re-resolving and stat-ing the logo while its copy may still be in flight.
+            logo_path = self._logo_manager._initialize_default_logo().result(timeout=10.0)
+            if logo_path is None:
                 self._log_warning(
                     "Logo file missing", 
                     extra={
                         'action': 'preload_resources',
-                        'logo_path': str(logo_path)
+                        'logo_path': str(self._logo_manager._logo_path)
                     }
                 )
             
@@ -480,8 +534,6 @@ class PlaybackService:
         status, source, keep_pid = "idle", "idle", None
         try:
             with self._app_context():
-                from ..models import PlaybackStatus
-
                 session = getattr(self.db_session, "session", self.db_session)
                 row = None
                 try:
@@ -512,8 +564,7 @@ class PlaybackService:
                     pass
                 try:
                     if getattr(self, "socketio", None):
-                        self.socketio.emit(
-                            "playback_update",
+                        self._playlist_manager.emit_playback_update(
                             {
                                 "status": status,
                                 "playlist_id": keep_pid,
@@ -662,8 +713,6 @@ class PlaybackService:
                             pass
             finally:
                 try:
-                    from ..extensions import db
-
                     db.session.remove()
                 except Exception:
                     pass
@@ -690,8 +739,6 @@ class PlaybackService:
             try:
                 snap_src = None
                 with self._app_context():
-                    from ..models import PlaybackStatus
-
                     session = getattr(self.db_session, "session", self.db_session)
                     row = session.query(PlaybackStatus).get(1) if session is not None else None
                     snap_src = str(getattr(row, "source", None) or "").lower() if row else ""
@@ -737,8 +784,21 @@ class PlaybackService:
         except ValueError:
             pass
         interval = max(1.0, min(30.0, interval))
+        # mpv runs under systemd (not our child), so there is no SIGCHLD; the IPC
+        # reader's EOF is the exit event. After it, poll fast until the socket is back.
+        peer_closed = getattr(self._mpv_manager, "ipc_peer_closed", None)
+        if not isinstance(peer_closed, Event):
+            peer_closed = None
+        fast_until = 0.0
         while True:
-            time.sleep(interval)
+            if time.monotonic() < fast_until:
+                time.sleep(0.25)
+            elif peer_closed is not None:
+                if peer_closed.wait(interval):
+                    peer_closed.clear()
+                    fast_until = time.monotonic() + 15.0
+            else:
+                time.sleep(interval)
             ident = self._mpv_socket_identity()
             if ident is None:
                 continue
@@ -748,6 +808,7 @@ class PlaybackService:
             if ident == self._last_socket_identity:
                 continue
             self._last_socket_identity = ident
+            fast_until = 0.0
             if self._mpv_manager.was_recent_app_initiated_restart(within_sec=60.0):
                 continue
             if self._recover_lock.locked():
@@ -827,12 +888,15 @@ class PlaybackService:
                 },
             )
 
+    def _submit_recovery(self, fn) -> None:
+        try:
+            self._recover_pool.submit(fn)
+        except RuntimeError:
+            # Pool already shut down: process is exiting, nothing to recover.
+            pass
+
     def _on_slideshow_thread_crash(self) -> None:
-        Thread(
-            target=self._resume_slideshow_after_crash,
-            name="slideshow-crash-recover",
-            daemon=True,
-        ).start()
+        self._submit_recovery(self._resume_slideshow_after_crash)
 
     def _resume_slideshow_after_crash(self) -> None:
         try:
@@ -883,11 +947,7 @@ class PlaybackService:
 
     def _on_mpv_app_initiated_restart(self) -> None:
         """Resume playlist after hung-recovery restart (avoid racing socket-watch recover)."""
-        Thread(
-            target=self._recover_after_app_mpv_restart,
-            name="mpv-post-restart-recover",
-            daemon=True,
-        ).start()
+        self._submit_recovery(self._recover_after_app_mpv_restart)
 
     def _recover_after_app_mpv_restart(self) -> None:
         try:
@@ -914,6 +974,23 @@ class PlaybackService:
                 resume_advance=resume_advance,
             )
 
+    def recover_after_mpv_systemd_restart_async(self) -> None:
+        """Queue recover_after_mpv_systemd_restart on the recovery pool; never blocks the caller."""
+        self._submit_recovery(self._recover_after_requested_restart)
+
+    def _recover_after_requested_restart(self) -> None:
+        try:
+            self.recover_after_mpv_systemd_restart()
+        except Exception as e:
+            self._log_warning(
+                "MPV service restart: playback recover failed",
+                extra={
+                    'action': 'mpv_restart_recover',
+                    'error': str(e),
+                    'type': type(e).__name__
+                }
+            )
+
     def _recover_after_mpv_systemd_restart_impl(
         self,
         *,
@@ -1040,7 +1117,7 @@ class PlaybackService:
             self._clear_stale_playing_status()
             return False
         if not self._playback_active_marker_exists() and not self._playlist_manager_has_active_playback():
-            Thread(target=self._preload_resources, daemon=True).start()
+            self._bg_pool.submit(self._preload_resources)
         else:
             self._log_warning(
                 "MPV recover: playback looked active but no playlist_id to resume",
@@ -1130,7 +1207,6 @@ class PlaybackService:
         """Pick playlist to resume after mpv-only systemd restart."""
         with self._app_context():
             try:
-                from ..models import PlaybackStatus
                 session = getattr(self.db_session, "session", self.db_session)
                 row = session.query(PlaybackStatus).get(1)
                 if not row or not row.playlist_id:
@@ -1166,8 +1242,6 @@ class PlaybackService:
         rule_id: Optional[int] = None
         with self._app_context():
             try:
-                from ..models import PlaybackStatus
-
                 session = getattr(self.db_session, "session", self.db_session)
                 row = session.query(PlaybackStatus).get(1)
                 if row is not None:
@@ -1243,8 +1317,9 @@ class PlaybackService:
     def _transition_to_idle(self):
         """Transition to idle state with logo (Wayland: imv underneath; DRM: MPV loadfile)."""
         max_attempts = 2
-        delay = 1.0
         wayland = PlaybackConstants.is_wayland_backend()
+        deadline = time.monotonic() + _IDLE_TRANSITION_BUDGET_SEC
+        timed_out = False
 
         for attempt in range(max_attempts):
             try:
@@ -1277,7 +1352,12 @@ class PlaybackService:
                     },
                 )
 
-            time.sleep(delay)
+            if attempt < max_attempts - 1:
+                delay = full_jitter(attempt, base=0.5, cap=5.0)
+                if time.monotonic() + delay >= deadline:
+                    timed_out = True
+                    break
+                time.sleep(delay)
 
         if wayland:
             self._log_warning(
@@ -1292,8 +1372,13 @@ class PlaybackService:
                 "action": "transition_to_idle",
                 "status": "failed",
                 "max_attempts": max_attempts,
+                "timed_out": timed_out,
             },
         )
+        if timed_out:
+            raise PlaybackDeadlineError(
+                f"Could not establish idle state within {_IDLE_TRANSITION_BUDGET_SEC:.0f}s"
+            )
         raise RuntimeError("Could not establish idle state")
 
     # Делегированные методы
@@ -1308,7 +1393,7 @@ class PlaybackService:
     ) -> bool:
         """Play specified playlist"""
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = self._playlist_manager.play(
                 playlist_id,
                 start_index=start_index,
@@ -1324,7 +1409,7 @@ class PlaybackService:
                     'source': source,
                     'rule_id': rule_id,
                     'action': 'play',
-                    'duration_sec': round(time.time() - start_time, 3),
+                    'duration_sec': round(time.perf_counter() - start_time, 3),
                     'success': result
                 }
             )
@@ -1350,9 +1435,8 @@ class PlaybackService:
     ) -> Dict[str, Any]:
         """Emergency override: play playlist once, then resume previous if requested."""
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             with self._app_context():
-                from ..models import PlaybackStatus
                 session = getattr(self.db_session, "session", self.db_session)
                 row = session.query(PlaybackStatus).get(1)
                 if row is not None:
@@ -1372,7 +1456,7 @@ class PlaybackService:
                     "playlist_id": playlist_id,
                     "return_to_previous": return_to_previous,
                     "action": "play_override",
-                    "duration_sec": round(time.time() - start_time, 3),
+                    "duration_sec": round(time.perf_counter() - start_time, 3),
                     **(result if isinstance(result, dict) else {}),
                 },
             )
@@ -1392,7 +1476,6 @@ class PlaybackService:
     def handle_override_return(self) -> None:
         """Resume playback after override single-pass ends (§6.3)."""
         with self._app_context():
-            from ..models import PlaybackStatus
             session = getattr(self.db_session, "session", self.db_session)
             row = session.query(PlaybackStatus).get(1)
             if row is None:
@@ -1682,7 +1765,6 @@ class PlaybackService:
         except Exception:
             pass
         with self._app_context():
-            from ..models import PlaybackStatus
             session = getattr(self.db_session, "session", self.db_session)
             row = session.query(PlaybackStatus).get(1)
             # Always drop attribution before plan — ghost source=schedule + idle made
@@ -1731,43 +1813,30 @@ class PlaybackService:
             return self.enqueue_stop(source="schedule")
         return bool(self.enqueue_schedule_evaluate(ignore_manual=True))
 
-    def remote_pause(self, paused: Optional[bool] = None) -> Dict[str, Any]:
-        """Pause or resume current playlist playback via MPV."""
+    def _remote_call(self, action: str, error_message: str, *args, **kwargs) -> Dict[str, Any]:
+        """Delegate remote control ``action`` to PlaylistManager; errors become {success: False}."""
         try:
-            return self._playlist_manager.remote_pause(paused=paused)
+            return getattr(self._playlist_manager, action)(*args, **kwargs)
         except Exception as e:
-            self._log_error(
-                "Error pausing playback",
-                extra={"action": "remote_pause", "error": str(e)},
-            )
+            self._log_error(error_message, extra={"action": action, "error": str(e)})
             return {"success": False, "error": str(e)}
 
+    def remote_pause(self, paused: Optional[bool] = None) -> Dict[str, Any]:
+        """Pause or resume current playlist playback via MPV."""
+        return self._remote_call("remote_pause", "Error pausing playback", paused=paused)
+
     def remote_seek(self, position_sec: float) -> Dict[str, Any]:
         """Seek within the current media item."""
-        try:
-            return self._playlist_manager.remote_seek(position_sec)
-        except Exception as e:
-            self._log_error(
-                "Error seeking playback",
-                extra={"action": "remote_seek", "error": str(e)},
-            )
-            return {"success": False, "error": str(e)}
+        return self._remote_call("remote_seek", "Error seeking playback", position_sec)
 
     def remote_skip(self, direction: str = "next") -> Dict[str, Any]:
         """Skip to next/previous item in the active playlist loop."""
-        try:
-            return self._playlist_manager.remote_skip(direction=direction)
-        except Exception as e:
-            self._log_error(
-                "Error skipping playback item",
-                extra={"action": "remote_skip", "error": str(e)},
-            )
-            return {"success": False, "error": str(e)}
+        return self._remote_call("remote_skip", "Error skipping playback item", direction=direction)
 
     def stop(self, *, source: str = "manual", stop_generation: Optional[int] = None) -> bool:
         """Stop playback and return to idle state"""
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             # Suppress desync resume while halt/logo settle after Stop.
             self._last_desync_recover_ts = time.monotonic()
             result = self._playlist_manager.stop(
@@ -1779,7 +1848,7 @@ class PlaybackService:
                 extra={
                     'action': 'stop',
                     'source': source,
-                    'duration_sec': round(time.time() - start_time, 3),
+                    'duration_sec': round(time.perf_counter() - start_time, 3),
                     'success': result
                 }
             )
@@ -1799,12 +1868,13 @@ class PlaybackService:
         """MPV IPC diagnostics for monitoring (no auto vo recovery)."""
         pm = self._playlist_manager
         mgr = self._mpv_manager
-        vo_configured = mgr.get_property_light("vo-configured", timeout=2.0)
+        # One pipelined round-trip for all three reads; unavailable properties come back as None.
+        props = mgr.get_properties_snapshot(list(_HEALTH_PROPS), timeout=2.0) or {}
         checks: Dict[str, Any] = {
             "socket_ok": mgr._check_mpv_socket(timeout=2.0),
-            "vo_configured": vo_configured,
-            "pause": mgr.get_property_light("pause", timeout=2.0),
-            "path": mgr.get_property_light("path", timeout=2.0),
+            "vo_configured": props.get("vo-configured"),
+            "pause": props.get("pause"),
+            "path": props.get("path"),
             "playback_session_active": mgr._playback_session_active,
             "last_loaded_media_key": getattr(pm, "_last_loaded_media_key", None),
             "load_in_progress": getattr(pm, "_load_in_progress", False),
@@ -1824,7 +1894,7 @@ class PlaybackService:
     def get_status(self) -> Dict:
         """Get current playback status"""
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             status = self._playlist_manager.get_status()
             nxt = None
             if self._schedule_service is not None:
@@ -1848,7 +1918,7 @@ class PlaybackService:
                     "Retrieved playback status",
                     extra={
                         'action': 'get_status',
-                        'duration_sec': round(time.time() - start_time, 3)
+                        'duration_sec': round(time.perf_counter() - start_time, 3)
                     }
                 )
             except Exception:
@@ -1871,25 +1941,36 @@ class PlaybackService:
 
     def wait_for_mpv_ready(self, timeout=30, check_interval=1):
         """Явное ожидание готовности MPV"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.perf_counter()
+        probe = 0
+        while time.perf_counter() - start_time < timeout:
             if self._mpv_manager.check_health().get('responsive', False):
                 self._log_info(
                     "MPV is ready", 
                     extra={
                         'action': 'wait_for_mpv_ready',
-                        'duration_sec': round(time.time() - start_time, 3)
+                        'duration_sec': round(time.perf_counter() - start_time, 3)
                     }
                 )
                 return True
-            time.sleep(check_interval)
+            mpv = self._mpv_manager
+            if not mpv._mpv_socket_file_exists():
+                # No socket yet: wake on its creation (inotify) rather than on a timer.
+                # Capped at check_interval: without inotify wait_for_path is a plain sleep.
+                remaining = timeout - (time.perf_counter() - start_time)
+                wait_for_path(mpv.mpv_socket, min(remaining, float(check_interval)))
+                continue
+            # Geometric ramp 0.1s → check_interval: quick when mpv is nearly up, sparse when not.
+            step = min(float(check_interval), 0.1 * 1.6 ** probe)
+            probe += 1
+            time.sleep(max(0.0, min(equal_jitter(step), timeout - (time.perf_counter() - start_time))))
             
         self._log_error(
             "Timeout waiting for MPV to be ready", 
             extra={
                 'timeout': timeout, 
                 'action': 'wait_for_mpv_ready',
-                'duration_sec': round(time.time() - start_time, 3)
+                'duration_sec': round(time.perf_counter() - start_time, 3)
             }
         )
         return False
@@ -1897,7 +1978,7 @@ class PlaybackService:
     def play_file(self, file_info):
         """Воспроизводит файл с учетом его типа"""
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             if file_info.get('is_video'):
                 self._play_video_full(file_info['filename'])
                 self._log_info(
@@ -1905,7 +1986,7 @@ class PlaybackService:
                     extra={
                         'filename': file_info['filename'], 
                         'action': 'play_file',
-                        'duration_sec': round(time.time() - start_time, 3)
+                        'duration_sec': round(time.perf_counter() - start_time, 3)
                     }
                 )
             else:
@@ -1919,7 +2000,7 @@ class PlaybackService:
                         'filename': file_info['filename'], 
                         'duration': file_info['duration'],
                         'action': 'play_file',
-                        'duration_sec': round(time.time() - start_time, 3)
+                        'duration_sec': round(time.perf_counter() - start_time, 3)
                     }
                 )
         except Exception as e:
@@ -1930,7 +2011,7 @@ class PlaybackService:
                     'action': 'play_file',
                     'error': str(e),
                     'type': type(e).__name__,
-                    'duration_sec': round(time.time() - start_time, 3)
+                    'duration_sec': round(time.perf_counter() - start_time, 3)
                 }
             )
             raise
@@ -1,18 +1,96 @@
 import os
+import queue
 import re
 import subprocess
 import traceback
 import time
+from concurrent.futures import Executor
 from contextlib import nullcontext
 from threading import Event, Lock, Thread
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Sequence
 from pathlib import Path
 
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, object_session
+
+from .media_backoff import prune_stale_media_backoff
 from .playback_constants import PlaybackConstants
 from .playback_eof import PlaybackEofWaiter, is_external_stream_provider
 from .playback_network import PlaybackNetworkHelper
 from .playback_slideshow import PlaybackSlideshowLoop
+from .playback_utils import PlaybackUtils
 from .playback_play import PlaybackPlayRunner
+from .profile_management import AssignedProfileCache
+from ..extensions import db
+from ..models import PlaybackStatus, Playlist, PlaylistFiles
+
+# Bumped on every PlaybackStatus write from any session (schedule, sockets and
+# routes update the row directly), so the get_status row mirror never outlives a
+# change. Flush bumps once; the owning session's commit/rollback bumps again so a
+# read taken between flush and commit is not kept.
+_status_generation = 0
+_status_generation_lock = Lock()
+# Upper bound for the mirror even without events (raw SQL, another process).
+_STATUS_ROW_MIRROR_TTL_SEC = 5.0
+_STATUS_ROW_SELECT = (
+    select(
+        PlaybackStatus.status,
+        PlaybackStatus.source,
+        PlaybackStatus.playlist_id,
+        PlaybackStatus.rule_id,
+        PlaybackStatus.previous_source,
+        PlaybackStatus.previous_rule_id,
+        PlaybackStatus.previous_playlist_id,
+    )
+    .order_by(PlaybackStatus.id != 1, PlaybackStatus.id)
+    .limit(1)
+)
+# loop-file / loop-playlist values that mean mpv keeps looping on its own.
+_MPV_LOOP_ON = (True, "yes", "inf", "force")
+_STATUS_MPV_PROPS = ("loop-playlist", "loop-file", "path", "idle-active")
+# Pending socket.io emits; beyond this clients are hopelessly behind — drop, don't block.
+_EMIT_QUEUE_MAX = 256
+# Per-item current_media patches within this window go out as one merged playback_update.
+_STATUS_DEBOUNCE_SEC = 0.05
+
+
+def _bump_status_generation() -> None:
+    global _status_generation
+    with _status_generation_lock:
+        _status_generation += 1
+
+
+def _mark_status_write(session) -> None:
+    _bump_status_generation()
+    if session is not None:
+        session.info["playback_status_dirty"] = True
+
+
+def _on_status_row_write(_mapper, _connection, target) -> None:
+    _mark_status_write(object_session(target))
+
+
+for _evt in ("after_insert", "after_update", "after_delete"):
+    event.listen(PlaybackStatus, _evt, _on_status_row_write)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_on_bulk_status_write(orm_execute_state) -> None:
+    if orm_execute_state.is_select:
+        return
+    for mapper in orm_execute_state.all_mappers:
+        if mapper.class_ is PlaybackStatus:
+            _mark_status_write(orm_execute_state.session)
+            return
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _bump_on_status_txn_end(session) -> None:
+    if session.info.pop("playback_status_dirty", False):
+        _bump_status_generation()
+
 
 class PlaylistManager:
     def __init__(self, logger, socketio, upload_folder, db_session, mpv_manager, logo_manager):
@@ -28,6 +106,11 @@ class PlaylistManager:
         self._last_playback_state = {}
         self.tmp_dir = self.upload_folder / 'tmp'
         self.tmp_dir.mkdir(exist_ok=True)
+        # String forms for per-play/per-item path building (no Path allocation each time).
+        self.upload_folder_str = os.fspath(self.upload_folder)
+        self.tmp_dir_str = os.fspath(self.tmp_dir)
+        # (upload_folder st_mtime_ns, top-level file names): rescanned only when the dir changes.
+        self._upload_names_cache: Optional[tuple] = None
 
         self._play_thread: Optional[Thread] = None
         self._stop_event = Event()
@@ -36,6 +119,8 @@ class PlaylistManager:
         self._external_media_service = None
         self._content_cache = None
         self._settings_service = None
+        # Owned and shut down by PlaybackService (see set_settings_executor).
+        self._settings_executor: Optional[Executor] = None
         # Backoff per media key for unstable/blocked streams to avoid busy looping loadfile.
         # key -> {failures:int, next_try_monotonic:float, last_touch_monotonic:float}
         self._media_backoff: Dict[str, Dict[str, Any]] = {}
@@ -45,6 +130,19 @@ class PlaylistManager:
         self._preloaded_load_ipc_ok: bool = True
         self._current_media_label: Optional[str] = None
         self._current_media_lock = Lock()
+        self._emit_q: "queue.Queue[tuple[Optional[str], Any]]" = queue.Queue(maxsize=_EMIT_QUEUE_MAX)
+        self._emit_thread: Optional[Thread] = None
+        self._emit_thread_lock = Lock()
+        self._pending_status: Dict[str, Any] = {}
+        self._pending_status_lock = Lock()
+        # Monotonic flush deadline for _pending_status; the emitter thread waits on it.
+        self._status_deadline: Optional[float] = None
+        # Bumps on every explicit status emit: a debounced patch taken before it is stale.
+        self._status_gen = 0
+        # Last settings shipped in playback_update: later emits carry only the delta.
+        self._last_emitted_settings: Optional[Dict[str, Any]] = None
+        self._settings_version = 0
+        self._emitted_settings_lock = Lock()
         self._loop_item_index: Optional[int] = None
         self._loop_items_count: int = 0
         self._loop_position_lock = Lock()
@@ -76,6 +174,9 @@ class PlaylistManager:
         self._last_good_items_count: int = 0
         self._last_good_playlist_id: Optional[int] = None
         self._status_snapshot_cache: Dict[str, Any] = {}
+        # (generation, monotonic ts, row fields) — see _playback_status_row().
+        self._status_row_mirror: Optional[tuple] = None
+        self._assigned_profiles = AssignedProfileCache()
         self._status_snapshot_ts: float = 0.0
         self._playback_mute_lock = Lock()
         self._playback_item_muted = False
@@ -202,8 +303,6 @@ class PlaylistManager:
         except Exception:
             pass
         try:
-            from ..extensions import db
-
             db.session.remove()
         except Exception:
             pass
@@ -295,6 +394,10 @@ class PlaylistManager:
         except Exception:
             pass
 
+    def set_settings_executor(self, executor: Optional[Executor]) -> None:
+        """Pool for the profile settings batch that play() overlaps with item resolution."""
+        self._settings_executor = executor
+
     def set_override_return_handler(self, handler: Optional[Callable[[], None]]) -> None:
         """Schedule engine hook after override single-pass ends (wired in D2.2)."""
         self._on_override_return = handler
@@ -308,9 +411,26 @@ class PlaylistManager:
         rule_id: Optional[int] = None,
         clear_rule: bool = False,
     ) -> None:
-        from ..models import PlaybackStatus
-
-        playback = self.db_session.query(PlaybackStatus).get(1) or PlaybackStatus(id=1)
+        if self.db_session.get_bind().dialect.name == "sqlite":
+            # One INSERT .. ON CONFLICT DO UPDATE on the singleton row: no SELECT first.
+            values: Dict[str, Any] = {"playlist_id": playlist_id, "status": status}
+            if source is not None:
+                values["source"] = source
+            if clear_rule:
+                values["rule_id"] = None
+            elif rule_id is not None:
+                values["rule_id"] = rule_id
+            stmt = sqlite_insert(PlaybackStatus).values(id=1, **values)
+            self.db_session.execute(
+                stmt.on_conflict_do_update(index_elements=[PlaybackStatus.id], set_=values)
+            )
+            self.db_session.commit()
+            return
+        playback = self.db_session.query(PlaybackStatus).get(1)
+        if playback is None:
+            # Only a fresh row needs add(); the existing one is already in the session.
+            playback = PlaybackStatus(id=1)
+            self.db_session.add(playback)
         playback.playlist_id = playlist_id
         playback.status = status
         if source is not None:
@@ -319,7 +439,6 @@ class PlaylistManager:
             playback.rule_id = None
         elif rule_id is not None:
             playback.rule_id = rule_id
-        self.db_session.add(playback)
         self.db_session.commit()
 
     def _sync_settings_audio_route_to_mpv(self, *, cycle_ao: bool = False) -> bool:
@@ -515,15 +634,8 @@ class PlaylistManager:
     def _log_mpv_audio_state(self, *, event: str, settings_volume: Optional[float] = None) -> None:
         """Best-effort readback for field diagnostics."""
         try:
-            props = ("audio-device", "mute", "volume", "ao", "pause", "time-pos", "audio-codec-name", "aid")
-            snap: Dict[str, Any] = {}
-            for prop in props:
-                resp = self._mpv_manager._send_command(
-                    {"command": ["get_property", prop]},
-                    timeout=1.5,
-                    max_attempts=1,
-                )
-                snap[prop] = (resp or {}).get("data")
+            props = ["audio-device", "mute", "volume", "ao", "pause", "time-pos", "audio-codec-name", "aid"]
+            snap: Dict[str, Any] = self._mpv_manager.get_properties_snapshot(props, timeout=1.5)
             extra: Dict[str, Any] = {"event": event, **snap}
             if settings_volume is not None:
                 extra["settings_volume"] = settings_volume
@@ -593,8 +705,6 @@ class PlaylistManager:
         pid = self._active_playlist_id
         if pid and key:
             try:
-                from ..models import PlaylistFiles
-
                 with self._app_context():
                     row = (
                         self.db_session.query(PlaylistFiles)
@@ -666,8 +776,6 @@ class PlaylistManager:
         if not key:
             return
         try:
-            from ..models import PlaylistFiles
-
             with self._app_context():
                 row = (
                     self.db_session.query(PlaylistFiles)
@@ -738,6 +846,29 @@ class PlaylistManager:
         with self._current_media_lock:
             return self._current_media_label
 
+    def _playlist_play_rows(self, playlist_id: int) -> Optional[tuple]:
+        """(name, [(file_name, order, duration, muted), ...]) для play(); None — плейлиста нет.
+
+        Один outer-join SELECT по колонкам: ни Playlist, ни PlaylistFiles не гидратируются.
+        """
+        rows = (
+            self.db_session.query(
+                Playlist.name,
+                PlaylistFiles.file_name,
+                PlaylistFiles.order,
+                PlaylistFiles.duration,
+                PlaylistFiles.muted,
+            )
+            .outerjoin(PlaylistFiles, PlaylistFiles.playlist_id == Playlist.id)
+            .filter(Playlist.id == playlist_id)
+            .order_by(PlaylistFiles.order)
+            .all()
+        )
+        if not rows:
+            return None
+        # Playlist without files: the outer join yields one row of NULLs.
+        return rows[0][0], [tuple(r[1:]) for r in rows if r[1] is not None]
+
     def _publish_current_media(self, playlist_id: int, item: Dict[str, Any]) -> None:
         label = self._item_media_label(item)
         with self._current_media_lock:
@@ -745,15 +876,13 @@ class PlaylistManager:
                 return
             self._current_media_label = label or None
         try:
-            if self.socketio:
-                self.socketio.emit(
-                    "playback_update",
-                    {
-                        "status": "playing",
-                        "playlist_id": playlist_id,
-                        "current_media": label or None,
-                    },
-                )
+            self._schedule_emit(
+                {
+                    "status": "playing",
+                    "playlist_id": playlist_id,
+                    "current_media": label or None,
+                }
+            )
         except Exception:
             pass
 
@@ -831,15 +960,14 @@ class PlaylistManager:
             except Exception:
                 pass
 
-    def _write_local_video_m3u(
+    def _local_video_playlist_paths(
         self,
         playlist_id: int,
         items: List[Dict[str, Any]],
         start_index: int,
-    ) -> Path:
+    ) -> List[str]:
         start_index = int(start_index or 0) % len(items)
-        lines = ["#EXTM3U\n"]
-        included = 0
+        paths: List[str] = []
         for offset in range(len(items)):
             idx = (start_index + offset) % len(items)
             path_str = str(items[idx]["path"])
@@ -855,15 +983,77 @@ class PlaylistManager:
                     },
                 )
                 continue
-            path = Path(path_str).resolve()
-            lines.append(f"{path}\n")
-            included += 1
-        if included == 0:
+            paths.append(os.path.realpath(path_str))
+        if not paths:
             raise ValueError(f"Playlist {playlist_id}: no valid local video files for M3U")
-        dest = self.tmp_dir / f"local-playlist-{playlist_id}.m3u"
-        dest.write_text("".join(lines), encoding="utf-8")
+        return paths
+
+    def _write_local_video_m3u(self, playlist_id: int, paths: List[str]) -> str:
+        dest = os.path.join(self.tmp_dir_str, f"local-playlist-{playlist_id}.m3u")
+        # Replaced atomically: mpv may still be reading the previous list on a quick re-play.
+        PlaybackUtils.write_file_atomic(
+            dest, ("#EXTM3U\n" + "".join(f"{p}\n" for p in paths)).encode("utf-8")
+        )
         return dest
 
+    def _load_local_video_playlist(
+        self,
+        playlist_id: int,
+        items: List[Dict[str, Any]],
+        start_index: int,
+        *,
+        media_key: str,
+    ) -> bool:
+        """
+        Load the local video playlist into mpv: first file via ``_safe_loadfile``, the rest
+        as one pipelined ``loadfile … append`` batch (no tmp M3U write on SD/eMMC).
+        The appends go out right after loadfile, before the vo-configured wait, so a short
+        first clip cannot end (and drop mpv to idle) before the playlist exists.
+        Very long playlists, or appends mpv rejects, fall back to the M3U file.
+        """
+        paths = self._local_video_playlist_paths(playlist_id, items, start_index)
+        if len(paths) <= PlaybackConstants.LOCAL_PLAYLIST_IPC_MAX_ITEMS:
+            # Paths are already validated by _local_video_playlist_paths.
+            if not self._safe_loadfile(
+                paths[0],
+                media_key=media_key,
+                is_video=True,
+                timeout=15.0,
+                wait_vo=False,
+                validated=True,
+            ):
+                return False
+            if len(paths) == 1 or self._append_local_video_paths(paths[1:]):
+                return self._wait_loadfile_vo(paths[0], media_key=media_key)
+            self.logger.warning(
+                "Local playlist append batch failed; falling back to M3U",
+                extra={"playlist_id": playlist_id, "items": len(paths)},
+            )
+        m3u_path = self._write_local_video_m3u(playlist_id, paths)
+        return self._safe_loadfile(
+            m3u_path,
+            media_key=media_key,
+            is_video=True,
+            timeout=15.0,
+        )
+
+    def _append_local_video_paths(self, paths: List[str], *, timeout: float = 15.0) -> bool:
+        """
+        Queue ``paths`` after the current file in one pipelined batch.
+
+        ``None`` from _send_commands (IPC lock busy / reconnecting) is retried until
+        ``timeout``: falling back to the M3U would restart the clip that is already playing.
+        """
+        commands = [{"command": self._mpv_loadfile_command(p, "append")} for p in paths]
+        deadline = time.monotonic() + float(timeout)
+        while True:
+            results = self._mpv_manager._send_commands(commands, timeout=float(timeout))
+            if results is not None:
+                return all(isinstance(r, dict) and r.get("error") == "success" for r in results)
+            if self._stop_event.is_set() or time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+
     def _apply_item_mute_property(self, item: Dict[str, Any], *, profile_muted: bool) -> None:
         item_muted = bool(item.get("muted", False))
         self._set_playback_mute_context(item_muted=item_muted, profile_muted=profile_muted)
@@ -929,6 +1119,120 @@ class PlaylistManager:
                 "post_mpv_restart_window": self._in_post_mpv_restart_window(),
             }
 
+    def _emit(self, event_name: str, payload: Any) -> None:
+        """Queue a socket.io emit; fan-out to clients runs on the emitter thread, not under play/IPC locks."""
+        if not self.socketio:
+            return
+        if event_name == "playback_update" and isinstance(payload, dict):
+            # Take the pending patch and enqueue under one lock so a debounced flush
+            # can never land after (and override) this explicit update.
+            with self._pending_status_lock:
+                pending, self._pending_status = self._pending_status, {}
+                self._status_deadline = None
+                if "status" in payload:
+                    # Stop/status change: whatever was debounced before it is stale.
+                    self._status_gen += 1
+                    pending = {}
+                if pending:
+                    payload = {**pending, **payload}
+                self._enqueue_emit(event_name, payload)
+            return
+        self._enqueue_emit(event_name, payload)
+
+    def emit_playback_update(self, payload: Dict[str, Any]) -> None:
+        """Queued playback_update for collaborators (PlaybackService, play runner)."""
+        self._emit("playback_update", payload)
+
+    def _settings_emit_fields(self, settings: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """playback_update settings fields: full snapshot on the first emit, then only changed keys."""
+        current = dict(settings or {})
+        with self._emitted_settings_lock:
+            last = self._last_emitted_settings
+            self._last_emitted_settings = current
+            self._settings_version += 1
+            version = self._settings_version
+        if last is None:
+            return {"settings": current, "settings_version": version}
+        fields: Dict[str, Any] = {
+            "settings_delta": {k: v for k, v in current.items() if k not in last or last[k] != v},
+            "settings_version": version,
+        }
+        removed = [k for k in last if k not in current]
+        if removed:
+            fields["settings_removed"] = removed
+        return fields
+
+    def settings_snapshot(self) -> Dict[str, Any]:
+        """Last emitted settings in full with their settings_version (client resync after a delta gap)."""
+        with self._emitted_settings_lock:
+            return {
+                "settings": dict(self._last_emitted_settings or {}),
+                "settings_version": self._settings_version,
+            }
+
+    def _schedule_emit(self, patch: Dict[str, Any]) -> None:
+        """Merge a playback_update patch; one emit per _STATUS_DEBOUNCE_SEC window (clients merge patches too)."""
+        if not self.socketio:
+            return
+        with self._pending_status_lock:
+            self._pending_status.update(patch)
+            if self._status_deadline is not None:
+                return
+            self._status_deadline = time.monotonic() + _STATUS_DEBOUNCE_SEC
+            # Wake the emitter so it starts waiting on the new deadline.
+            self._enqueue_emit(None, None)
+
+    def _flush_status(self) -> None:
+        """Emitter thread: ship the debounced patch unless an explicit status emit superseded it."""
+        with self._pending_status_lock:
+            pending, self._pending_status = self._pending_status, {}
+            self._status_deadline = None
+            gen = self._status_gen
+        if not pending:
+            return
+        with self._pending_status_lock:
+            if gen != self._status_gen:
+                return
+        try:
+            self.socketio.emit("playback_update", pending)
+        except Exception:
+            pass
+
+    def _enqueue_emit(self, event_name: Optional[str], payload: Any) -> None:
+        try:
+            self._emit_q.put_nowait((event_name, payload))
+        except queue.Full:
+            # A full queue keeps the emitter busy; it re-checks the deadline after each item.
+            if event_name is not None:
+                self.logger.debug("socket emit queue full; dropping event", extra={"event_name": event_name})
+            return
+        if self._emit_thread is None or not self._emit_thread.is_alive():
+            with self._emit_thread_lock:
+                if self._emit_thread is None or not self._emit_thread.is_alive():
+                    self._emit_thread = Thread(target=self._emit_loop, name="dsign-socket-emit", daemon=True)
+                    self._emit_thread.start()
+
+    def _emit_loop(self) -> None:
+        while True:
+            with self._pending_status_lock:
+                deadline = self._status_deadline
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                self._flush_status()
+                continue
+            try:
+                event_name, payload = self._emit_q.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            if event_name is None:
+                # Wake-up from _schedule_emit: loop round to pick up the deadline.
+                continue
+            try:
+                self.socketio.emit(event_name, payload)
+            except Exception:
+                # Best-effort: sockets being down must not kill the emitter.
+                pass
+
     def _clear_current_media_label(self, *, emit: bool = True, playlist_id: Optional[int] = None) -> None:
         with self._current_media_lock:
             self._current_media_label = None
@@ -938,7 +1242,7 @@ class PlaylistManager:
             payload: Dict[str, Any] = {"current_media": None}
             if playlist_id is not None:
                 payload["playlist_id"] = playlist_id
-            self.socketio.emit("playback_update", payload)
+            self._schedule_emit(payload)
         except Exception:
             pass
 
@@ -950,10 +1254,30 @@ class PlaylistManager:
         is_audio = suffix in PlaybackConstants.AUDIO_EXTENSIONS
         return is_video, is_audio
 
-    def _resolve_playlist_item_path(self, file_name: str) -> Optional[Dict[str, Any]]:
+    def _upload_folder_names(self) -> frozenset:
+        """Top-level file names in upload_folder; one stat() while the directory mtime is unchanged."""
+        try:
+            mtime_ns = os.stat(self.upload_folder_str).st_mtime_ns
+        except OSError:
+            return frozenset()
+        cached = self._upload_names_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            with os.scandir(self.upload_folder_str) as it:
+                names = frozenset(e.name for e in it if e.is_file())
+        except OSError:
+            return frozenset()
+        self._upload_names_cache = (mtime_ns, names)
+        return names
+
+    def _resolve_playlist_item_path(
+        self, file_name: str, present: Optional[frozenset] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Convert a playlist file_name into a playback dict: {path,is_video,is_audio,duration,muted}.
         Supports both local filenames and synthetic external keys ext-<id>.
+        ``present`` is a :meth:`_upload_folder_names` snapshot; listed local names skip stat().
         """
         if not file_name:
             return None
@@ -990,12 +1314,14 @@ class PlaylistManager:
             }
 
         # Local file
-        file_path = self.upload_folder / str(file_name)
-        if not file_path.exists():
+        file_name = str(file_name)
+        file_path = os.path.join(self.upload_folder_str, file_name)
+        # Misses (nested names, a file added within the same mtime tick) are confirmed by stat().
+        if not (present is not None and file_name in present) and not os.path.exists(file_path):
             return None
-        ext = file_path.suffix.lower()
+        ext = os.path.splitext(file_path)[1]
         is_video, is_audio = self._classify_local_media_suffix(ext)
-        return {"path": str(file_path), "is_video": is_video, "is_audio": is_audio}
+        return {"path": file_path, "is_video": is_video, "is_audio": is_audio}
 
     def _refresh_item_playback_path(self, item: Dict[str, Any]) -> bool:
         """
@@ -1148,7 +1474,7 @@ class PlaylistManager:
                 pass
         try:
             if self.socketio:
-                self.socketio.emit(
+                self._emit(
                     "playback_update",
                     {
                         "status": "idle",
@@ -1261,14 +1587,16 @@ class PlaylistManager:
         per_file_opts: Optional[Dict[str, Any]] = None,
         timeout: float = 10.0,
         wait_vo: bool = True,
+        validated: bool = False,
     ) -> bool:
         """
         A3: exists + ffprobe (local video/audio) → loadfile → wait vo-configured.
         Network/ytdl paths skip ffprobe; caller handles stream-open separately.
+        ``validated``: the caller already ran _validate_local_media_path on ``path``.
         """
         path_s = str(path or "")
         is_network = self._is_network_stream_path(path_s)
-        if not is_network:
+        if not is_network and not validated:
             ok, reason = self._validate_local_media_path(
                 path_s, is_video=is_video, is_audio=is_audio
             )
@@ -1299,15 +1627,19 @@ class PlaylistManager:
             return False
 
         if wait_vo and is_video and not is_network:
-            # Wayland: vo-configured often lags after idle/stop; loadfile success is enough.
-            if PlaybackConstants.is_wayland_backend():
-                return True
-            if not self._wait_vo_configured(5.0):
-                self.logger.warning(
-                    "safe_loadfile: vo-configured timeout",
-                    extra={"path": path_s[:200], "media_key": media_key},
-                )
-                return False
+            return self._wait_loadfile_vo(path_s, media_key=media_key)
+        return True
+
+    def _wait_loadfile_vo(self, path: str, *, media_key: str) -> bool:
+        # Wayland: vo-configured often lags after idle/stop; loadfile success is enough.
+        if PlaybackConstants.is_wayland_backend():
+            return True
+        if not self._wait_vo_configured(5.0):
+            self.logger.warning(
+                "safe_loadfile: vo-configured timeout",
+                extra={"path": str(path)[:200], "media_key": media_key},
+            )
+            return False
         return True
 
     def _issue_ytdl_loadfile(self, load_cmd: List[Any], *, media_key: str) -> None:
@@ -1409,6 +1741,22 @@ class PlaylistManager:
         except Exception:
             return None
 
+    def _mpv_get_light_many(self, props: Sequence[str], *, timeout: float = 1.0) -> Dict[str, Any]:
+        """Several light reads as one pipelined IPC round-trip; per-property reads if the batch fails."""
+        try:
+            replies = self._mpv_manager._send_commands(
+                [{"command": ["get_property", p]} for p in props],
+                timeout=timeout,
+            )
+        except Exception:
+            replies = None
+        if isinstance(replies, list) and len(replies) == len(props):
+            return {
+                p: r.get("data") if isinstance(r, dict) and r.get("error") == "success" else None
+                for p, r in zip(props, replies)
+            }
+        return {p: self._mpv_get_light(p, timeout=timeout) for p in props}
+
     def _mark_stall_restart_pending(self) -> None:
         with self._stall_restart_lock:
             self._stall_restart_pending = True
@@ -1730,8 +2078,8 @@ class PlaylistManager:
             if active:
                 marker.parent.mkdir(parents=True, exist_ok=True)
                 marker.write_text("1", encoding="utf-8")
-            elif marker.is_file():
-                marker.unlink()
+            else:
+                marker.unlink(missing_ok=True)
         except Exception as exc:
             self.logger.warning(
                 "playback-active marker failed",
@@ -1937,7 +2285,6 @@ class PlaylistManager:
             thread_target = self._run_single_local_video_loop
             thread_args: tuple = (playlist_id, items, profile_muted)
         else:
-            m3u_path = self._write_local_video_m3u(playlist_id, items, start_index)
             ordered_indices = [(start_index + offset) % len(items) for offset in range(len(items))]
             first_item = items[ordered_indices[0]]
             media_key = f"local-m3u-{playlist_id}"
@@ -1948,13 +2295,13 @@ class PlaylistManager:
                 prefetch=True,
             )
             self._prepare_mpv_audio_before_loadfile()
-            if not self._safe_loadfile(
-                str(m3u_path),
+            if not self._load_local_video_playlist(
+                playlist_id,
+                items,
+                start_index,
                 media_key=media_key,
-                is_video=True,
-                timeout=15.0,
             ):
-                raise RuntimeError(f"safe_loadfile failed for local M3U: {m3u_path}")
+                raise RuntimeError(f"safe_loadfile failed for local playlist {playlist_id}")
             self._apply_post_loadfile_playback_props(
                 muted=self._effective_playback_muted(
                     item_muted=bool(first_item.get("muted", False)),
@@ -2007,7 +2354,7 @@ class PlaylistManager:
 
         try:
             if self.socketio:
-                self.socketio.emit(
+                self._emit(
                     "playback_update",
                     {
                         "status": "playing",
@@ -2016,7 +2363,7 @@ class PlaylistManager:
                         "rule_id": rule_id if source == "schedule" else None,
                         "current_media": self._get_current_media_label(),
                         "playlist": {"id": int(playlist_id), "name": str(name or "")},
-                        "settings": profile_settings,
+                        **self._settings_emit_fields(profile_settings),
                         "playback_mode": mode,
                     },
                 )
@@ -2172,16 +2519,8 @@ class PlaylistManager:
 
     def _mpv_loop_props_on(self) -> bool:
         """A1/A2 leave loop-* on after the Python thread dies — Stop must clear them."""
-        on_vals = (True, "yes", "inf", "force")
-        try:
-            lf = self._mpv_get_light("loop-file", timeout=1.0)
-        except Exception:
-            lf = None
-        try:
-            lp = self._mpv_get_light("loop-playlist", timeout=1.0)
-        except Exception:
-            lp = None
-        return lf in on_vals or lp in on_vals
+        loops = self._mpv_get_light_many(("loop-file", "loop-playlist"), timeout=1.0)
+        return loops["loop-file"] in _MPV_LOOP_ON or loops["loop-playlist"] in _MPV_LOOP_ON
 
     def _mpv_content_still_on_air(self) -> bool:
         """True if mpv still shows real content after a Stop/halt attempt."""
@@ -2521,8 +2860,6 @@ class PlaylistManager:
                 self._media_backoff.pop(media_key, None)
 
     def _prune_media_backoff(self, *, now_mono: Optional[float] = None) -> int:
-        from .media_backoff import prune_stale_media_backoff
-
         removed = prune_stale_media_backoff(self._media_backoff, now=now_mono)
         if removed:
             self.logger.debug(
@@ -2786,8 +3123,6 @@ class PlaylistManager:
         join_timeout: float = 2.0,
         stop_generation: Optional[int] = None,
     ) -> bool:
-        from ..models import PlaybackStatus
-
         try:
             # Fast path: Play already bumped run_id after enqueue_stop — do not tear
             # down the new play (that left Stop OK / Play dead).
@@ -2877,7 +3212,7 @@ class PlaylistManager:
                             emit_playlist = (
                                 None if source == "schedule" else last_playlist_id
                             )
-                            self.socketio.emit(
+                            self._emit(
                                 "playback_update",
                                 {
                                     "status": emit_status,
@@ -3087,8 +3422,6 @@ class PlaylistManager:
                 return
         except Exception:
             pass
-        from ..models import PlaybackStatus
-
         try:
             with self._control_lock:
                 row = self.db_session.query(PlaybackStatus).get(1)
@@ -3113,7 +3446,7 @@ class PlaylistManager:
                 )
             try:
                 if self.socketio:
-                    self.socketio.emit(
+                    self._emit(
                         "playback_update",
                         {
                             "status": status,
@@ -3166,8 +3499,6 @@ class PlaylistManager:
         """
         if self._any_play_threads_alive():
             return
-        from ..models import PlaybackStatus
-
         src = str(claim_source or "manual").lower()
         if src in ("manual", "override"):
             status, source, keep_pid = "stopped", "manual", int(playlist_id)
@@ -3196,7 +3527,7 @@ class PlaylistManager:
                 )
             try:
                 if self.socketio:
-                    self.socketio.emit(
+                    self._emit(
                         "playback_update",
                         {
                             "status": status,
@@ -3230,21 +3561,13 @@ class PlaylistManager:
             )
 
     def _mpv_showing_idle_logo(self) -> bool:
-        try:
-            idle = self._mpv_get_light("idle-active", timeout=1.0)
-        except Exception:
-            idle = None
-        try:
-            path = self._mpv_get_light("path", timeout=1.0)
-        except Exception:
-            path = None
+        light = self._mpv_get_light_many(("idle-active", "path"), timeout=1.0)
+        idle, path = light["idle-active"], light["path"]
         if idle is True and (not path or not str(path).strip()):
             return True
         return self._mpv_path_is_idle_logo(path)
 
     def _remote_playback_snapshot(self) -> Dict[str, Any]:
-        from ..models import PlaybackStatus
-
         row = self.db_session.query(PlaybackStatus).first()
         thread_alive = self._any_play_threads_alive()
         return {
@@ -3272,7 +3595,12 @@ class PlaylistManager:
         path = self._mpv_get_light("path", timeout=2.0)
         if self._mpv_path_is_network(path):
             return True
-        idle = self._mpv_get_light("idle-active", timeout=2.0)
+        return self._mpv_media_on(path, self._mpv_get_light("idle-active", timeout=2.0))
+
+    def _mpv_media_on(self, path: Any, idle: Any) -> bool:
+        """_mpv_has_active_media verdict from already-read ``path`` / ``idle-active``."""
+        if self._mpv_path_is_network(path):
+            return True
         if idle is True:
             return False
         if not path or not str(path).strip():
@@ -3434,11 +3762,34 @@ class PlaylistManager:
             return (int(item_index) - 1) % int(items_count)
         return None
 
+    def _playback_status_row(self) -> Dict[str, Any]:
+        """PlaybackStatus fields for get_status; DB is read only after a write or TTL expiry."""
+        gen = _status_generation
+        now = time.monotonic()
+        mirror = self._status_row_mirror
+        if mirror is not None and mirror[0] == gen and (now - mirror[1]) < _STATUS_ROW_MIRROR_TTL_SEC:
+            return mirror[2]
+        # Core column SELECT: no ORM instance/identity map for a seven-field read.
+        # Singleton row id=1 first; any other row only if it is missing (legacy DBs).
+        status = self.db_session.execute(_STATUS_ROW_SELECT).first()
+        if status is None:
+            row: Dict[str, Any] = {}
+        else:
+            row = {
+                "status": status.status,
+                "source": status.source,
+                "playlist_id": status.playlist_id,
+                "rule_id": status.rule_id,
+                "previous_source": status.previous_source,
+                "previous_rule_id": status.previous_rule_id,
+                "previous_playlist_id": status.previous_playlist_id,
+            }
+        self._status_row_mirror = (gen, now, row)
+        return row
+
     def get_status(self) -> Dict:
         """Get current playback status"""
-        from ..models import PlaybackStatus
-        
-        status = self.db_session.query(PlaybackStatus).get(1) or self.db_session.query(PlaybackStatus).first()
+        status = self._playback_status_row()
         cache_state: Dict[str, Any] = {}
         if self._content_cache is not None:
             try:
@@ -3460,26 +3811,20 @@ class PlaylistManager:
             mpv_session = bool(self._mpv_manager._playback_session_active)
         except Exception:
             mpv_session = False
-        try:
-            loop_pl = self._mpv_get_light("loop-playlist", timeout=1.0)
-        except Exception:
-            loop_pl = None
-        loop_playlist_on = loop_pl in (True, "yes", "inf", "force")
-        try:
-            loop_fl = self._mpv_get_light("loop-file", timeout=1.0)
-        except Exception:
-            loop_fl = None
-        loop_file_on = loop_fl in (True, "yes", "inf", "force")
-        try:
-            mpv_path = str(self._mpv_get_light("path", timeout=1.0) or "")
-        except Exception:
-            mpv_path = ""
+        # One pipelined round-trip for every mpv property get_status looks at.
+        light = self._mpv_get_light_many(_STATUS_MPV_PROPS, timeout=1.0)
+        loop_playlist_on = light["loop-playlist"] in _MPV_LOOP_ON
+        loop_file_on = light["loop-file"] in _MPV_LOOP_ON
+        mpv_path = str(light["path"] or "")
         logo_path = self._mpv_path_is_idle_logo(mpv_path)
         # Orphan: mpv still looping playlist/media while DB/thread say idle.
         # A2 schedule uses loop-file=inf — must count even when session marker is cleared.
-        db_playing = str(getattr(status, "status", None) or "").lower() == "playing"
+        db_playing = str(status.get("status") or "").lower() == "playing"
         try:
-            media_on = bool(self._mpv_has_active_media()) and not logo_path
+            opening = getattr(self._mpv_manager, "_playback_stream_opening", False) is True
+            media_on = (
+                opening or self._mpv_media_on(light["path"], light["idle-active"])
+            ) and not logo_path
         except Exception:
             media_on = False
         orphan_mpv = (not db_playing) and (not thread_alive) and (
@@ -3513,10 +3858,10 @@ class PlaylistManager:
         if starting and db_playing:
             stale_playing = False
 
-        out_status = status.status if status else None
-        out_source = (status.source or 'idle') if status else 'idle'
-        out_playlist_id = status.playlist_id if status else None
-        out_rule_id = status.rule_id if status else None
+        out_status = status.get("status")
+        out_source = (status.get("source") or 'idle') if status else 'idle'
+        out_playlist_id = status.get("playlist_id")
+        out_rule_id = status.get("rule_id")
         if stale_playing:
             # Heal UI immediately; desync watch will clear DB shortly.
             out_status = "idle"
@@ -3529,9 +3874,9 @@ class PlaylistManager:
             'playlist_id': out_playlist_id,
             'source': out_source,
             'rule_id': out_rule_id,
-            'previous_source': status.previous_source if status else None,
-            'previous_rule_id': status.previous_rule_id if status else None,
-            'previous_playlist_id': status.previous_playlist_id if status else None,
+            'previous_source': status.get("previous_source"),
+            'previous_rule_id': status.get("previous_rule_id"),
+            'previous_playlist_id': status.get("previous_playlist_id"),
             'item_index': item_index,
             'item_count': item_count,
             'media_key': media_key,
@@ -3545,7 +3890,7 @@ class PlaylistManager:
             'stale_playing': bool(stale_playing),
             'idle_logo': bool(logo_path),
             'current_media': None if stale_playing else self._get_current_media_label(),
-            'settings': self._mpv_manager._current_settings,
+            **self.settings_snapshot(),
             'network_health': self.get_network_playback_health(),
             'cache_state': cache_state,
             'override': {
@@ -7,7 +7,12 @@ from typing import Dict, List, Optional, Union, Any
 from flask import current_app
 from sqlalchemy import func, text
 from ..models import Playlist, PlaylistFiles
-from .logger import ServiceLogger
+from .logger import ServiceLogger, merge_log_extra, module_log_extra
+
+_LOG_BASE_EXTRA = module_log_extra('PlaylistService')
+# Characters not allowed in exported M3U file names (replaced with "_").
+_UNSAFE_M3U_NAME_RE = re.compile(r'[\\/*?:"<>|]')
+
 
 class PlaylistService:
     def __init__(self, db_session, logger: Optional[Union[logging.Logger, ServiceLogger]] = None):
@@ -33,31 +38,19 @@ class PlaylistService:
 
     def _log_error(self, message: str, exc_info: bool = True, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для логирования ошибок"""
-        extra_data = {'module': 'PlaylistService'}
-        if extra:
-            extra_data.update(extra)
-        self.logger.error(message, exc_info=exc_info, extra=extra_data)
+        self.logger.error(message, exc_info=exc_info, extra=merge_log_extra(_LOG_BASE_EXTRA, extra))
 
     def _log_info(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для информационных логов"""
-        extra_data = {'module': 'PlaylistService'}
-        if extra:
-            extra_data.update(extra)
-        self.logger.info(message, extra=extra_data)
+        self.logger.info(message, extra=merge_log_extra(_LOG_BASE_EXTRA, extra))
 
     def _log_warning(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для предупреждений"""
-        extra_data = {'module': 'PlaylistService'}
-        if extra:
-            extra_data.update(extra)
-        self.logger.warning(message, extra=extra_data)
+        self.logger.warning(message, extra=merge_log_extra(_LOG_BASE_EXTRA, extra))
 
     def _log_debug(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для отладочных логов"""
-        extra_data = {'module': 'PlaylistService'}
-        if extra:
-            extra_data.update(extra)
-        self.logger.debug(message, extra=extra_data)
+        self.logger.debug(message, extra=merge_log_extra(_LOG_BASE_EXTRA, extra))
 
     def _safe_parse_datetime(self, dt_value) -> Optional[datetime]:
         """Безопасный парсер дат с логированием"""
@@ -305,7 +298,15 @@ class PlaylistService:
             export_dir = config['M3U_EXPORT_DIR']
             base_url = config.get('MEDIA_BASE_URL', 'http://localhost').rstrip('/')
             
-            m3u_content = "#EXTM3U\n"
+            media_root = config['MEDIA_ROOT']
+            # One directory scan instead of a stat() per playlist item.
+            try:
+                with os.scandir(media_root) as it:
+                    present = {e.name for e in it if e.is_file()}
+            except OSError:
+                present = set()
+
+            m3u_lines = ["#EXTM3U\n"]
             for file in sorted(playlist.files, key=lambda x: x.order):
                 if not file.file_name:
                     continue
@@ -315,8 +316,9 @@ class PlaylistService:
                 if str(file.file_name).startswith("ext-"):
                     continue
                 
-                file_path = os.path.join(config['MEDIA_ROOT'], file.file_name)
-                if not os.path.exists(file_path):
+                file_path = os.path.join(media_root, file.file_name)
+                # Nested names are not covered by the top-level scan: stat those.
+                if file.file_name not in present and not (os.sep in file.file_name and os.path.exists(file_path)):
                     self._log_warning('Media file not found', {
                         'file_path': file_path,
                         'playlist_id': playlist.id
@@ -325,10 +327,11 @@ class PlaylistService:
                 
                 file_ext = file.file_name.lower().split('.')[-1]
                 if file.duration and file_ext in ['jpg', 'jpeg', 'png']:
-                    m3u_content += f"#EXTVLCOPT:run-time={file.duration}\n"
-                m3u_content += f"{base_url}{media_url}{file.file_name}\n"
+                    m3u_lines.append(f"#EXTVLCOPT:run-time={file.duration}\n")
+                m3u_lines.append(f"{base_url}{media_url}{file.file_name}\n")
+            m3u_bytes = "".join(m3u_lines).encode('utf-8')
         
-            safe_name = re.sub(r'[\\/*?:"<>|]', "_", playlist.name)
+            safe_name = _UNSAFE_M3U_NAME_RE.sub("_", playlist.name)
             filename = f"{safe_name}.m3u"
             export_dirs = self._get_m3u_export_dirs(export_dir)
 
@@ -340,28 +343,36 @@ class PlaylistService:
                     os.makedirs(candidate_dir, exist_ok=True)
                     filepath = os.path.join(candidate_dir, filename)
 
-                    # Atomic write to avoid partially-written files on reload.
-                    tmp_path = f"{filepath}.tmp-{os.getpid()}-{int(time.time() * 1000)}"
-                    with open(tmp_path, 'w', encoding='utf-8') as f:
-                        f.write(m3u_content)
-                    os.replace(tmp_path, filepath)
+                    # Unchanged export (re-save without edits, repeated play): keep the file.
+                    try:
+                        with open(filepath, 'rb') as f:
+                            unchanged = f.read(len(m3u_bytes) + 1) == m3u_bytes
+                    except OSError:
+                        unchanged = False
+                    if not unchanged:
+                        # Atomic write to avoid partially-written files on reload.
+                        tmp_path = f"{filepath}.tmp-{os.getpid()}-{int(time.time() * 1000)}"
+                        with open(tmp_path, 'wb') as f:
+                            f.write(m3u_bytes)
+                        os.replace(tmp_path, filepath)
 
                     generated_filepath = filepath
 
                     # Удаляем старый файл если изменилось имя (best-effort).
                     if old_name and old_name != playlist.name:
-                        old_safe_name = re.sub(r'[\\/*?:"<>|]', "_", old_name)
+                        old_safe_name = _UNSAFE_M3U_NAME_RE.sub("_", old_name)
                         old_filename = f"{old_safe_name}.m3u"
                         for d in export_dirs:
                             old_filepath = os.path.join(d, old_filename)
-                            if os.path.exists(old_filepath):
-                                try:
-                                    os.remove(old_filepath)
-                                except Exception as e:
-                                    self._log_warning('Failed to remove old M3U file', {
-                                        'old_filepath': old_filepath,
-                                        'error': str(e)
-                                    })
+                            try:
+                                os.remove(old_filepath)
+                            except FileNotFoundError:
+                                pass
+                            except Exception as e:
+                                self._log_warning('Failed to remove old M3U file', {
+                                    'old_filepath': old_filepath,
+                                    'error': str(e)
+                                })
 
                     break
                 except PermissionError as e:
@@ -457,7 +468,7 @@ class PlaylistService:
                     "error": f"Playlist {playlist_id} not found"
                 }
 
-            safe_name = re.sub(r'[\\/*?:"<>|]', "_", playlist.name)
+            safe_name = _UNSAFE_M3U_NAME_RE.sub("_", playlist.name)
             filename = f"{safe_name}.m3u"
             primary_dir = current_app.config['M3U_EXPORT_DIR']
             export_dirs = self._get_m3u_export_dirs(primary_dir)
@@ -466,8 +477,6 @@ class PlaylistService:
             last_error: Optional[str] = None
             for d in export_dirs:
                 filepath = os.path.join(d, filename)
-                if not os.path.exists(filepath):
-                    continue
                 try:
                     os.remove(filepath)
                     deleted_any = True
@@ -475,6 +484,8 @@ class PlaylistService:
                         'playlist_id': playlist_id,
                         'filepath': filepath
                     })
+                except FileNotFoundError:
+                    continue
                 except Exception as e:
                     last_error = str(e)
                     self._log_error('Failed to delete M3U file', {
@@ -1,5 +1,57 @@
 import time
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from ..models import PlaybackProfile, PlaylistProfileAssignment
+
+# Bumped on every profile/assignment write (any session, any code path — routes
+# write these tables directly), so AssignedProfileCache never outlives a change.
+# Bumped again when the writing transaction commits or rolls back: a reader in
+# another session may have cached the old committed row after the flush-time bump.
+_profile_generation = 0
+_profile_generation_lock = Lock()
+
+
+def _bump_profile_generation() -> None:
+    global _profile_generation
+    with _profile_generation_lock:
+        _profile_generation += 1
+
+
+def _mark_profile_write(session) -> None:
+    _bump_profile_generation()
+    if session is not None:
+        session.info["playback_profile_dirty"] = True
+
+
+def _on_profile_row_write(_mapper, _connection, target) -> None:
+    _mark_profile_write(object_session(target))
+
+
+for _model in (PlaybackProfile, PlaylistProfileAssignment):
+    for _evt in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _evt, _on_profile_row_write)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_on_bulk_profile_write(orm_execute_state) -> None:
+    # query(...).delete()/update() bypass mapper events (unassign in api_routes).
+    if orm_execute_state.is_select:
+        return
+    for mapper in orm_execute_state.all_mappers:
+        if mapper.class_ in (PlaybackProfile, PlaylistProfileAssignment):
+            _mark_profile_write(orm_execute_state.session)
+            return
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _bump_on_profile_txn_end(session) -> None:
+    if session.info.pop("playback_profile_dirty", False):
+        _bump_profile_generation()
 
 
 class ProfileManager:
@@ -15,8 +67,10 @@ class ProfileManager:
         self.logger = logger
         self.db_session = db_session
         self._mpv_manager = mpv_manager
+        self._assigned_profiles = AssignedProfileCache()
 
-    def _profile_to_dict(self, profile) -> Dict[str, Any]:
+    @staticmethod
+    def _profile_to_dict(profile) -> Dict[str, Any]:
         return {
             "id": profile.id,
             "name": profile.name,
@@ -26,22 +80,33 @@ class ProfileManager:
         }
 
     def get_profile(self, profile_id: int) -> Optional[Dict[str, Any]]:
-        from ..models import PlaybackProfile
-
         profile = self.db_session.query(PlaybackProfile).get(profile_id)
         return self._profile_to_dict(profile) if profile else None
 
     def get_all_profiles(self, profile_type: Optional[str] = None) -> List[Dict[str, Any]]:
-        from ..models import PlaybackProfile
-
-        query = self.db_session.query(PlaybackProfile)
+        # Column tuples: list view does not need ORM instances / identity map entries.
+        stmt = select(
+            PlaybackProfile.id,
+            PlaybackProfile.name,
+            PlaybackProfile.profile_type,
+            PlaybackProfile.settings,
+            PlaybackProfile.created_at,
+        )
         if profile_type:
-            query = query.filter_by(profile_type=profile_type)
-        return [self._profile_to_dict(p) for p in query.all()]
+            stmt = stmt.where(PlaybackProfile.profile_type == profile_type)
+        rows = self.db_session.execute(stmt.execution_options(yield_per=100))
+        return [
+            {
+                "id": r.id,
+                "name": r.name,
+                "type": r.profile_type,
+                "settings": r.settings or {},
+                "created_at": r.created_at,
+            }
+            for r in rows
+        ]
 
     def create_profile(self, name: str, profile_type: str, settings: Dict[str, Any]) -> Optional[int]:
-        from ..models import PlaybackProfile
-
         if not isinstance(settings, dict):
             return None
 
@@ -63,8 +128,6 @@ class ProfileManager:
         return profile.id
 
     def update_profile(self, profile_id: int, name: str, settings: Dict[str, Any]) -> bool:
-        from ..models import PlaybackProfile
-
         if not isinstance(settings, dict):
             return False
 
@@ -84,8 +147,6 @@ class ProfileManager:
         return True
 
     def delete_profile(self, profile_id: int) -> bool:
-        from ..models import PlaybackProfile
-
         profile = self.db_session.query(PlaybackProfile).get(profile_id)
         if not profile:
             return False
@@ -94,14 +155,9 @@ class ProfileManager:
         return True
 
     def get_assigned_profile(self, playlist_id: int) -> Optional[Dict[str, Any]]:
-        from ..models import PlaylistProfileAssignment
-
-        assignment = self.db_session.query(PlaylistProfileAssignment).filter_by(playlist_id=playlist_id).first()
-        return self.get_profile(assignment.profile_id) if assignment else None
+        return self._assigned_profiles.get(self.db_session, playlist_id)
 
     def assign_profile_to_playlist(self, playlist_id: int, profile_id: int) -> bool:
-        from ..models import PlaylistProfileAssignment
-
         assignment = self.db_session.query(PlaylistProfileAssignment).filter_by(playlist_id=playlist_id).first()
         if assignment:
             assignment.profile_id = profile_id
@@ -118,10 +174,70 @@ class ProfileManager:
         settings = profile.get("settings") or {}
         if not isinstance(settings, dict):
             return False
-        ok = bool(self._mpv_manager.update_settings(settings))
-        if "panscan" not in settings:
-            self._mpv_manager._send_command(
-                {"command": ["set_property", "panscan", 0.0]},
-                timeout=2.0,
+        # Default panscan goes out in the same IPC batch as the profile settings.
+        return bool(self._mpv_manager.update_settings({"panscan": 0.0, **settings}))
+
+
+class AssignedProfileCache:
+    """
+    playlist_id → assigned profile dict (or None), one JOIN per miss.
+
+    Entries live ``ttl_sec``; all of them are dropped as soon as any profile or
+    assignment row is written. Returned dicts are shared — do not mutate.
+    """
+
+    def __init__(self, ttl_sec: float = 30.0, maxsize: int = 64) -> None:
+        self._ttl_sec = float(ttl_sec)
+        self._maxsize = max(1, int(maxsize))
+        self._entries: Dict[int, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        self._generation = _profile_generation
+        self._lock = Lock()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, db_session, playlist_id: int) -> Optional[Dict[str, Any]]:
+        key = int(playlist_id)
+        now = time.monotonic()
+        with self._lock:
+            if self._generation != _profile_generation:
+                self._entries.clear()
+                self._generation = _profile_generation
+            hit = self._entries.get(key)
+            if hit is not None and (now - hit[0]) < self._ttl_sec:
+                return hit[1]
+            generation = self._generation
+
+        # Column tuple, not an entity: the dict is all play() needs, nothing lands in the identity map.
+        row = (
+            db_session.query(
+                PlaybackProfile.id,
+                PlaybackProfile.name,
+                PlaybackProfile.profile_type,
+                PlaybackProfile.settings,
+                PlaybackProfile.created_at,
             )
-        return ok
+            .join(PlaylistProfileAssignment, PlaylistProfileAssignment.profile_id == PlaybackProfile.id)
+            .filter(PlaylistProfileAssignment.playlist_id == key)
+            .first()
+        )
+        result = (
+            {
+                "id": row.id,
+                "name": row.name,
+                "type": row.profile_type,
+                "settings": row.settings or {},
+                "created_at": row.created_at,
+            }
+            if row is not None
+            else None
+        )
+
+        with self._lock:
+            # Skip caching if a write landed while we were reading.
+            if generation == _profile_generation == self._generation:
+                if key not in self._entries and len(self._entries) >= self._maxsize:
+                    self._entries.pop(next(iter(self._entries)))
+                self._entries[key] = (now, result)
+        return result
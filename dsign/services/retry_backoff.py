@@ -0,0 +1,26 @@
+"""Jittered retry delays for IPC retries and recovery loops.
+
+Fixed delays make every caller that failed on the same mpv hiccup retry in
+lockstep against the just-restarted player. Randomizing the wait spreads them.
+"""
+
+from __future__ import annotations
+
+import random
+
+
+def full_jitter(attempt: int, *, base: float, cap: float) -> float:
+    """Capped exponential backoff with full jitter: ``U(0, min(cap, base * 2**attempt))``."""
+    return random.uniform(0.0, min(float(cap), float(base) * (2 ** max(0, int(attempt)))))
+
+
+def equal_jitter(delay: float) -> float:
+    """Keep at least half of ``delay`` (schedules tuned by hand), jitter the rest."""
+    d = max(0.0, float(delay))
+    return d / 2.0 + random.uniform(0.0, d / 2.0)
+
+
+def decorrelated_jitter(previous: float, *, base: float, cap: float) -> float:
+    """Decorrelated jitter: next delay drawn from ``U(base, previous * 3)``, capped."""
+    hi = max(float(base), float(previous) * 3.0)
+    return min(float(cap), random.uniform(float(base), hi))
@@ -532,13 +532,13 @@ class ScheduleService:
         best: Optional[tuple] = None
         horizon_end = now.date() + timedelta(days=60)
         exceptions = self._exceptions_for_range(now.date(), horizon_end)
+        # One rules query for the whole horizon (get_status polls this), not one per day.
+        rules = [rule for rule in self.list_rules() if rule.enabled]
         for offset in range(0, 60):
             day = now.date() + timedelta(days=offset)
             same_day = offset == 0
             cutoff = _time_cutoff(now, same_day=same_day)
-            for rule in self.list_rules():
-                if not rule.enabled:
-                    continue
+            for rule in rules:
                 if not self._rule_applies_on_date(rule, day, exceptions=exceptions):
                     continue
                 if rule.start_time <= cutoff:
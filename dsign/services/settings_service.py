@@ -11,9 +11,51 @@ from pathlib import Path
 from datetime import datetime
 from flask import current_app
 from dsign.extensions import db
-from dsign.services.logger import ServiceLogger
+from dsign.services.logger import ServiceLogger, merge_log_extra, module_log_extra
+from dsign.config.mpv_settings_schema import MPV_SETTINGS_SCHEMA
 from dsign.services.subprocess_limits import APLAY_LIST_TIMEOUT_SEC
 
+
+_SKIP = object()
+_LOG_BASE_EXTRA = module_log_extra('SettingsService')
+
+
+def _compile_mpv_setting_rules(schema: Dict[str, Any]) -> tuple:
+    """(key, kind, options) для каждого параметра схемы — разбирается один раз при импорте."""
+    rules = []
+    for key, meta in schema.items():
+        meta = meta or {}
+        rules.append((key, str(meta.get("type") or ""), tuple(meta.get("options") or ())))
+    return tuple(rules)
+
+
+_MPV_SETTING_RULES = _compile_mpv_setting_rules(MPV_SETTINGS_SCHEMA)
+
+
+def _coerce_mpv_setting(kind: str, options: tuple, val: Any) -> Any:
+    """Привести значение к типу из схемы; ``_SKIP`` — отбросить ключ."""
+    if kind == "range":
+        try:
+            return float(val)
+        except (TypeError, ValueError):
+            return _SKIP
+    if kind == "select":
+        return val if val in options else _SKIP
+    if kind == "number":
+        s = str(val).strip() if val is not None else ""
+        if s == "":
+            return _SKIP
+        try:
+            return int(float(s))
+        except (TypeError, ValueError):
+            return _SKIP
+    if kind == "boolean":
+        return bool(val) if not isinstance(val, str) else val.lower() in ("1", "true", "yes", "on")
+    if val is not None and str(val).strip() != "":
+        return val
+    return _SKIP
+
+
 class SettingsService:
     DEFAULT_SETTINGS = {
         "resolution": "1024x600",
@@ -75,26 +117,18 @@ class SettingsService:
 
     def _log_error(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для логирования ошибок"""
-        extra_data = {'module': 'SettingsService'}
-        if extra:
-            extra_data.update(extra)
+        extra_data = {**_LOG_BASE_EXTRA, **(extra or {})}
         # ServiceLogger.error does not accept exc_info; include stack trace as structured data.
         extra_data.setdefault('stack_trace', traceback.format_exc())
         self.logger.error(message, extra=extra_data)
 
     def _log_info(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для информационных логов"""
-        extra_data = {'module': 'SettingsService'}
-        if extra:
-            extra_data.update(extra)
-        self.logger.info(message, extra=extra_data)
+        self.logger.info(message, extra=merge_log_extra(_LOG_BASE_EXTRA, extra))
 
     def _log_warning(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """Унифицированный метод для предупреждений"""
-        extra_data = {'module': 'SettingsService'}
-        if extra:
-            extra_data.update(extra)
-        self.logger.warning(message, extra=extra_data)
+        self.logger.warning(message, extra=merge_log_extra(_LOG_BASE_EXTRA, extra))
 
     def _ensure_directories(self) -> None:
         """Создание необходимых директорий"""
@@ -265,8 +299,11 @@ class SettingsService:
                 ).first()
                 
                 if assignment:
-                    profile = db.session.query(PlaybackProfile).get(assignment.profile_id)
-                    if profile:
+                    # Только колонка settings: без гидрации ORM-объекта профиля.
+                    profile_row = db.session.query(PlaybackProfile.settings).filter_by(
+                        id=assignment.profile_id
+                    ).first()
+                    if profile_row is not None:
                         active_key = f"playlist:{playback.playlist_id}:profile:{assignment.profile_id}"
                         if self._last_logged_active_profile_key != active_key:
                             self._log_info(
@@ -274,7 +311,7 @@ class SettingsService:
                                 extra={'playlist_id': playback.playlist_id, 'profile_id': assignment.profile_id}
                             )
                             self._last_logged_active_profile_key = active_key
-                        profile_settings = profile.settings or {}
+                        profile_settings = profile_row.settings or {}
                         base_no_mpv = {k: v for k, v in base_settings.items() if k != "mpv"}
                         mpv_layer = dict(base_settings.get("mpv") or {}) if isinstance(base_settings.get("mpv"), dict) else {}
                         settings = {**self.DEFAULT_SETTINGS, **base_no_mpv, **mpv_layer, **profile_settings}
@@ -546,6 +583,14 @@ class SettingsService:
             return None
         return None
 
+    _ELD_VALID_RE = re.compile(r"eld_valid\s*\|\s*(\d+)")
+    _ELD_MONITOR_RE = re.compile(r"monitor_name\s*\|\s*(.+)")
+    _ELD_CONN_RE = re.compile(r"(?:conn_type|connection_type)\s*\|\s*(.+)", re.I)
+    _GENERIC_HDMI_DESC_RE = re.compile(r"HDMI\s*\d+\s*$")
+    _ASOUND_CARD_RE = re.compile(r"^\s*(\d+)\s+\[([^\]]+)\]")
+    _AMIXER_SCONTROL_RE = re.compile(r"Simple mixer control '([^']+)'")
+    _AMIXER_MIXER_NUMID_RE = re.compile(r"numid=(\d+),iface=MIXER,name='([^']+)'")
+
     def _parse_pch_eld_endpoints(self) -> list[tuple[str, str, str]]:
         """Return [(eld_pin, monitor_name, conn_type), ...] for valid PCH ELD endpoints."""
         card = self._pch_card_index()
@@ -560,13 +605,25 @@ class SettingsService:
                 text = eld_path.read_text(encoding="utf-8", errors="ignore")
             except Exception:
                 continue
-            valid_m = re.search(r"eld_valid\s*\|\s*(\d+)", text)
-            if valid_m and valid_m.group(1).strip() != "1":
+            valid: Optional[str] = None
+            monitor = ""
+            conn = ""
+            # Один проход по строкам вместо трёх поисков по всему буферу.
+            for line in text.splitlines():
+                if valid is None:
+                    valid_m = self._ELD_VALID_RE.search(line)
+                    if valid_m:
+                        valid = valid_m.group(1).strip()
+                if not monitor:
+                    monitor_m = self._ELD_MONITOR_RE.search(line)
+                    if monitor_m:
+                        monitor = monitor_m.group(1).strip()
+                if not conn:
+                    conn_m = self._ELD_CONN_RE.search(line)
+                    if conn_m:
+                        conn = conn_m.group(1).strip()
+            if valid is not None and valid != "1":
                 continue
-            monitor_m = re.search(r"monitor_name\s*\|\s*(.+)", text)
-            monitor = (monitor_m.group(1).strip() if monitor_m else "") or ""
-            conn_m = re.search(r"(?:conn_type|connection_type)\s*\|\s*(.+)", text, re.I)
-            conn = (conn_m.group(1).strip() if conn_m else "") or ""
             eld_pin = eld_path.name.replace("eld#", "", 1)
             out.append((eld_pin, monitor, conn))
         return out
@@ -576,7 +633,7 @@ class SettingsService:
         d = (desc or "").strip().upper()
         if not d:
             return True
-        if re.search(r"HDMI\s*\d+\s*$", d):
+        if SettingsService._GENERIC_HDMI_DESC_RE.search(d):
             return True
         return d in ("HDA INTEL PCH", "DEFAULT")
 
@@ -672,7 +729,7 @@ class SettingsService:
             if not p.exists():
                 return None
             for line in p.read_text(encoding="utf-8", errors="ignore").splitlines():
-                m = re.match(r"^\s*(\d+)\s+\[([^\]]+)\]", line)
+                m = self._ASOUND_CARD_RE.match(line)
                 if m and "PCH" in (m.group(2) or "").upper():
                     return int(m.group(1))
         except Exception:
@@ -716,7 +773,7 @@ class SettingsService:
                 stderr=subprocess.STDOUT,
                 timeout=3.0,
             )
-            names = re.findall(r"Simple mixer control '([^']+)'", out)
+            names = self._AMIXER_SCONTROL_RE.findall(out)
         except Exception:
             names = []
         keywords = ("IEC958", "HDMI", "DP", "DIGITAL", "S/PDIF", "PCM")
@@ -771,7 +828,7 @@ class SettingsService:
                 stderr=subprocess.STDOUT,
                 timeout=4.0,
             )
-            for m in re.finditer(r"numid=(\d+),iface=MIXER,name='([^']+)'", contents):
+            for m in self._AMIXER_MIXER_NUMID_RE.finditer(contents):
                 numid, name = m.group(1), m.group(2)
                 upper = name.upper()
                 if "PLAYBACK SWITCH" not in upper and "IEC958" not in upper and "HDMI" not in upper:
@@ -894,37 +951,13 @@ class SettingsService:
         Persist advanced MPV options under settings.json → \"mpv\" and optionally apply live via IPC.
         """
         try:
-            from dsign.config.mpv_settings_schema import MPV_SETTINGS_SCHEMA
-
             out: Dict[str, Any] = {}
-            for key, meta in MPV_SETTINGS_SCHEMA.items():
+            for key, kind, options in _MPV_SETTING_RULES:
                 if key not in raw:
                     continue
-                val = raw.get(key)
-                stype = (meta or {}).get("type")
-                if stype == "boolean":
-                    out[key] = bool(val) if not isinstance(val, str) else val.lower() in ("1", "true", "yes", "on")
-                elif stype == "range":
-                    try:
-                        out[key] = float(val)
-                    except (TypeError, ValueError):
-                        continue
-                elif stype == "number":
-                    s = str(val).strip() if val is not None else ""
-                    if s == "":
-                        continue
-                    try:
-                        out[key] = int(float(s))
-                    except (TypeError, ValueError):
-                        continue
-                elif stype == "select":
-                    opts = (meta or {}).get("options") or []
-                    if val not in opts:
-                        continue
+                val = _coerce_mpv_setting(kind, options, raw.get(key))
+                if val is not _SKIP:
                     out[key] = val
-                else:
-                    if val is not None and str(val).strip() != "":
-                        out[key] = val
 
             settings = self.load_settings()
             settings["mpv"] = out
@@ -1,4 +1,5 @@
 # services/sockets/handlers/__init__.py
+import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 from flask_socketio import SocketIO, emit, Namespace
@@ -34,6 +35,8 @@ class BaseHandler:
         """Helper method to emit success responses"""
         data['timestamp'] = datetime.utcnow().isoformat()
         emit(event, data, room=sid)
-        self.logger.debug(f"{event} sent", {'sid': sid, 'data_keys': list(data.keys())})
+        # Per-emit path: skip building the key list unless DEBUG is on.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("%s sent", event, extra={'sid': sid, 'data_keys': list(data.keys())})
 
 __all__ = ['SystemHandlers', 'SystemNamespace', 'PlaylistHandler', 'PlaybackHandler', 'AuthHandler']
@@ -7,6 +7,9 @@ loop — see ``tests/test_subprocess_audit.py`` allowlist.
 
 from __future__ import annotations
 
+import tempfile
+from typing import IO
+
 AMIXER_TIMEOUT_SEC = 3.0
 APLAY_LIST_TIMEOUT_SEC = 5.0
 IP_ADDR_TIMEOUT_SEC = 3.0
@@ -15,3 +18,23 @@ DEP_CHECK_TIMEOUT_SEC = 5.0
 FFPROBE_TIMEOUT_SEC = 15.0
 SYSTEMCTL_QUERY_TIMEOUT_SEC = 5.0
 NMCLI_DEFAULT_TIMEOUT_SEC = 20.0
+
+
+def stderr_spool() -> IO[bytes]:
+    """
+    Anonymous temp file for a long-running ``Popen``'s stderr.
+
+    The kernel writes into it directly, so a chatty child can never block on a full
+    64 KiB pipe that nobody drains (``stderr=PIPE`` + a poll loop deadlocks).
+    """
+    return tempfile.TemporaryFile()
+
+
+def read_spool_tail(spool: IO[bytes], limit: int) -> str:
+    """Last ``limit`` bytes of a ``stderr_spool()`` file as text (for logs)."""
+    try:
+        size = spool.seek(0, 2)
+        spool.seek(max(0, size - int(limit)))
+        return spool.read().decode("utf-8", errors="replace")
+    except (OSError, ValueError):
+        return ""
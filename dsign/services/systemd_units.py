@@ -0,0 +1,39 @@
+"""systemd unit state over D-Bus when ``pystemd`` is installed (setup.py extra ``systemd``).
+
+``systemctl is-active`` is a fork+exec of a D-Bus client per call. With pystemd the unit
+object is loaded once and ``ActiveState`` is a property read on an open bus connection.
+Without pystemd — or when the bus refuses us (the app user often lacks polkit rights) —
+:func:`unit_is_active` returns ``None`` and callers fall back to ``systemctl``.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Dict, Optional
+
+try:
+    from pystemd.systemd1 import Unit as _Unit
+except ImportError:
+    _Unit = None
+
+_units: Dict[str, Any] = {}
+# pystemd objects wrap one sd-bus connection each; do not share one across threads concurrently.
+_units_lock = Lock()
+
+
+def unit_is_active(unit: str) -> Optional[bool]:
+    """True/False from systemd's ActiveState; None when pystemd is unavailable or the call failed."""
+    if _Unit is None:
+        return None
+    with _units_lock:
+        try:
+            u = _units.get(unit)
+            if u is None:
+                u = _Unit(unit.encode())
+                u.load()
+                _units[unit] = u
+            return u.Unit.ActiveState == b"active"
+        except Exception:
+            # Drop the cached object: a broken bus connection must not stick.
+            _units.pop(unit, None)
+            return None
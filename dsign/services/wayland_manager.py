@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Optional
 
 from .playback_constants import PlaybackConstants
+from .systemd_units import unit_is_active
 
 
 class WaylandManager:
@@ -41,15 +42,18 @@ class WaylandManager:
 
     def compositor_unit_active(self) -> bool:
         unit = PlaybackConstants.COMPOSITOR_SYSTEMD_UNIT
+        via_dbus = unit_is_active(unit)
+        if via_dbus is not None:
+            return via_dbus
         try:
             r = subprocess.run(
                 ["systemctl", "is-active", unit],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5.0,
                 check=False,
             )
-            return r.stdout.strip() == "active"
+            return r.returncode == 0
         except Exception:
             return False
 
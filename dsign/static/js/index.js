@@ -116,6 +116,7 @@ const state = {
     usingSocketPush: false,
     refreshTimerId: null,
     refreshInFlight: false,
+    settingsResyncInFlight: false,
     refreshBackoffMs: 0,
     autoRefreshTickCount: 0,
     lastMpvPreviewRefreshAt: 0,
@@ -1406,6 +1407,8 @@ const handlers = {
 
         sockets.on('connect', () => {
             state.usingSocketPush = true;
+            // Pushes only carry settings deltas: take the full snapshot from status first.
+            this.resyncPlaybackSettings();
             this.startAutoRefresh();
         });
         sockets.on('disconnect', () => {
@@ -1415,7 +1418,23 @@ const handlers = {
         sockets.on('playback_update', (payload) => {
             // Merge so a partial emit (missing source) does not wipe badge attribution.
             if (payload && typeof payload === 'object') {
-                state.playbackStatus = { ...(state.playbackStatus || {}), ...payload };
+                const prev = state.playbackStatus || {};
+                const { settings_delta: delta, settings_removed: removed, ...rest } = payload;
+                state.playbackStatus = { ...prev, ...rest };
+                // Server ships profile settings once, then only changed keys.
+                if (delta && typeof delta === 'object' && !rest.settings) {
+                    const prevVersion = Number(prev.settings_version);
+                    const version = Number(rest.settings_version);
+                    if (version === prevVersion + 1) {
+                        const settings = { ...(prev.settings || {}), ...delta };
+                        (removed || []).forEach((k) => { delete settings[k]; });
+                        state.playbackStatus.settings = settings;
+                    } else {
+                        // Stale, or a delta was dropped in between: keep what we had and resync on a gap.
+                        state.playbackStatus.settings_version = prev.settings_version;
+                        if (!(version <= prevVersion)) this.resyncPlaybackSettings();
+                    }
+                }
             }
             try {
                 ui.applyPlaybackStatusFromServer(state.playbackStatus, state.playlists);
@@ -1431,6 +1450,23 @@ const handlers = {
         });
     },
 
+    async resyncPlaybackSettings() {
+        if (state.settingsResyncInFlight) return;
+        state.settingsResyncInFlight = true;
+        try {
+            const resp = await api.getPlaybackStatus().catch(() => null);
+            const inner = resp?.status && typeof resp.status === 'object' ? resp.status : null;
+            if (!inner) return;
+            state.playbackStatus = {
+                ...(state.playbackStatus || {}),
+                settings: inner.settings || {},
+                settings_version: inner.settings_version,
+            };
+        } finally {
+            state.settingsResyncInFlight = false;
+        }
+    },
+
     startAutoRefresh() {
         // Stop previous loop (if any).
         if (state.refreshIntervalId) {
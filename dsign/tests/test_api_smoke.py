@@ -187,3 +187,30 @@ def test_bearer_return_to_schedule_without_csrf(api_client):
     assert rv.status_code in (200, 409)
     body = rv.get_json()
     assert "success" in body
+
+
+def test_session_can_list_profiles_and_overrides(api_client):
+    from dsign.extensions import db
+    from dsign.models import PlaybackProfile, PlaylistProfileAssignment
+
+    client, app, user, playlist = api_client
+    with app.app_context():
+        profile = PlaybackProfile(name="rot", profile_type="playlist", settings={"video-rotate": 90})
+        db.session.add(profile)
+        db.session.commit()
+        profile_id = profile.id
+        db.session.add(PlaylistProfileAssignment(playlist_id=playlist.id, profile_id=profile_id))
+        db.session.commit()
+    _login_session(client, user)
+
+    rv = client.get("/api/profiles")
+    assert rv.status_code == 200
+    assert rv.get_json()["profiles"] == [
+        {"id": profile_id, "name": "rot", "type": "playlist", "settings": {"video-rotate": 90}}
+    ]
+
+    rv = client.get("/api/playlists/overrides")
+    assert rv.status_code == 200
+    row = rv.get_json()["playlists"][0]
+    assert row["has_overrides"] is True
+    assert row["overrides"]["video_rotate"] == 90
@@ -244,3 +244,22 @@ def test_reapply_effective_mute_to_mpv(tmp_path, null_logger):
     mpv._send_command.assert_called_once()
     payload = mpv._send_command.call_args[0][0]
     assert payload["command"] == ["set_property", "mute", "yes"]
+
+
+def test_save_global_mpv_coerces_by_schema_type(tmp_path, null_logger):
+    svc = _settings_service(tmp_path, null_logger)
+
+    ok = svc.save_global_mpv_and_apply(
+        {
+            "panscan": "0.5",
+            "video-zoom": "bad",
+            "dwidth": "1920.0",
+            "dheight": "",
+            "video-aspect": "5:4",
+            "audio-route": "hdmi",
+            "unknown-key": 1,
+        }
+    )
+
+    assert ok is True
+    assert svc.load_settings()["mpv"] == {"panscan": 0.5, "dwidth": 1920, "audio-route": "hdmi"}
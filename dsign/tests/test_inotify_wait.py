@@ -0,0 +1,36 @@
+"""wait_for_path: wakes on creation instead of sleeping the whole interval."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from dsign.services import inotify_wait
+
+
+def test_wait_for_path_returns_on_creation(tmp_path):
+    target = tmp_path / "mpv-socket"
+    timer = threading.Timer(0.1, target.write_bytes, args=(b"",))
+    timer.start()
+    try:
+        t0 = time.monotonic()
+        assert inotify_wait.wait_for_path(str(target), 5.0) is True
+        assert time.monotonic() - t0 < 2.0
+    finally:
+        timer.cancel()
+
+
+def test_wait_for_path_ignores_other_names_and_times_out(tmp_path):
+    (tmp_path / "other").write_bytes(b"")
+    t0 = time.monotonic()
+    assert inotify_wait.wait_for_path(str(tmp_path / "mpv-socket"), 0.2) is False
+    assert time.monotonic() - t0 >= 0.15
+
+
+def test_wait_for_path_falls_back_to_sleep_without_inotify(tmp_path, monkeypatch):
+    monkeypatch.setattr(inotify_wait, "_libc", None)
+    monkeypatch.setattr(inotify_wait, "_libc_loaded", True)
+    target = tmp_path / "mpv-socket"
+    target.write_bytes(b"")
+    assert inotify_wait.wait_for_path(str(target), 1.0) is True
+    assert inotify_wait.wait_for_path(str(tmp_path / "missing"), 0.05) is False
@@ -0,0 +1,61 @@
+"""Unit tests for the optional-orjson JSON codec."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from dsign.services import json_codec
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "_orjson", None)
+    elif json_codec._orjson is None:
+        pytest.skip("orjson not installed")
+    return json_codec
+
+
+def test_roundtrip_matches_stdlib(codec):
+    payload = {"status": "playing", "playlist_id": 3, "settings": {"volume": 50.5, "mute": False}}
+    text = codec.dumps(payload, separators=(",", ":"))
+    assert isinstance(text, str)
+    assert json.loads(text) == payload
+    assert codec.loads(text) == payload
+
+
+def test_non_string_keys_are_stringified(codec):
+    assert json.loads(codec.dumps({1: "a"})) == {"1": "a"}
+
+
+def test_huge_int_falls_back_to_stdlib():
+    assert json_codec.loads(json_codec.dumps({"n": 2**70})) == {"n": 2**70}
+
+
+def test_line_framing_roundtrip(codec):
+    line = codec.dumps_line({"command": ["loadfile", "/media/ü.mp4"], "request_id": 7})
+    assert isinstance(line, bytes) and line.endswith(b"\n") and line.count(b"\n") == 1
+    assert codec.loads_line(line.strip()) == {"command": ["loadfile", "/media/ü.mp4"], "request_id": 7}
+
+
+def test_loads_line_replaces_invalid_utf8(codec):
+    assert codec.loads_line(b'{"data": "a\xffb"}') == {"data": "a�b"}
+
+
+def test_orjson_fast_path_is_active_when_installed(tmp_path):
+    orjson = pytest.importorskip("orjson")
+    from flask import Flask
+
+    from dsign.extensions import configure_sqlite_engine_options
+
+    assert json_codec._orjson is orjson
+    # Compact orjson output, not json.dumps with separators.
+    assert json_codec.dumps({"a": [1, 2]}) == orjson.dumps({"a": [1, 2]}).decode("utf-8")
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'app.db'}"
+    configure_sqlite_engine_options(app)
+    opts = app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+    assert (opts["json_serializer"], opts["json_deserializer"]) == (json_codec.dumps, json_codec.loads)
@@ -0,0 +1,26 @@
+"""LogoManager placeholder-logo initialization."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from dsign.services.logo_management import PLACEHOLDER_LOGO_PATH, LogoManager
+from dsign.services.playback_constants import PlaybackConstants
+
+
+def test_initialize_default_logo_copies_placeholder_on_reused_worker(null_logger, tmp_path):
+    lm = LogoManager(null_logger, None, str(tmp_path), MagicMock(), MagicMock())
+
+    logo = tmp_path / PlaybackConstants.DEFAULT_LOGO
+    assert lm._initialize_default_logo().result(timeout=5.0) == logo
+    assert logo.read_bytes() == PLACEHOLDER_LOGO_PATH.read_bytes()
+
+    assert lm._initialize_default_logo().result(timeout=5.0) == logo  # already present: no-op
+    assert len(lm._init_pool._threads) == 1
+
+
+def test_initialize_default_logo_reports_none_without_placeholder(null_logger, tmp_path, monkeypatch):
+    monkeypatch.setattr("dsign.services.logo_management.PLACEHOLDER_LOGO_PATH", tmp_path / "absent.jpg")
+    lm = LogoManager(null_logger, None, str(tmp_path), MagicMock(), MagicMock())
+
+    assert lm._initialize_default_logo().result(timeout=5.0) is None
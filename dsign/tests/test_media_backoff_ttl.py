@@ -88,7 +88,7 @@ def test_play_impl_prunes_stale_backoff(null_logger, tmp_path, monkeypatch):
     pm._stop_play_thread = MagicMock()
     pm._set_playback_active_marker = MagicMock()
     pm._logo_manager = MagicMock()
-    pm.db_session.query.return_value.get.return_value = None
+    pm._playlist_play_rows = MagicMock(return_value=None)  # type: ignore[method-assign]
 
     with pytest.raises(RuntimeError, match="Failed to start playback"):
         pm._play_impl(999)
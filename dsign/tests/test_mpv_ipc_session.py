@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import json
 import queue
+import socket
 import threading
 import time
 
 import pytest
 
+from dsign.services import mpv_ipc_session
 from dsign.services.mpv_ipc_session import (
     MPVIPCClosedError,
     MPVIPCTimeoutError,
@@ -207,3 +209,228 @@ def test_socket_eof_fails_pending(tmp_path, null_logger):
     finally:
         sess.close()
         server.stop()
+
+
+def test_close_stops_writer_thread(fake_mpv_socket, null_logger):
+    sock_path, server = fake_mpv_socket
+    sess = MpvJsonIpcSession(sock_path, logger=null_logger)
+    try:
+        sess.command({"command": ["get_property", "pause"]}, timeout=2.0, request_id=3)
+        writer = sess._writer_thread
+        assert writer is not None and writer.is_alive()
+    finally:
+        sess.close()
+    assert not writer.is_alive()
+    assert sess._writer_thread is None
+    assert len(server.received) == 1
+
+
+def test_close_leaves_old_threads_their_own_stop_flag(fake_mpv_socket, null_logger):
+    sock_path, _server = fake_mpv_socket
+    sess = MpvJsonIpcSession(sock_path, logger=null_logger)
+    sess.command({"command": ["get_property", "pause"]}, timeout=2.0, request_id=4)
+    old_stop = sess._reader_stop
+    sess.close()
+    # A thread that outlived the join still sees its flag set; the next pair gets a new one.
+    assert old_stop.is_set()
+    assert sess._reader_stop is not old_stop
+    assert not sess._reader_stop.is_set()
+
+
+def test_timed_out_submit_is_not_sent_later(null_logger):
+    a, b = socket.socketpair()
+    sess = MpvJsonIpcSession("/nonexistent/mpv.sock", logger=null_logger)
+    sess._sock = a
+    stop = threading.Event()
+    try:
+        # No writer yet: the frame sits in the queue until the caller gives up.
+        with pytest.raises(MPVIPCTimeoutError):
+            sess._submit(b'{"command":["stop"]}\n', timeout=0.05)
+        writer = threading.Thread(target=sess._writer_loop, args=(stop,), daemon=True)
+        writer.start()
+        sess._submit(b'{"command":["loadfile","a.mp4"]}\n', timeout=2.0)
+        b.settimeout(1.0)
+        assert b.recv(4096) == b'{"command":["loadfile","a.mp4"]}\n'
+    finally:
+        stop.set()
+        a.close()
+        b.close()
+
+
+def test_is_connected_tracks_socket_lifecycle(fake_mpv_socket, null_logger):
+    sock_path, _ = fake_mpv_socket
+    sess = MpvJsonIpcSession(sock_path, logger=null_logger)
+    try:
+        assert not sess.is_connected()
+        sess.command({"command": ["get_property", "pause"]}, timeout=2.0, request_id=4)
+        assert sess.is_connected()
+        sess.reset()
+        assert not sess.is_connected()
+    finally:
+        sess.close()
+
+
+def test_peer_close_notifies_but_reset_does_not(fake_mpv_socket, null_logger):
+    sock_path, server = fake_mpv_socket
+    closed = threading.Event()
+    sess = MpvJsonIpcSession(sock_path, logger=null_logger, on_peer_closed=closed.set)
+    try:
+        sess.command({"command": ["get_property", "pause"]}, timeout=2.0, request_id=5)
+        sess.reset()
+        assert not closed.wait(0.3)
+
+        sess.command({"command": ["get_property", "pause"]}, timeout=2.0, request_id=6)
+        server.close_client()
+        assert closed.wait(2.0)
+    finally:
+        sess.close()
+
+
+def test_reply_split_across_reads(tmp_path, null_logger):
+    sock_path = str(tmp_path / "mpv-split.sock")
+    server = FakeMpvIpcServer(sock_path)
+
+    def handler(msg):
+        line = json.dumps(default_echo_handler(msg)).encode("utf-8") + b"\n"
+        with server._lock:
+            sock = server._client_sock
+        sock.sendall(line[:5])
+        time.sleep(0.05)
+        sock.sendall(line[5:])
+        return None
+
+    server.set_handler(handler)
+    server.start()
+    sess = MpvJsonIpcSession(sock_path, logger=null_logger)
+    try:
+        resp = sess.command({"command": ["get_property", "pause"]}, timeout=2.0, request_id=12)
+        assert resp["request_id"] == 12
+    finally:
+        sess.close()
+        server.stop()
+
+
+def test_feed_lines_dispatches_all_lines_and_keeps_tail(tmp_path, null_logger):
+    sess = MpvJsonIpcSession(str(tmp_path / "unused.sock"), logger=null_logger)
+    q1: queue.SimpleQueue = queue.SimpleQueue()
+    q2: queue.SimpleQueue = queue.SimpleQueue()
+    sess._pending[1] = q1
+    sess._pending[2] = q2
+
+    sess._feed_lines(b'{"request_id": 1, "error": "success"}\n{"request_id": 2, "er')
+    assert q1.get_nowait()["request_id"] == 1
+    assert q2.empty()
+    assert bytes(sess._buf) == b'{"request_id": 2, "er'
+
+    sess._feed_lines(b'ror": "success"}\n')
+    assert q2.get_nowait()["request_id"] == 2
+    assert len(sess._buf) == 0
+
+
+def test_send_nonblocking_waits_out_full_buffer(null_logger):
+    a, b = socket.socketpair()
+    a.setblocking(False)
+    payload = b"x" * (4 << 20)
+    received = bytearray()
+
+    def slow_reader():
+        while len(received) < len(payload):
+            time.sleep(0.001)
+            received.extend(b.recv(65536))
+
+    t = threading.Thread(target=slow_reader, daemon=True)
+    t.start()
+    try:
+        MpvJsonIpcSession._send_nonblocking(a, payload)
+        t.join(5.0)
+        assert bytes(received) == payload
+    finally:
+        a.close()
+        b.close()
+
+
+def test_send_nonblocking_gives_up_on_stalled_peer(monkeypatch):
+    monkeypatch.setattr(mpv_ipc_session, "_WRITE_STALL_SEC", 0.1)
+    a, b = socket.socketpair()
+    a.setblocking(False)
+    try:
+        with pytest.raises(OSError):
+            MpvJsonIpcSession._send_nonblocking(a, b"x" * (16 << 20))
+    finally:
+        a.close()
+        b.close()
+
+
+def test_close_releases_socket_even_if_shutdown_blows_up(null_logger):
+    class _BadShutdownSocket:
+        closed = False
+
+        def shutdown(self, _how):
+            raise RuntimeError("unexpected")
+
+        def close(self):
+            self.closed = True
+
+    sess = MpvJsonIpcSession("/nonexistent/mpv.sock", logger=null_logger)
+    bad = _BadShutdownSocket()
+    sess._sock = bad  # type: ignore[assignment]
+    with pytest.raises(RuntimeError):
+        sess.close()
+    assert bad.closed
+    assert sess._sock is None
+    assert not sess._reader_stop.is_set()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"command": ["get_property", "time-pos"]},
+        {"command": ["stop"]},
+        {"command": ["observe_property", 3, "volume"]},
+        {"command": ["get_property", "метка"]},
+        {"command": ["set_property", "volume", 5.5]},
+        {"command": ["set_property", "pause", False]},
+        {"command": ["seek", -3, "relative"]},
+        {"command": ["loadfile", "/media/a.mp4", "replace"], "async": True},
+    ],
+)
+def test_encode_command_matches_json_line(payload):
+    line = mpv_ipc_session._encode_command(payload, 123456)
+    assert line.endswith(b"\n")
+    assert json.loads(line) == {**payload, "request_id": 123456}
+
+
+def test_encode_command_reuses_static_prefix():
+    mpv_ipc_session._command_prefix.cache_clear()
+    mpv_ipc_session._encode_command({"command": ["get_property", "pause"]}, 1)
+    mpv_ipc_session._encode_command({"command": ["get_property", "pause"]}, 2)
+    mpv_ipc_session._encode_command({"command": ["loadfile", "/media/a.mp4"]}, 3)
+    info = mpv_ipc_session._command_prefix.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_encode_command_caches_scalar_set_property_per_type():
+    mpv_ipc_session._command_prefix.cache_clear()
+    lines = [
+        mpv_ipc_session._encode_command({"command": ["set_property", "mute", value]}, 7)
+        for value in (True, 1, 1.0, True)
+    ]
+    assert [json.loads(line)["command"][2] for line in lines] == [True, 1, 1.0, True]
+    assert [type(json.loads(line)["command"][2]) for line in lines] == [bool, int, float, bool]
+    info = mpv_ipc_session._command_prefix.cache_info()
+    assert (info.hits, info.misses) == (1, 3)
+
+
+def test_next_request_id_is_unique_across_threads():
+    seen: list = []
+
+    def _take():
+        seen.extend(mpv_ipc_session.next_request_id() for _ in range(2000))
+
+    threads = [threading.Thread(target=_take) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(seen)) == len(seen) == 8000
+    assert all(0 < rid <= 0x7FFFFFFF for rid in seen)
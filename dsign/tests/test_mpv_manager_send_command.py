@@ -5,6 +5,7 @@ These tests focus on:
 - allowing `set_property vo` via `set_vo_property`
 - retry + coalesced restart behaviour on transport errors
 - retry budget calculation in `_send_command_max_retries`
+- pipelined `update_settings` with per-command fallback
 """
 
 from __future__ import annotations
@@ -12,6 +13,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 import time
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -51,6 +53,9 @@ class DummySession:
         result.setdefault("error", "success")
         return result
 
+    def commands_batch(self, items, *, timeout: float) -> List[Dict[str, Any]]:
+        return [self.command(payload, timeout=timeout, request_id=rid) for rid, payload in items]
+
 
 class StubMPVManager(MPVManager):
     """Stub MPVManager for unit tests (not collected by pytest)."""
@@ -182,3 +187,253 @@ def test_send_command_max_retries_respects_playback_flags(null_logger):
     mgr.set_playback_network_active(False)
     assert mgr._send_command_max_retries("set_property", "pause") == PlaybackConstants.MAX_RETRIES
     assert mgr._send_command_max_retries("show-text", None) == PlaybackConstants.MAX_RETRIES
+
+
+def test_update_settings_pipelines_one_batch(null_logger):
+    """update_settings sends all properties in one commands_batch call."""
+    session = DummySession([])
+    batches: List[int] = []
+    original = session.commands_batch
+
+    def _batch(items, *, timeout):
+        batches.append(len(items))
+        return original(items, timeout=timeout)
+
+    session.commands_batch = _batch  # type: ignore[method-assign]
+    mgr = StubMPVManager(logger=null_logger, session=session)
+
+    assert mgr.update_settings({"volume": 40, "mute": True, "panscan": 0.0}) is True
+
+    assert batches == [3]
+    commands = [c["payload"]["command"] for c in session.calls]
+    assert commands == [
+        ["set_property", "volume", 40],
+        ["set_property", "mute", "yes"],
+        ["set_property", "panscan", 0.0],
+    ]
+    assert len({c["request_id"] for c in session.calls}) == 3
+
+
+def test_update_settings_falls_back_when_batch_fails(null_logger):
+    """A failed batch is retried per property through _send_command; vo stays guarded."""
+    session = DummySession([])
+
+    def _broken(items, *, timeout):
+        raise MPVIPCClosedError("gone")
+
+    session.commands_batch = _broken  # type: ignore[method-assign]
+    mgr = StubMPVManager(logger=null_logger, session=session)
+    mgr.set_playback_session_active(True)
+
+    assert mgr.update_settings({"volume": 40, "vo": "gpu"}) is False
+
+    commands = [c["payload"]["command"] for c in session.calls]
+    assert commands == [["set_property", "volume", 40]]
+
+
+def test_update_settings_skips_values_already_applied_on_connection(null_logger):
+    """Unchanged values are not re-sent until a reconnect or a direct set_property."""
+    session = DummySession([])
+    session.connect_count = 1
+    mgr = StubMPVManager(logger=null_logger, session=session)
+
+    assert mgr.update_settings({"volume": 40, "panscan": 0.0, "ao": "alsa"}) is True
+    session.calls.clear()
+
+    assert mgr.update_settings({"volume": 40, "panscan": 0.5, "ao": "alsa"}) is True
+    assert [c["payload"]["command"] for c in session.calls] == [
+        ["set_property", "panscan", 0.5],
+        ["set_property", "ao", "alsa"],
+    ]
+    session.calls.clear()
+
+    mgr._send_command({"command": ["set_property", "volume", 10]})
+    session.calls.clear()
+    assert mgr.update_settings({"volume": 40}) is True
+    assert [c["payload"]["command"] for c in session.calls] == [["set_property", "volume", 40]]
+    session.calls.clear()
+
+    session.connect_count = 2  # mpv restarted: its properties are back to defaults
+    assert mgr.update_settings({"volume": 40}) is True
+    assert [c["payload"]["command"] for c in session.calls] == [["set_property", "volume", 40]]
+
+
+def test_update_settings_rewrites_after_restart_or_other_writes(null_logger):
+    """IPC reset / peer close / service restart and relative writes drop the applied cache."""
+    session = DummySession([])
+    session.connect_count = 1  # lazily reconnected: the count has not moved yet
+    mgr = StubMPVManager(logger=null_logger, session=session)
+
+    for forget, rewritten in (
+        (mgr._reset_ipc_session, ["volume", "mute"]),
+        (mgr._on_ipc_peer_closed, ["volume", "mute"]),
+        (lambda: mgr._send_command({"command": ["add", "volume", 5]}), ["volume"]),
+        (lambda: mgr._send_command({"command": ["cycle", "mute"]}), ["mute"]),
+    ):
+        assert mgr.update_settings({"volume": 40, "mute": "no"}) is True
+        forget()
+        session.calls.clear()
+        assert mgr.update_settings({"volume": 40, "mute": "no"}) is True
+        assert [c["payload"]["command"][1] for c in session.calls] == rewritten
+
+
+def test_wait_for_mpv_ready_probes_immediately_then_ramps(null_logger, monkeypatch):
+    mgr = StubMPVManager(null_logger, DummySession([]))
+    replies = [None, None, None, False]
+    monkeypatch.setattr(mgr, "get_property_light", lambda *_a, **_k: replies.pop(0))
+    sleeps: List[float] = []
+    monkeypatch.setattr("dsign.services.mpv_management.time.sleep", sleeps.append)
+
+    assert mgr.wait_for_mpv_ready(timeout=30, check_interval=1) is True
+    assert len(sleeps) == 3
+    assert sleeps[0] <= 0.1
+    assert all(d <= 1.0 for d in sleeps)
+
+
+def test_wait_for_mpv_ready_logs_probes_at_debug(null_logger, monkeypatch):
+    mgr = StubMPVManager(null_logger, DummySession([]))
+    mgr.logger = MagicMock()
+    replies = [None, None, False]
+    monkeypatch.setattr(mgr, "get_property_light", lambda *_a, **_k: replies.pop(0))
+    monkeypatch.setattr("dsign.services.mpv_management.time.sleep", lambda _s: None)
+
+    assert mgr.wait_for_mpv_ready(timeout=30, check_interval=1) is True
+    assert [c.args[0] for c in mgr.logger.debug.call_args_list] == ["WaitForMPVReady - checking"] * 3
+    assert [c.args[0] for c in mgr.logger.info.call_args_list] == [
+        "WaitForMPVReady - started",
+        "WaitForMPVReady - completed",
+    ]
+
+
+def test_wait_for_mpv_ready_parks_on_socket_creation(null_logger, monkeypatch, tmp_path):
+    sock = tmp_path / "socket"
+    mgr = MPVManager(logger=null_logger, socketio=None, upload_folder="/tmp", mpv_socket=str(sock))
+    monkeypatch.setattr(mgr, "get_property_light", lambda *_a, **_k: False if sock.exists() else None)
+    sleeps: List[float] = []
+    monkeypatch.setattr("dsign.services.mpv_management.time.sleep", sleeps.append)
+    waits: List[tuple] = []
+
+    def _fake_wait_for_path(path: str, timeout: float) -> bool:
+        waits.append((path, timeout))
+        sock.touch()  # mpv created its socket
+        return True
+
+    monkeypatch.setattr("dsign.services.mpv_management.wait_for_path", _fake_wait_for_path)
+
+    assert mgr.wait_for_mpv_ready(timeout=30, check_interval=1) is True
+    # One check_interval per wait, not the whole remaining budget.
+    assert waits == [(str(sock), 1.0)]
+    assert sleeps == []
+
+
+def test_check_health_reuses_healthy_result_until_invalidated(null_logger, monkeypatch):
+    mgr = StubMPVManager(null_logger, DummySession([]))
+    probes: List[str] = []
+    monkeypatch.setattr(mgr, "_check_mpv_socket", lambda *a, **k: probes.append("socket") or True)
+    monkeypatch.setattr(mgr, "_check_systemd_service", lambda: True)
+    monkeypatch.setattr(mgr, "get_property_light", lambda *a, **k: "mpv 0.38")
+
+    assert mgr.check_health()["responsive"] is True
+    assert mgr.check_health()["responsive"] is True
+    assert probes == ["socket"]
+
+    mgr._reset_ipc_session()
+    mgr.check_health()
+    assert probes == ["socket", "socket"]
+
+
+def test_check_health_skips_systemctl_when_socket_answers(null_logger, monkeypatch):
+    mgr = StubMPVManager(null_logger, DummySession([]))
+    monkeypatch.setattr(mgr, "_check_mpv_socket", lambda *a, **k: True)
+    systemctl = []
+    monkeypatch.setattr(mgr, "_check_systemd_service", lambda: systemctl.append(1) or False)
+    monkeypatch.setattr(mgr, "get_property_light", lambda *a, **k: "mpv 0.38")
+
+    assert mgr.check_health()["service_active"] is True
+    assert systemctl == []
+
+
+def test_check_health_does_not_cache_unhealthy(null_logger, monkeypatch):
+    mgr = StubMPVManager(null_logger, DummySession([]))
+    probes: List[str] = []
+    monkeypatch.setattr(mgr, "_check_mpv_socket", lambda *a, **k: probes.append("socket") or False)
+    monkeypatch.setattr(mgr, "_check_systemd_service", lambda: True)
+
+    assert mgr.check_health()["socket_available"] is False
+    assert mgr.check_health()["socket_available"] is False
+    assert probes == ["socket", "socket"]
+
+
+def test_systemd_check_reuses_answer_until_invalidated(null_logger, monkeypatch):
+    mgr = StubMPVManager(null_logger, DummySession([]))
+    calls: List[str] = []
+    monkeypatch.setattr(mgr, "_query_systemd_service", lambda: calls.append("systemctl") or False)
+
+    assert mgr._check_systemd_service() is False
+    assert mgr._check_systemd_service() is False
+    assert calls == ["systemctl"]
+
+    mgr.invalidate_health()
+    mgr._check_systemd_service()
+    assert calls == ["systemctl", "systemctl"]
+
+
+def test_check_mpv_socket_clamps_attempts_to_budget(null_logger, monkeypatch):
+    mgr = MPVManager(logger=null_logger, socketio=None, upload_folder="/tmp", mpv_socket="/nonexistent/mpv.sock")
+    connect_timeouts: List[float] = []
+
+    class _RefusingSession:
+        def is_connected(self) -> bool:
+            return False
+
+        def connect(self, *, timeout: float) -> None:
+            connect_timeouts.append(timeout)
+            raise FileNotFoundError
+
+    monkeypatch.setattr(mgr, "_get_ipc_session", lambda: _RefusingSession())
+    t0 = time.monotonic()
+    assert mgr._check_mpv_socket(timeout=0.3) is False
+    assert time.monotonic() - t0 < 0.6
+    assert connect_timeouts and all(t <= 0.3 for t in connect_timeouts)
+
+
+def test_cache_mpv_state_reads_properties_in_one_batch(null_logger, monkeypatch):
+    session = DummySession([{"data": True}, {"data": 70.0}, {"error": "property unavailable"}])
+    mgr = StubMPVManager(null_logger, session)
+    batches: List[int] = []
+    real_batch = session.commands_batch
+
+    def _counting_batch(items, *, timeout):
+        items = list(items)
+        batches.append(len(items))
+        return real_batch(items, timeout=timeout)
+
+    monkeypatch.setattr(session, "commands_batch", _counting_batch)
+    mgr._last_known_state["mute"] = False
+    mgr._cache_mpv_state()
+    assert batches == [3]
+    assert (mgr._last_known_state["pause"], mgr._last_known_state["volume"]) == (True, 70.0)
+    assert mgr._last_known_state["mute"] is False  # unavailable reply keeps the last value
+
+
+def test_socket_probe_warms_the_shared_ipc_connection(fake_mpv_socket, null_logger):
+    sock_path, server = fake_mpv_socket
+    server.set_handler(lambda msg: {"error": "success", "request_id": msg.get("request_id"), "data": True})
+    mgr = MPVManager(logger=null_logger, socketio=None, upload_folder="/tmp", mpv_socket=sock_path)
+    try:
+        assert mgr._check_mpv_socket(timeout=1.0) is True
+        sess = mgr._get_ipc_session()
+        assert sess.is_connected()
+        assert mgr.get_property_light("idle-active", timeout=2.0) is True
+        assert sess.connect_count == 1
+    finally:
+        mgr._get_ipc_session().close()
+
+
+def test_socket_probe_fails_fast_without_listener(tmp_path, null_logger):
+    mgr = MPVManager(logger=null_logger, socketio=None, upload_folder="/tmp", mpv_socket=str(tmp_path / "none.sock"))
+    try:
+        assert mgr._check_mpv_socket(timeout=0.3) is False
+        assert not mgr._get_ipc_session().is_connected()
+    finally:
+        mgr._get_ipc_session().close()
@@ -32,25 +32,15 @@ def test_network_loadfile_quiet_ipc_does_not_abort_play(null_logger, tmp_path):
     pm = PlaylistManager(null_logger, None, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
     runner = PlaybackPlayRunner(pm)
 
-    pf = MagicMock()
-    pf.file_name = "ext-9"
-    pf.order = 0
-    pf.duration = 0
-    pf.muted = False
-
-    playlist = MagicMock()
-    playlist.name = "net"
-    playlist.id = 7
-    playlist.files = [pf]
+    # (name, [(file_name, order, duration, muted)]) — what play() reads from the DB.
+    pm._playlist_play_rows = MagicMock(  # type: ignore[method-assign]
+        return_value=("net", [("ext-9", 0, 0, False)])
+    )
 
-    def _query(model):
+    def _query(*_entities):
         q = MagicMock()
-        name = getattr(model, "__name__", str(model))
-        if "PlaylistProfile" in name or "Assignment" in name:
-            q.filter_by.return_value.first.return_value = None
-            q.get.return_value = None
-        else:
-            q.get.return_value = playlist
+        q.filter_by.return_value.first.return_value = None
+        q.get.return_value = None
         return q
 
     pm.db_session.query.side_effect = _query
@@ -95,3 +95,16 @@ def test_enqueue_play_returns_immediately():
     assert entered["n"] == 1
     release["go"] = True
     time.sleep(0.05)
+
+
+def test_remote_calls_delegate_and_turn_errors_into_failure_dict(null_logger):
+    svc = PlaybackService.__new__(PlaybackService)
+    svc.logger = null_logger
+    svc._playlist_manager = MagicMock()
+    svc._playlist_manager.remote_seek.return_value = {"success": True}
+    svc._playlist_manager.remote_skip.side_effect = RuntimeError("no loop")
+
+    assert svc.remote_seek(12.5) == {"success": True}
+    svc._playlist_manager.remote_seek.assert_called_once_with(12.5)
+    assert svc.remote_skip(direction="prev") == {"success": False, "error": "no loop"}
+    svc._playlist_manager.remote_skip.assert_called_once_with(direction="prev")
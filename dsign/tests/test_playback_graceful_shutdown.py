@@ -73,3 +73,46 @@ def test_stop_play_thread_joins_with_custom_timeout(null_logger, tmp_path):
 
     assert pm._play_thread is None
     assert not thread.is_alive()
+
+
+def test_graceful_shutdown_cancels_queued_background_work(null_logger, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Event
+
+    svc = _make_shutdown_service(null_logger)
+    monkeypatch.setattr("dsign.extensions.db.session.remove", MagicMock())
+    svc._bg_pool = ThreadPoolExecutor(max_workers=1)
+    release = Event()
+    running = svc._bg_pool.submit(release.wait, 5.0)
+    queued = svc._bg_pool.submit(MagicMock())
+    try:
+        svc.graceful_shutdown()
+        assert queued.cancelled()
+    finally:
+        release.set()
+    assert running.result(timeout=5.0) is True
+
+
+def test_recovery_callbacks_reuse_pool_and_stop_after_shutdown(null_logger, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Event, current_thread
+
+    svc = _make_shutdown_service(null_logger)
+    monkeypatch.setattr("dsign.extensions.db.session.remove", MagicMock())
+    svc._recover_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pb-recover")
+    ran = Event()
+    names = []
+
+    def _resume():
+        names.append(current_thread().name)
+        ran.set()
+
+    svc._resume_slideshow_after_crash = _resume
+
+    svc._on_slideshow_thread_crash()
+    assert ran.wait(5.0)
+    assert names[0].startswith("pb-recover")
+
+    svc.graceful_shutdown()
+    svc._on_slideshow_thread_crash()  # must not raise once the pool is gone
+    assert len(names) == 1
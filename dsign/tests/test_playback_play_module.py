@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 from dsign.services.playback_play import PlaybackPlayRunner
@@ -27,11 +29,151 @@ def test_play_runner_missing_playlist_raises(null_logger, tmp_path):
     from dsign.services.playlist_management import PlaylistManager
 
     db = MagicMock()
-    db.query.return_value.get.return_value = None
     pm = PlaylistManager(null_logger, None, str(tmp_path), db, MagicMock(), MagicMock())
+    pm._playlist_play_rows = MagicMock(return_value=None)  # type: ignore[method-assign]
     runner = PlaybackPlayRunner(pm)
     try:
         runner.run(999)
         assert False, "expected RuntimeError"
     except RuntimeError as e:
         assert "Failed to start playback" in str(e)
+
+
+def test_playlist_play_rows_reads_columns_in_order(schedule_db, null_logger, tmp_path):
+    from dsign.models import PlaylistFiles
+    from dsign.services.playlist_management import PlaylistManager
+
+    _app, session, _user, playlist = schedule_db
+    session.add_all(
+        [
+            PlaylistFiles(playlist_id=playlist.id, file_name="b.mp4", order=2, duration=0, muted=True),
+            PlaylistFiles(playlist_id=playlist.id, file_name="a.jpg", order=1, duration=5),
+        ]
+    )
+    session.commit()
+    pm = PlaylistManager(null_logger, None, str(tmp_path), session, MagicMock(), MagicMock())
+
+    assert pm._playlist_play_rows(playlist.id) == (
+        "Pytest Playlist",
+        [("a.jpg", 1, 5, False), ("b.mp4", 2, 0, True)],
+    )
+    assert pm._playlist_play_rows(playlist.id + 100) is None
+
+    session.query(PlaylistFiles).delete()
+    session.commit()
+    assert pm._playlist_play_rows(playlist.id) == ("Pytest Playlist", [])
+
+
+def test_persist_playback_status_upserts_singleton_row(schedule_db, null_logger, tmp_path):
+    from dsign.models import PlaybackStatus
+    from dsign.services import playlist_management
+    from dsign.services.playlist_management import PlaylistManager
+
+    _app, session, _user, playlist = schedule_db
+    pm = PlaylistManager(null_logger, None, str(tmp_path), session, MagicMock(), MagicMock())
+
+    gen = playlist_management._status_generation
+    pm._persist_playback_status(playlist_id=playlist.id, status="playing", source="manual")
+    assert playlist_management._status_generation > gen
+    row = session.query(PlaybackStatus).one()
+    assert (row.id, row.playlist_id, row.status, row.source) == (1, playlist.id, "playing", "manual")
+
+    pm._persist_playback_status(playlist_id=None, status="stopped", clear_rule=True)
+    row = session.query(PlaybackStatus).one()
+    assert (row.playlist_id, row.status, row.source, row.rule_id) == (None, "stopped", "manual", None)
+
+
+def test_play_runner_applies_profile_settings_while_resolving_items(null_logger, tmp_path):
+    import threading
+
+    import pytest
+
+    from dsign.services.playlist_management import PlaylistManager
+
+    pm = PlaylistManager(null_logger, None, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+    pm._playlist_play_rows = MagicMock(return_value=("p", [("a.mp4", 1, 0, False)]))  # type: ignore[method-assign]
+    pm._assigned_profiles = MagicMock()
+    pm._assigned_profiles.get.return_value = {"settings": {"volume": 40}}
+    settings_started, resolving = threading.Event(), threading.Event()
+    seen = {}
+
+    def _update_settings(settings):
+        settings_started.set()
+        seen["overlapped"] = resolving.wait(2.0)
+        seen["settings"] = settings
+        return True
+
+    def _resolve(_file_name, **_kw):
+        settings_started.wait(2.0)
+        resolving.set()
+        return None
+
+    pm._mpv_manager.update_settings.side_effect = _update_settings
+    pm._resolve_playlist_item_path = MagicMock(side_effect=_resolve)  # type: ignore[method-assign]
+    pool = ThreadPoolExecutor(max_workers=1)
+    pm.set_settings_executor(pool)
+
+    try:
+        with pytest.raises(RuntimeError):
+            PlaybackPlayRunner(pm).run(1)
+    finally:
+        pool.shutdown(wait=True)
+    assert seen == {"overlapped": True, "settings": {"volume": 40, "panscan": 0.0}}
+
+
+def test_play_runner_joins_settings_batch_when_resolution_fails(null_logger, tmp_path):
+    import threading
+
+    import pytest
+
+    from dsign.services.playlist_management import PlaylistManager
+
+    pm = PlaylistManager(null_logger, None, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+    pm._playlist_play_rows = MagicMock(return_value=("p", [("a.mp4", 1, 0, False)]))  # type: ignore[method-assign]
+    pm._assigned_profiles = MagicMock()
+    pm._assigned_profiles.get.return_value = {"settings": {"volume": 40}}
+    settings_started, settings_done = threading.Event(), threading.Event()
+
+    def _update_settings(_settings):
+        settings_started.set()
+        time.sleep(0.2)
+        settings_done.set()
+        return True
+
+    def _resolve(_file_name, **_kw):
+        settings_started.wait(2.0)
+        raise OSError("media share gone")
+
+    pm._mpv_manager.update_settings.side_effect = _update_settings
+    pm._resolve_playlist_item_path = MagicMock(side_effect=_resolve)  # type: ignore[method-assign]
+    pool = ThreadPoolExecutor(max_workers=1)
+    pm.set_settings_executor(pool)
+
+    try:
+        with pytest.raises(RuntimeError):
+            PlaybackPlayRunner(pm).run(1)
+        # The batch finished before play() left for the failure path.
+        assert settings_done.is_set()
+    finally:
+        pool.shutdown(wait=True)
+
+
+def test_play_runner_settings_failure_does_not_mask_resolution_error(null_logger, tmp_path):
+    import pytest
+
+    from dsign.services.playlist_management import PlaylistManager
+
+    pm = PlaylistManager(null_logger, None, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+    pm._playlist_play_rows = MagicMock(return_value=("p", [("a.mp4", 1, 0, False)]))  # type: ignore[method-assign]
+    pm._assigned_profiles = MagicMock()
+    pm._assigned_profiles.get.return_value = {"settings": {"volume": 40}}
+    pm._mpv_manager.update_settings.side_effect = ConnectionError("mpv socket gone")
+    pm._resolve_playlist_item_path = MagicMock(side_effect=OSError("media share gone"))  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError, match="media share gone"):
+        PlaybackPlayRunner(pm).run(1)
+
+    # Resolution succeeded: the settings failure itself still fails play().
+    pm._resolve_playlist_item_path = MagicMock(return_value={"path": str(tmp_path / "a.mp4")})  # type: ignore[method-assign]
+    with pytest.raises(RuntimeError, match="mpv socket gone"):
+        PlaybackPlayRunner(pm).run(1)
@@ -291,3 +291,56 @@ def test_recover_after_mpv_restart_clears_stale_status_on_play_failure(null_logg
         source="idle",
         clear_rule=True,
     )
+
+
+def test_init_with_retry_stops_when_budget_cannot_fit_next_delay(null_logger, monkeypatch):
+    from dsign.services.playback_constants import PlaybackConstants
+    from dsign.services.playback_service import PlaybackDeadlineError
+
+    monkeypatch.setattr(PlaybackConstants, "is_wayland_backend", staticmethod(lambda: False))
+    svc = _make_recovery_service(null_logger)
+    svc._mpv_manager.wait_for_ipc_socket_at_startup.return_value = False
+    slept = []
+    monkeypatch.setattr("dsign.services.playback_service.time.sleep", slept.append)
+
+    with pytest.raises(PlaybackDeadlineError) as exc:
+        svc._init_with_retry(max_attempts=3, initial_delay=2.0, total_timeout=1.0)
+    assert isinstance(exc.value, RuntimeError)
+    assert slept == []
+    assert svc._mpv_manager.wait_for_ipc_socket_at_startup.call_count == 1
+
+
+def test_health_check_reads_props_in_one_batch(null_logger):
+    svc = _make_recovery_service(null_logger)
+    mgr = svc._mpv_manager
+    mgr._playback_session_active = True
+    mgr._check_mpv_socket.return_value = True
+    mgr.get_properties_snapshot.return_value = {
+        "vo-configured": False,
+        "pause": None,
+        "path": "/media/a.mp4",
+    }
+    svc._playlist_manager.get_network_playback_health.return_value = {}
+
+    checks = svc.health_check()
+
+    mgr.get_properties_snapshot.assert_called_once_with(["vo-configured", "pause", "path"], timeout=2.0)
+    mgr._send_commands.assert_not_called()
+    mgr.get_property_light.assert_not_called()
+    assert (checks["vo_configured"], checks["pause"], checks["path"]) == (False, None, "/media/a.mp4")
+
+    mgr.get_properties_snapshot.return_value = {}  # mpv unreachable
+    assert svc.health_check()["path"] is None
+
+
+def test_recover_after_restart_async_runs_on_recovery_pool(null_logger):
+    svc = _make_recovery_service(null_logger)
+    svc._recover_pool = MagicMock()
+    svc.recover_after_mpv_systemd_restart = MagicMock(side_effect=RuntimeError("boom"))
+
+    svc.recover_after_mpv_systemd_restart_async()
+
+    svc.recover_after_mpv_systemd_restart.assert_not_called()
+    (job,), _ = svc._recover_pool.submit.call_args
+    job()  # failures are logged, never raised into the pool
+    svc.recover_after_mpv_systemd_restart.assert_called_once_with()
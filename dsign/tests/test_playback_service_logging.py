@@ -0,0 +1,42 @@
+"""PlaybackService._log: one dispatch for the _log_* helpers, sanitized extra, disabled levels skipped."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from dsign.services.playback_service import PlaybackService
+
+
+def test_sanitize_extra_data_passes_clean_dict_through():
+    svc = PlaybackService.__new__(PlaybackService)
+    clean = {"service_module": "PlaybackService", "playlist_id": 3}
+    assert svc._sanitize_extra_data(clean) is clean
+    assert svc._sanitize_extra_data({"name": "x", "message": "y", "playlist_id": 3}) == {"playlist_id": 3}
+    assert svc._sanitize_extra_data({}) is None
+
+
+def test_log_helpers_share_one_dispatch():
+    svc = PlaybackService.__new__(PlaybackService)
+    svc.logger = MagicMock()
+    svc._log_info("started", extra={"action": "init"})
+    svc.logger.info.assert_called_once_with(
+        "started", extra={"service_module": "PlaybackService", "action": "init"}
+    )
+    svc._log_error("failed", extra={"name": "clash"})
+    svc.logger.error.assert_called_once_with(
+        "failed", extra={"service_module": "PlaybackService"}, exc_info=True
+    )
+    svc._log_debug("tick")
+    svc.logger.debug.assert_called_once_with("tick", extra={"service_module": "PlaybackService"})
+
+
+def test_log_skips_levels_the_logger_discards():
+    svc = PlaybackService.__new__(PlaybackService)
+    svc.logger = MagicMock()
+    svc.logger.isEnabledFor.side_effect = lambda level: level >= 30
+    svc._sanitize_extra_data = MagicMock(side_effect=lambda extra: extra)  # type: ignore[method-assign]
+    svc._log_info("quiet", extra={"action": "x"})
+    svc.logger.info.assert_not_called()
+    svc._sanitize_extra_data.assert_not_called()
+    svc._log_warning("loud")
+    svc.logger.warning.assert_called_once()
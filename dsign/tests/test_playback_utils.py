@@ -0,0 +1,21 @@
+"""PlaybackUtils helpers: JSON check and the atomic tmp playlist writer."""
+
+from __future__ import annotations
+
+from dsign.services.playback_utils import PlaybackUtils
+
+
+def test_validate_json():
+    assert PlaybackUtils.validate_json('{"event":"idle"}') is True
+    assert PlaybackUtils.validate_json('{"event":') is False
+
+
+def test_write_file_atomic_replaces_without_leftovers(tmp_path):
+    dest = tmp_path / "local-playlist-3.m3u"
+    dest.write_bytes(b"old")
+
+    PlaybackUtils.write_file_atomic(dest, b"#EXTM3U\n/media/a.mp4\n")
+
+    assert dest.read_bytes() == b"#EXTM3U\n/media/a.mp4\n"
+    assert dest.stat().st_mode & 0o777 == 0o644
+    assert [p.name for p in tmp_path.iterdir()] == [dest.name]
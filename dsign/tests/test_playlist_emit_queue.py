@@ -0,0 +1,133 @@
+"""playback_update emits are queued (callers never wait on socket.io fan-out) and per-item patches debounced."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from dsign.services import playlist_management
+from dsign.services.playlist_management import PlaylistManager
+
+
+def test_emit_returns_before_slow_socketio_and_keeps_order(null_logger, tmp_path):
+    release = threading.Event()
+    delivered = []
+
+    def slow_emit(event_name, payload):
+        release.wait(5.0)
+        delivered.append((event_name, payload["n"]))
+
+    socketio = MagicMock()
+    socketio.emit.side_effect = slow_emit
+    pm = PlaylistManager(null_logger, socketio, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+
+    t0 = time.monotonic()
+    for n in range(3):
+        pm._emit("playback_update", {"n": n})
+    assert time.monotonic() - t0 < 0.5
+
+    release.set()
+    deadline = time.monotonic() + 5.0
+    while len(delivered) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert delivered == [("playback_update", 0), ("playback_update", 1), ("playback_update", 2)]
+
+
+def test_emit_drops_when_queue_full(null_logger, tmp_path, monkeypatch):
+    monkeypatch.setattr(playlist_management, "_EMIT_QUEUE_MAX", 1)
+    release = threading.Event()
+    socketio = MagicMock()
+    socketio.emit.side_effect = lambda *_a, **_k: release.wait(5.0)
+    pm = PlaylistManager(null_logger, socketio, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+    try:
+        for n in range(5):
+            pm._emit("playback_update", {"n": n})
+        assert pm._emit_q.qsize() <= 1
+    finally:
+        release.set()
+
+
+def _wait_for(delivered, count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while len(delivered) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_scheduled_patches_coalesce_into_one_emit(null_logger, tmp_path):
+    delivered = []
+    socketio = MagicMock()
+    socketio.emit.side_effect = lambda event_name, payload: delivered.append((event_name, payload))
+    pm = PlaylistManager(null_logger, socketio, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+
+    pm._schedule_emit({"current_media": None, "playlist_id": 3})
+    pm._schedule_emit({"status": "playing", "playlist_id": 3, "current_media": "a.mp4"})
+    pm._schedule_emit({"status": "playing", "playlist_id": 3, "current_media": "b.mp4"})
+    _wait_for(delivered, 1)
+    time.sleep(playlist_management._STATUS_DEBOUNCE_SEC * 3)
+
+    assert delivered == [
+        ("playback_update", {"status": "playing", "playlist_id": 3, "current_media": "b.mp4"}),
+    ]
+
+
+def test_explicit_emit_absorbs_pending_patch(null_logger, tmp_path):
+    delivered = []
+    socketio = MagicMock()
+    socketio.emit.side_effect = lambda event_name, payload: delivered.append((event_name, payload))
+    pm = PlaylistManager(null_logger, socketio, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+
+    pm._schedule_emit({"status": "playing", "playlist_id": 3, "current_media": "a.mp4"})
+    pm._emit("playback_update", {"status": "stopped", "playlist_id": 3, "current_media": None})
+    _wait_for(delivered, 1)
+    time.sleep(playlist_management._STATUS_DEBOUNCE_SEC * 3)
+
+    # The stale "playing" patch never arrives after the stop.
+    assert delivered == [
+        ("playback_update", {"status": "stopped", "playlist_id": 3, "current_media": None}),
+    ]
+
+
+def test_settings_emit_fields_full_snapshot_then_delta(null_logger, tmp_path):
+    pm = PlaylistManager(null_logger, MagicMock(), str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+
+    first = pm._settings_emit_fields({"volume": 50, "mute": False})
+    assert first == {"settings": {"volume": 50, "mute": False}, "settings_version": 1}
+
+    second = pm._settings_emit_fields({"volume": 70, "mute": False})
+    assert second == {"settings_delta": {"volume": 70}, "settings_version": 2}
+
+    third = pm._settings_emit_fields({"volume": 70})
+    assert third == {"settings_delta": {}, "settings_version": 3, "settings_removed": ["mute"]}
+
+    # get_status / REST carry the full snapshot so a client that missed deltas can resync.
+    assert pm.settings_snapshot() == {"settings": {"volume": 70}, "settings_version": 3}
+
+
+def test_debounce_runs_on_emitter_thread_without_timers(null_logger, tmp_path):
+    delivered = []
+    socketio = MagicMock()
+    socketio.emit.side_effect = lambda event_name, payload: delivered.append((event_name, payload))
+    pm = PlaylistManager(null_logger, socketio, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+
+    for n in range(3):
+        pm._schedule_emit({"current_media": f"{n}.mp4"})
+        assert not [t for t in threading.enumerate() if isinstance(t, threading.Timer)]
+        _wait_for(delivered, n + 1)
+
+    assert [p["current_media"] for _e, p in delivered] == ["0.mp4", "1.mp4", "2.mp4"]
+
+
+def test_status_emit_drops_pending_patch_keys(null_logger, tmp_path):
+    delivered = []
+    socketio = MagicMock()
+    socketio.emit.side_effect = lambda event_name, payload: delivered.append((event_name, payload))
+    pm = PlaylistManager(null_logger, socketio, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+
+    pm._schedule_emit({"current_media": "a.mp4", "item_index": 2})
+    pm._emit("playback_update", {"status": "stopped", "playlist_id": None})
+    pm._flush_status()
+    _wait_for(delivered, 1)
+    time.sleep(playlist_management._STATUS_DEBOUNCE_SEC * 3)
+
+    assert delivered == [("playback_update", {"status": "stopped", "playlist_id": None})]
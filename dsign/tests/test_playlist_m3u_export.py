@@ -0,0 +1,100 @@
+"""M3U export: present files from one scan of MEDIA_ROOT; missing and ext- items skipped."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from flask import Flask
+
+from dsign.services.playlist_service import PlaylistService
+
+
+def test_generate_m3u_skips_missing_and_external_items(null_logger, tmp_path, monkeypatch):
+    media_root = tmp_path / "media"
+    media_root.mkdir()
+    (media_root / "a.jpg").write_bytes(b"x")
+    (media_root / "b.mp4").write_bytes(b"x")
+    export_dir = tmp_path / "m3u"
+    monkeypatch.setenv("DSIGN_M3U_EXPORT_FALLBACK_DIR", str(export_dir))
+
+    app = Flask(__name__)
+    app.config.update(
+        MEDIA_URL="/media/",
+        M3U_EXPORT_DIR=str(export_dir),
+        MEDIA_BASE_URL="http://sign.local",
+        MEDIA_ROOT=str(media_root),
+    )
+    files = [
+        SimpleNamespace(file_name="b.mp4", duration=0, order=2),
+        SimpleNamespace(file_name="a.jpg", duration=7, order=1),
+        SimpleNamespace(file_name="gone.png", duration=5, order=3),
+        SimpleNamespace(file_name="ext-12", duration=5, order=4),
+    ]
+    playlist = SimpleNamespace(id=1, name="Lobby", files=files)
+
+    with app.app_context():
+        assert PlaylistService(db_session=None, logger=null_logger)._generate_m3u_for_playlist(playlist) is True
+
+    assert (export_dir / "Lobby.m3u").read_text(encoding="utf-8") == (
+        "#EXTM3U\n"
+        "#EXTVLCOPT:run-time=7\n"
+        "http://sign.local/media/a.jpg\n"
+        "http://sign.local/media/b.mp4\n"
+    )
+
+
+def test_generate_m3u_keeps_unchanged_file(null_logger, tmp_path, monkeypatch):
+    media_root = tmp_path / "media"
+    media_root.mkdir()
+    (media_root / "a.jpg").write_bytes(b"x")
+    export_dir = tmp_path / "m3u"
+    monkeypatch.setenv("DSIGN_M3U_EXPORT_FALLBACK_DIR", str(export_dir))
+
+    app = Flask(__name__)
+    app.config.update(
+        MEDIA_URL="/media/",
+        M3U_EXPORT_DIR=str(export_dir),
+        MEDIA_BASE_URL="http://sign.local",
+        MEDIA_ROOT=str(media_root),
+    )
+    item = SimpleNamespace(file_name="a.jpg", duration=7, order=1)
+    playlist = SimpleNamespace(id=1, name="Lobby", files=[item])
+    svc = PlaylistService(db_session=None, logger=null_logger)
+
+    with app.app_context():
+        assert svc._generate_m3u_for_playlist(playlist) is True
+        inode = (export_dir / "Lobby.m3u").stat().st_ino
+        assert svc._generate_m3u_for_playlist(playlist) is True
+        assert (export_dir / "Lobby.m3u").stat().st_ino == inode
+
+        item.duration = 9
+        assert svc._generate_m3u_for_playlist(playlist) is True
+
+    assert "run-time=9" in (export_dir / "Lobby.m3u").read_text(encoding="utf-8")
+
+
+def test_generate_m3u_rename_removes_old_export(null_logger, tmp_path, monkeypatch):
+    media_root = tmp_path / "media"
+    media_root.mkdir()
+    (media_root / "a.jpg").write_bytes(b"x")
+    export_dir = tmp_path / "m3u"
+    monkeypatch.setenv("DSIGN_M3U_EXPORT_FALLBACK_DIR", str(export_dir))
+
+    app = Flask(__name__)
+    app.config.update(
+        MEDIA_URL="/media/",
+        M3U_EXPORT_DIR=str(export_dir),
+        MEDIA_BASE_URL="http://sign.local",
+        MEDIA_ROOT=str(media_root),
+    )
+    playlist = SimpleNamespace(id=1, name="Lobby", files=[SimpleNamespace(file_name="a.jpg", duration=0, order=1)])
+    svc = PlaylistService(db_session=None, logger=null_logger)
+
+    with app.app_context():
+        assert svc._generate_m3u_for_playlist(playlist) is True
+        playlist.name = "Hall"
+        assert svc._generate_m3u_for_playlist(playlist, old_name="Lobby") is True
+        # Old name already gone in every export dir: nothing to remove, no error.
+        assert svc._generate_m3u_for_playlist(playlist, old_name="Lobby") is True
+
+    assert sorted(p.name for p in export_dir.iterdir()) == ["Hall.m3u"]
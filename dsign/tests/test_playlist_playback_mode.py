@@ -76,6 +76,37 @@ def test_resolve_playlist_item_path_local_file(null_logger, tmp_path):
     assert resolved["is_video"] is True
 
 
+def test_upload_folder_names_rescans_only_after_dir_change(null_logger, tmp_path, monkeypatch):
+    import os
+
+    pm = _pm(null_logger, tmp_path)
+    (tmp_path / "clip.mp4").write_bytes(b"x")
+    names = pm._upload_folder_names()
+    assert "clip.mp4" in names and "tmp" not in names
+
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda p: scans.append(p) or real_scandir(p))
+    assert pm._upload_folder_names() is names
+    assert scans == []
+
+    (tmp_path / "new.jpg").write_bytes(b"x")
+    st = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert "new.jpg" in pm._upload_folder_names()
+    assert len(scans) == 1
+
+
+def test_resolve_playlist_item_path_trusts_present_snapshot(null_logger, tmp_path, monkeypatch):
+    import os
+
+    pm = _pm(null_logger, tmp_path)
+    (tmp_path / "clip.mp4").write_bytes(b"x")
+    present = pm._upload_folder_names()
+    monkeypatch.setattr(os.path, "exists", MagicMock(side_effect=AssertionError("stat")))
+    assert pm._resolve_playlist_item_path("clip.mp4", present=present)["is_video"] is True
+
+
 def test_resolve_playlist_item_path_uses_content_cache(null_logger, tmp_path):
     pm = _pm(null_logger, tmp_path)
     cache = MagicMock()
@@ -149,3 +180,74 @@ def test_refresh_item_playback_path_skips_local(null_logger, tmp_path):
     pm._resolve_playlist_item_path = MagicMock()
     assert pm._refresh_item_playback_path(item) is True
     pm._resolve_playlist_item_path.assert_not_called()
+
+
+def _local_items(tmp_path, names):
+    items = []
+    for name in names:
+        path = tmp_path / name
+        path.write_bytes(b"x")
+        items.append({"path": str(path), "is_video": True})
+    return items
+
+
+def test_load_local_video_playlist_appends_over_ipc(null_logger, tmp_path):
+    pm = _pm(null_logger, tmp_path)
+    items = _local_items(tmp_path, ["a.mp4", "b.mp4", "c.mp4"])
+    pm._validate_local_media_path = MagicMock(return_value=(True, "ok"))
+    pm._augment_per_file_audio_opts = MagicMock(return_value=None)
+    pm._safe_loadfile = MagicMock(return_value=True)
+    calls = []
+    pm._mpv_manager._send_commands.side_effect = lambda *_a, **_k: calls.append("append") or [
+        {"error": "success"},
+        {"error": "success"},
+    ]
+    pm._wait_loadfile_vo = MagicMock(side_effect=lambda *_a, **_k: calls.append("vo") or True)
+
+    assert pm._load_local_video_playlist(7, items, 1, media_key="local-m3u-7") is True
+
+    assert pm._safe_loadfile.call_args.args[0] == str((tmp_path / "b.mp4").resolve())
+    # Already validated by _local_video_playlist_paths; appends go out before the vo wait.
+    assert pm._safe_loadfile.call_args.kwargs["validated"] is True
+    assert pm._safe_loadfile.call_args.kwargs["wait_vo"] is False
+    assert calls == ["append", "vo"]
+    sent = pm._mpv_manager._send_commands.call_args.args[0]
+    assert [c["command"] for c in sent] == [
+        ["loadfile", str((tmp_path / "c.mp4").resolve()), "append"],
+        ["loadfile", str((tmp_path / "a.mp4").resolve()), "append"],
+    ]
+    assert not (pm.tmp_dir / "local-playlist-7.m3u").exists()
+
+
+def test_load_local_video_playlist_falls_back_to_m3u(null_logger, tmp_path):
+    pm = _pm(null_logger, tmp_path)
+    items = _local_items(tmp_path, ["a.mp4", "b.mp4"])
+    pm._validate_local_media_path = MagicMock(return_value=(True, "ok"))
+    pm._augment_per_file_audio_opts = MagicMock(return_value=None)
+    pm._safe_loadfile = MagicMock(return_value=True)
+    pm._mpv_manager._send_commands.return_value = [{"error": "error running command"}]
+
+    assert pm._load_local_video_playlist(8, items, 0, media_key="local-m3u-8") is True
+
+    m3u = pm.tmp_dir / "local-playlist-8.m3u"
+    assert pm._safe_loadfile.call_args.args[0] == str(m3u)
+    assert m3u.read_text(encoding="utf-8").splitlines()[1:] == [
+        str((tmp_path / "a.mp4").resolve()),
+        str((tmp_path / "b.mp4").resolve()),
+    ]
+
+
+def test_load_local_video_playlist_retries_busy_ipc_instead_of_reloading(null_logger, tmp_path):
+    pm = _pm(null_logger, tmp_path)
+    items = _local_items(tmp_path, ["a.mp4", "b.mp4"])
+    pm._validate_local_media_path = MagicMock(return_value=(True, "ok"))
+    pm._augment_per_file_audio_opts = MagicMock(return_value=None)
+    pm._safe_loadfile = MagicMock(return_value=True)
+    pm._wait_loadfile_vo = MagicMock(return_value=True)
+    pm._mpv_manager._send_commands.side_effect = [None, [{"error": "success"}]]
+
+    assert pm._load_local_video_playlist(9, items, 0, media_key="local-m3u-9") is True
+
+    assert pm._mpv_manager._send_commands.call_count == 2
+    pm._safe_loadfile.assert_called_once()
+    assert not (pm.tmp_dir / "local-playlist-9.m3u").exists()
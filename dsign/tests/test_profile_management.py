@@ -0,0 +1,131 @@
+"""Unit tests for ProfileManager reads and AssignedProfileCache invalidation."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from dsign.services.profile_management import AssignedProfileCache, ProfileManager
+
+
+def _make_profile(session, name="p1", settings=None):
+    from dsign.models import PlaybackProfile
+
+    profile = PlaybackProfile(name=name, profile_type="playlist", settings=settings or {"volume": 50})
+    session.add(profile)
+    session.commit()
+    return profile
+
+
+def test_cache_hit_skips_query(schedule_db):
+    from dsign.models import PlaylistProfileAssignment
+
+    _app, session, _user, playlist = schedule_db
+    profile = _make_profile(session)
+    session.add(PlaylistProfileAssignment(playlist_id=playlist.id, profile_id=profile.id))
+    session.commit()
+
+    cache = AssignedProfileCache()
+    first = cache.get(session, playlist.id)
+    assert first == {
+        "id": profile.id,
+        "name": "p1",
+        "type": "playlist",
+        "settings": {"volume": 50},
+        "created_at": profile.created_at,
+    }
+
+    calls = []
+
+    class _Counting:
+        def query(self, *a, **k):
+            calls.append(a)
+            return session.query(*a, **k)
+
+    assert cache.get(_Counting(), playlist.id) is first
+    assert calls == []
+
+
+def test_profile_and_assignment_writes_invalidate(schedule_db):
+    from dsign.models import PlaylistProfileAssignment
+
+    _app, session, _user, playlist = schedule_db
+    profile = _make_profile(session)
+    pm = ProfileManager(None, session, None)
+    assert pm.get_assigned_profile(playlist.id) is None
+
+    assert pm.assign_profile_to_playlist(playlist.id, profile.id)
+    assert pm.get_assigned_profile(playlist.id)["id"] == profile.id
+
+    assert pm.update_profile(profile.id, "renamed", {"volume": 10})
+    assert pm.get_assigned_profile(playlist.id)["settings"] == {"volume": 10}
+
+    # Bulk delete (as the unassign API does) bypasses mapper events.
+    session.query(PlaylistProfileAssignment).filter_by(playlist_id=playlist.id).delete()
+    session.commit()
+    assert pm.get_assigned_profile(playlist.id) is None
+
+
+def test_get_all_profiles_filters_by_type(schedule_db):
+    from dsign.models import PlaybackProfile
+
+    _app, session, _user, _playlist = schedule_db
+    _make_profile(session, name="a")
+    session.add(PlaybackProfile(name="idle", profile_type="idle", settings={}, created_at=1))
+    session.commit()
+
+    pm = ProfileManager(None, session, None)
+    assert {p["name"] for p in pm.get_all_profiles()} == {"a", "idle"}
+    only = pm.get_all_profiles("playlist")
+    assert [p["name"] for p in only] == ["a"]
+    assert only[0]["type"] == "playlist" and only[0]["settings"] == {"volume": 50}
+
+
+def test_apply_profile_sends_default_panscan_in_same_batch(schedule_db):
+    _app, session, _user, _playlist = schedule_db
+    profile = _make_profile(session, settings={"volume": 20})
+    mpv = MagicMock()
+    mpv.update_settings.return_value = True
+
+    assert ProfileManager(None, session, mpv).apply_profile(profile.id) is True
+    mpv.update_settings.assert_called_once_with({"panscan": 0.0, "volume": 20})
+    mpv._send_command.assert_not_called()
+
+
+def test_cache_drops_rows_read_between_flush_and_commit(tmp_path):
+    """A read in another session after a flush caches the old row; commit/rollback must evict it."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from dsign.extensions import db
+    from dsign.models import PlaybackProfile, Playlist, PlaylistProfileAssignment
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'profiles.db'}")
+    db.metadata.create_all(engine)
+    with Session(engine) as seed:
+        playlist = Playlist(name="p")
+        profile = PlaybackProfile(name="loud", profile_type="playlist", settings={"volume": 50})
+        seed.add_all([playlist, profile])
+        seed.flush()
+        seed.add(PlaylistProfileAssignment(playlist_id=playlist.id, profile_id=profile.id))
+        seed.commit()
+        playlist_id, profile_id = playlist.id, profile.id
+
+    cache = AssignedProfileCache()
+    writer = Session(engine)
+    writer.get(PlaybackProfile, profile_id).settings = {"volume": 10}
+    writer.flush()
+    with Session(engine) as reader:
+        assert cache.get(reader, playlist_id)["settings"] == {"volume": 50}
+    writer.commit()
+    with Session(engine) as reader:
+        assert cache.get(reader, playlist_id)["settings"] == {"volume": 10}
+
+    # Rolled back: the writer's own uncommitted read must not survive either.
+    writer.get(PlaybackProfile, profile_id).settings = {"volume": 99}
+    writer.flush()
+    assert cache.get(writer, playlist_id)["settings"] == {"volume": 99}
+    writer.rollback()
+    with Session(engine) as reader:
+        assert cache.get(reader, playlist_id)["settings"] == {"volume": 10}
+    writer.close()
+    engine.dispose()
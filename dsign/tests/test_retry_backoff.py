@@ -0,0 +1,27 @@
+"""Unit tests for jittered retry delays."""
+
+from __future__ import annotations
+
+from dsign.services import retry_backoff
+
+
+def test_full_jitter_bounded_by_exponential_and_cap():
+    for attempt, hi in ((0, 0.05), (1, 0.1), (3, 0.4), (20, 2.0)):
+        for _ in range(50):
+            d = retry_backoff.full_jitter(attempt, base=0.05, cap=2.0)
+            assert 0.0 <= d <= hi
+
+
+def test_equal_jitter_keeps_half_of_delay():
+    for _ in range(50):
+        assert 0.25 <= retry_backoff.equal_jitter(0.5) <= 0.5
+    assert retry_backoff.equal_jitter(-1.0) == 0.0
+
+
+def test_decorrelated_jitter_stays_within_base_and_cap(monkeypatch):
+    d = 2.0
+    for _ in range(50):
+        d = retry_backoff.decorrelated_jitter(d, base=2.0, cap=30.0)
+        assert 2.0 <= d <= 30.0
+    monkeypatch.setattr(retry_backoff.random, "uniform", lambda lo, hi: hi)
+    assert retry_backoff.decorrelated_jitter(4.0, base=2.0, cap=30.0) == 12.0
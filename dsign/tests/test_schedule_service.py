@@ -146,3 +146,20 @@ def test_add_exception_idempotent(schedule_db):
     assert row1.id == row2.id
     count = session.query(ScheduleException).filter_by(rule_id=rule.id).count()
     assert count == 1
+
+
+def test_find_next_rule_lists_rules_once(schedule_db, monkeypatch):
+    _app, session, _user, playlist = schedule_db
+    svc = ScheduleService(session)
+    now = datetime(2026, 7, 8, 12, 0, tzinfo=timezone.utc)  # Wednesday, after 09:00
+    rule = svc.create_rule(_weekly_rule_payload(playlist.id))
+    svc.create_rule(_weekly_rule_payload(playlist.id, start_time="07:00", end_time="08:00", enabled=False))
+
+    calls = []
+    list_rules = svc.list_rules
+    monkeypatch.setattr(svc, "list_rules", lambda: calls.append(1) or list_rules())
+
+    nxt = svc.find_next_rule(now)
+    assert nxt["rule"]["id"] == rule.id
+    assert nxt["date"] == "2026-07-09"
+    assert len(calls) == 1
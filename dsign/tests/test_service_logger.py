@@ -0,0 +1,46 @@
+"""ServiceLogger: traceback attached only while an exception is being handled."""
+
+from __future__ import annotations
+
+import json
+
+from dsign.services.logger import ServiceLogger
+
+
+def _capture(monkeypatch, tmp_path):
+    log = ServiceLogger("dsign-test-logger", log_dir=tmp_path)
+    lines = []
+    monkeypatch.setattr(log.logger, "error", lambda line: lines.append(json.loads(line)))
+    return log, lines
+
+
+def test_error_without_active_exception_has_no_traceback(monkeypatch, tmp_path):
+    log, lines = _capture(monkeypatch, tmp_path)
+    log.error("plain failure", exc_info=True, extra={"playlist_id": 1})
+    assert lines == [{"text": "plain failure", "playlist_id": 1}]
+
+
+def test_error_inside_except_attaches_traceback(monkeypatch, tmp_path):
+    log, lines = _capture(monkeypatch, tmp_path)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        log.error("handled failure", exc_info=True)
+    assert "ValueError: boom" in lines[0]["traceback"]
+
+
+def test_disabled_levels_skip_message_building(monkeypatch, tmp_path):
+    log = ServiceLogger("dsign-test-logger-level", log_level="WARNING", log_dir=tmp_path)
+    monkeypatch.delenv("DSIGN_LOG_LEVEL", raising=False)
+    log.logger.setLevel("WARNING")
+    built = []
+    monkeypatch.setattr(log, "_format_message", lambda msg, extra=None: built.append(msg) or "{}")
+    monkeypatch.setattr(log.logger, "warning", lambda line: None)
+
+    log.debug("tick", extra={"n": 1})
+    log.info("tock")
+    assert built == []
+    assert log.isEnabledFor(10) is False
+
+    log.warning("kept")
+    assert built == ["kept"]
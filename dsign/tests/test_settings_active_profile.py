@@ -0,0 +1,36 @@
+"""SettingsService.get_settings_for_active_profile: profile settings from the DB."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from flask import Flask
+
+
+def test_active_playlist_profile_settings_override_file_settings(tmp_path: Path):
+    from dsign.extensions import db
+    from dsign.models import PlaybackProfile, PlaybackStatus, Playlist, PlaylistProfileAssignment
+    from dsign.services.settings_service import SettingsService
+
+    app = Flask(__name__)
+    app.config.update(
+        TESTING=True,
+        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        pl = Playlist(name="p")
+        prof = PlaybackProfile(name="loud", profile_type="playlist", settings={"volume": 77})
+        db.session.add_all([pl, prof])
+        db.session.flush()
+        db.session.add(PlaylistProfileAssignment(playlist_id=pl.id, profile_id=prof.id))
+        db.session.add(PlaybackStatus(id=1, status="playing", playlist_id=pl.id))
+        db.session.commit()
+
+        svc = SettingsService(str(tmp_path / "settings.json"), str(tmp_path / "media"))
+        settings = svc.get_settings_for_active_profile()
+        assert settings["volume"] == 77
+        assert svc._last_logged_active_profile_key == f"playlist:{pl.id}:profile:{prof.id}"
+        db.session.remove()
@@ -28,6 +28,30 @@ def test_configure_sqlite_engine_options_uses_null_pool_for_file(tmp_path: Path)
         assert isinstance(db.engine.pool, NullPool)
 
 
+def test_configure_sqlite_engine_options_routes_json_columns_through_codec(tmp_path: Path):
+    from dsign.extensions import configure_sqlite_engine_options, db
+    from dsign.models import PlaybackProfile
+    from dsign.services import json_codec
+
+    app = Flask(__name__)
+    app.config.update(
+        TESTING=True,
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'json.db'}",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    configure_sqlite_engine_options(app)
+    opts = app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+    assert opts["json_deserializer"] is json_codec.loads
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        db.session.add(PlaybackProfile(name="p", profile_type="playlist", settings={"sub": "рус", "volume": 5}))
+        db.session.commit()
+        db.session.expire_all()
+        assert db.session.query(PlaybackProfile.settings).scalar() == {"sub": "рус", "volume": 5}
+        db.session.remove()
+
+
 def test_configure_sqlite_engine_options_skips_memory():
     from dsign.extensions import configure_sqlite_engine_options
 
@@ -209,16 +233,9 @@ def test_play_seq_abort_after_stop(null_logger, tmp_path, monkeypatch):
 
     pm._issue_loadfile = _issue  # type: ignore[method-assign]
 
-    playlist = MagicMock()
-    playlist.id = 1
-    playlist.name = "Net"
-    file_row = MagicMock()
-    file_row.file_name = "ext-1"
-    file_row.order = 0
-    file_row.duration = 0
-    file_row.muted = False
-    playlist.files = [file_row]
-    pm.db_session.query.return_value.get.return_value = playlist
+    pm._playlist_play_rows = MagicMock(  # type: ignore[method-assign]
+        return_value=("Net", [("ext-1", 0, 0, False)])
+    )
     pm.db_session.query.return_value.filter_by.return_value.first.return_value = None
 
     class _ImmediateThread:
@@ -284,17 +301,9 @@ def test_playback_play_releases_db_before_network_loadfile(null_logger, tmp_path
     pm._logo_manager.ensure_mpv_video_output = MagicMock()
     pm._run_manual_slideshow_loop = MagicMock()
 
-    playlist = MagicMock()
-    playlist.id = 1
-    playlist.name = "Net"
-    file_row = MagicMock()
-    file_row.file_name = "ext-1"
-    file_row.order = 0
-    file_row.duration = 0
-    file_row.muted = False
-    playlist.files = [file_row]
-
-    pm.db_session.query.return_value.get.return_value = playlist
+    pm._playlist_play_rows = MagicMock(  # type: ignore[method-assign]
+        return_value=("Net", [("ext-1", 0, 0, False)])
+    )
     pm.db_session.query.return_value.filter_by.return_value.first.return_value = None
 
     # Thread start should be immediate; avoid hanging.
@@ -49,7 +49,7 @@ def test_get_status_reports_stale_playing_as_idle(null_logger, tmp_path):
     row.previous_source = None
     row.previous_rule_id = None
     row.previous_playlist_id = None
-    pm.db_session.query.return_value.get.return_value = row
+    pm.db_session.execute.return_value.first.return_value = row
     pm._play_thread = None
     pm._play_start_mono = 0.0
     pm._mpv_manager._playback_session_active = False
@@ -74,6 +74,7 @@ def test_get_status_reports_stale_playing_as_idle(null_logger, tmp_path):
     assert st["source"] == "idle"
     assert st["playlist_id"] is None
     assert st["current_media"] is None
+    assert (st["settings"], st["settings_version"]) == ({}, 0)
 
 
 def test_get_status_not_stale_during_play_start_grace(null_logger, tmp_path):
@@ -88,7 +89,7 @@ def test_get_status_not_stale_during_play_start_grace(null_logger, tmp_path):
     row.previous_source = None
     row.previous_rule_id = None
     row.previous_playlist_id = None
-    pm.db_session.query.return_value.get.return_value = row
+    pm.db_session.execute.return_value.first.return_value = row
     pm._play_thread = None
     pm._play_start_mono = time.monotonic()
     pm._mpv_manager._playback_session_active = False
@@ -182,3 +183,97 @@ def test_play_error_superseded_skips_idle_wipe(null_logger, tmp_path):
     # Must not wipe winner via idle persist after superseded failure.
     for call in pm._persist_playback_status.call_args_list:
         assert call.kwargs.get("status") != "idle"
+
+
+def test_status_row_mirror_refreshes_after_any_write(null_logger, tmp_path, schedule_db):
+    from dsign.models import PlaybackStatus
+
+    _app, session, _user, playlist = schedule_db
+    session.add(PlaybackStatus(id=1, status="idle", source="idle"))
+    session.commit()
+    pm = PlaylistManager(null_logger, None, str(tmp_path), session, MagicMock(), MagicMock())
+
+    assert pm._playback_status_row()["status"] == "idle"
+    first = pm._playback_status_row()
+    assert pm._playback_status_row() is first
+
+    # Writer outside PlaylistManager (schedule/routes style).
+    row = session.get(PlaybackStatus, 1)
+    row.status = "playing"
+    row.playlist_id = playlist.id
+    session.commit()
+    st = pm._playback_status_row()
+    assert st["status"] == "playing"
+    assert st["playlist_id"] == playlist.id
+
+    session.query(PlaybackStatus).update({"status": "stopped"})
+    session.commit()
+    assert pm._playback_status_row()["status"] == "stopped"
+
+
+def test_status_row_prefers_singleton_id(null_logger, tmp_path, schedule_db):
+    from dsign.models import PlaybackStatus
+
+    _app, session, _user, _playlist = schedule_db
+    session.add(PlaybackStatus(id=2, status="stopped", source="manual"))
+    session.commit()
+    pm = PlaylistManager(null_logger, None, str(tmp_path), session, MagicMock(), MagicMock())
+
+    # Legacy DB without id=1: any existing row is used.
+    assert pm._playback_status_row()["status"] == "stopped"
+
+    session.add(PlaybackStatus(id=1, status="idle", source="idle"))
+    session.commit()
+    assert pm._playback_status_row() == {
+        "status": "idle",
+        "source": "idle",
+        "playlist_id": None,
+        "rule_id": None,
+        "previous_source": None,
+        "previous_rule_id": None,
+        "previous_playlist_id": None,
+    }
+
+
+def test_get_status_reads_mpv_props_in_one_batch(null_logger, tmp_path):
+    pm = PlaylistManager(null_logger, None, str(tmp_path), MagicMock(), MagicMock(), MagicMock())
+    row = MagicMock()
+    row.status = "playing"
+    row.playlist_id = 9
+    row.source = "manual"
+    row.rule_id = None
+    row.previous_source = None
+    row.previous_rule_id = None
+    row.previous_playlist_id = None
+    pm.db_session.execute.return_value.first.return_value = row
+    pm._play_thread = None
+    pm._play_start_mono = 0.0
+    pm._mpv_manager._playback_session_active = False
+    pm._mpv_manager._playback_stream_opening = False
+    pm._content_cache = None
+    pm._get_loop_position_snapshot = MagicMock(return_value=(None, 0))
+    pm._get_mpv_playback_snapshot = MagicMock(
+        return_value={"time_pos": None, "duration": None, "is_network": False, "mpv_responsive": True}
+    )
+    pm.get_network_playback_health = MagicMock(return_value={})
+    pm._get_current_media_label = MagicMock(return_value="clip.mp4")
+    pm._mpv_get_light = MagicMock(side_effect=AssertionError("per-property IPC read"))
+    pm._mpv_manager._send_commands.return_value = [
+        {"error": "success", "data": "inf"},
+        {"error": "success", "data": "no"},
+        {"error": "success", "data": "/media/clip.mp4"},
+        {"error": "success", "data": False},
+    ]
+
+    st = pm.get_status()
+    assert st["stale_playing"] is False
+    assert st["status"] == "playing"
+    pm._mpv_manager._send_commands.assert_called_once_with(
+        [
+            {"command": ["get_property", "loop-playlist"]},
+            {"command": ["get_property", "loop-file"]},
+            {"command": ["get_property", "path"]},
+            {"command": ["get_property", "idle-active"]},
+        ],
+        timeout=1.0,
+    )
@@ -12,6 +12,8 @@ from dsign.services.subprocess_limits import (
     AMIXER_TIMEOUT_SEC,
     APLAY_LIST_TIMEOUT_SEC,
     DISPLAY_APPLY_TIMEOUT_SEC,
+    read_spool_tail,
+    stderr_spool,
 )
 
 
@@ -137,3 +139,20 @@ def test_display_apply_handles_timeout(api_client, monkeypatch):
 
     assert rv.status_code == 504
     assert "Timed out" in (rv.get_json().get("error") or "")
+
+
+def test_stderr_spool_absorbs_output_larger_than_a_pipe():
+    import subprocess
+    import sys
+
+    spool = stderr_spool()
+    try:
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stderr.write('x' * 200000 + 'END')"],
+            stdout=subprocess.DEVNULL,
+            stderr=spool,
+        )
+        assert proc.wait(timeout=10) == 0
+        assert read_spool_tail(spool, 5) == "xxEND"
+    finally:
+        spool.close()
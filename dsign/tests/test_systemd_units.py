@@ -0,0 +1,45 @@
+"""Optional pystemd path for systemd unit state."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from dsign.services import systemd_units
+
+
+class _FakeUnit:
+    loads = 0
+
+    def __init__(self, name: bytes) -> None:
+        self.name = name
+        self.Unit = SimpleNamespace(ActiveState=b"active" if name == b"dsign-mpv.service" else b"failed")
+
+    def load(self) -> None:
+        _FakeUnit.loads += 1
+
+
+def test_unit_is_active_without_pystemd_defers_to_caller(monkeypatch):
+    monkeypatch.setattr(systemd_units, "_Unit", None)
+    assert systemd_units.unit_is_active("dsign-mpv.service") is None
+
+
+def test_unit_is_active_reads_active_state_and_reuses_unit(monkeypatch):
+    monkeypatch.setattr(systemd_units, "_Unit", _FakeUnit)
+    monkeypatch.setattr(systemd_units, "_units", {})
+    _FakeUnit.loads = 0
+
+    assert systemd_units.unit_is_active("dsign-mpv.service") is True
+    assert systemd_units.unit_is_active("dsign-mpv.service") is True
+    assert systemd_units.unit_is_active("labwc.service") is False
+    assert _FakeUnit.loads == 2
+
+
+def test_unit_is_active_bus_error_returns_none_and_retries(monkeypatch):
+    class _Broken(_FakeUnit):
+        def load(self) -> None:
+            raise OSError("access denied")
+
+    monkeypatch.setattr(systemd_units, "_Unit", _Broken)
+    monkeypatch.setattr(systemd_units, "_units", {})
+    assert systemd_units.unit_is_active("dsign-mpv.service") is None
+    assert systemd_units._units == {}
@@ -11,6 +11,7 @@ set -euo pipefail
 # It only installs:
 # - OS packages (mpv/ffmpeg/yt-dlp/nginx/etc.)
 # - Python virtualenv + pip requirements
+# - Optional speedups (setup.py extras "fast" and "systemd"; failures are not fatal)
 #
 # Usage:
 #   sudo ./scripts/install_deps.sh
@@ -46,6 +47,7 @@ install_apt() {
     python3 python3-venv python3-pip python3-dev \
     build-essential \
     sqlite3 libsqlite3-dev \
+    libsystemd-dev pkg-config \
     mpv ffmpeg yt-dlp \
     socat \
     nginx \
@@ -61,6 +63,7 @@ install_dnf() {
     python3 python3-devel python3-pip \
     gcc gcc-c++ make \
     sqlite sqlite-devel \
+    systemd-devel pkgconf-pkg-config \
     mpv ffmpeg yt-dlp \
     socat \
     nginx \
@@ -106,6 +109,17 @@ echo "Installing Python deps from: $REQ_FILE"
 "$DSIGN_VENV_DIR/bin/pip" install --upgrade pip wheel
 "$DSIGN_VENV_DIR/bin/pip" install -r "$REQ_FILE"
 
+# Optional, one pip call each so a failed pystemd build cannot skip orjson:
+# - orjson (extra "fast"): Socket.IO packets, mpv IPC lines and SQLite JSON columns;
+# - pystemd (extra "systemd"): unit state over D-Bus instead of `systemctl is-active`
+#   (builds against libsystemd-dev).
+# The app falls back to stdlib json / systemctl without them.
+for dep in "orjson>=3.9.0" "pystemd>=0.13.0"; do
+  echo "Installing optional speedup: $dep"
+  "$DSIGN_VENV_DIR/bin/pip" install "$dep" \
+    || echo "Optional $dep not installed; continuing with the stdlib fallback." >&2
+done
+
 echo ""
 echo "Done."
 echo "Venv: $DSIGN_VENV_DIR"
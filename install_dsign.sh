@@ -36,6 +36,7 @@ apt-get update
 BASE_PACKAGES=(
     python3-pip python3-venv python3-dev
     sqlite3 libsqlite3-dev
+    libsystemd-dev pkg-config
     mpv ffmpeg yt-dlp
     socat
     nginx git
@@ -75,6 +76,10 @@ sudo -u "$DSIGN_USER" python3 -m venv "$VENV_DIR"
 source "$VENV_DIR/bin/activate"
 pip install --upgrade pip wheel
 pip install -r "$PROJECT_DIR/requirements.txt"
+# Необязательное ускорение (extras "fast" и "systemd" в setup.py), отдельными командами:
+# ошибка сборки pystemd не должна оставить без orjson.
+pip install "orjson>=3.9.0" || echo "orjson не установлен; используется stdlib json"
+pip install "pystemd>=0.13.0" || echo "pystemd не установлен; используется systemctl"
 deactivate
 
 # Конфигурационный файл
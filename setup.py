@@ -22,6 +22,15 @@ setup(
         'Werkzeug>=3.0.1',
     ],
     extras_require={
+        # Optional speedups: picked up at import time when installed.
+        'fast': [
+            'orjson>=3.9.0',
+        ],
+        # Builds from source against libsystemd-dev; kept apart so a failed build
+        # cannot take orjson down with it.
+        'systemd': [
+            'pystemd>=0.13.0; sys_platform == "linux"',
+        ],
         'dev': [
             'pytest>=6.0.0',
             'pytest-cov>=2.0.0',